@@ -1,19 +1,138 @@
 document.addEventListener('DOMContentLoaded', function() {
   // Add search functionality
   const searchInput = document.getElementById('searchInput');
-  const birdEntries = document.querySelectorAll('.card');
-
-  searchInput.addEventListener('input', function() {
-    const query = searchInput.value.toLowerCase();
-    birdEntries.forEach(function(entry) {
-      const birdName = entry.querySelector('h3').textContent.toLowerCase();
-      if (birdName.includes(query)) {
-        entry.style.display = 'block';
+  const birdEntries = Array.prototype.slice.call(document.querySelectorAll('.card'));
+  const SEARCH_DELAY = 120;
+  let searchIndex = null;
+  let entryIds = null;
+  let timer = null;
+  let frame = null;
+  let shown = birdEntries.map(function() { return true; });
+
+  // Must match normalize() and words() in scripts/search_index.py
+  function normalize(text) {
+    return text.toLowerCase().normalize('NFKD')
+      .replace(/['’]/g, '')
+      .replace(/[\u0300-\u036f]/g, '')
+      .normalize('NFC');
+  }
+
+  function words(text) {
+    return normalize(text).split(/[\s\-–—(),./:;!?"]+/).filter(Boolean);
+  }
+
+  function intersect(a, b) {
+    return a.filter(function(item) { return b.has(item); });
+  }
+
+  // Indices of vocabulary words that start with or contain token
+  function matchingWords(token) {
+    const vocabulary = searchIndex.words;
+    const found = new Set();
+    let low = 0;
+    let high = vocabulary.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (vocabulary[mid] < token) {
+        low = mid + 1;
       } else {
-        entry.style.display = 'none';
+        high = mid;
+      }
+    }
+    for (let i = low; i < vocabulary.length && vocabulary[i].startsWith(token); i++) {
+      found.add(i);
+    }
+    if (token.length >= searchIndex.gram) {
+      let candidates = null;
+      for (let i = 0; i + searchIndex.gram <= token.length; i++) {
+        const posting = searchIndex.grams[token.slice(i, i + searchIndex.gram)] || [];
+        candidates = candidates === null ? posting : intersect(candidates, new Set(posting));
+        if (!candidates.length) {
+          break;
+        }
       }
+      candidates.forEach(function(i) {
+        if (vocabulary[i].includes(token)) {
+          found.add(i);
+        }
+      });
+    }
+    return found;
+  }
+
+  // Set of entry numbers matching every word of the query
+  function lookup(query) {
+    let result = null;
+    words(query).forEach(function(token) {
+      const entries = new Set();
+      matchingWords(token).forEach(function(i) {
+        searchIndex.postings[i].forEach(function(entry) { entries.add(entry); });
+      });
+      result = result === null ? entries : new Set(intersect(Array.from(result), entries));
     });
-  });
+    return result;
+  }
+
+  function visibility(query) {
+    if (!query.trim()) {
+      return birdEntries.map(function() { return true; });
+    }
+    const matches = entryIds ? lookup(query) : null;
+    if (matches) {
+      return entryIds.map(function(entry) { return entry !== undefined && matches.has(entry); });
+    }
+    // Pages without entry ids fall back to matching the heading text
+    const needle = normalize(query);
+    return birdEntries.map(function(entry) {
+      return normalize(entry.querySelector('h3').textContent).includes(needle);
+    });
+  }
+
+  // Apply all changes in one frame, touching only the cards whose state changed
+  function render(next) {
+    if (frame) {
+      cancelAnimationFrame(frame);
+    }
+    frame = requestAnimationFrame(function() {
+      frame = null;
+      next.forEach(function(visible, i) {
+        if (visible !== shown[i]) {
+          birdEntries[i].style.display = visible ? '' : 'none';
+        }
+      });
+      shown = next;
+    });
+  }
+
+  function loadIndex() {
+    const script = document.createElement('script');
+    script.src = 'search-index.js';
+    script.onload = function() {
+      searchIndex = window.SEARCH_INDEX;
+      if (!searchIndex || searchIndex.version !== 1) {
+        searchIndex = null;
+        return;
+      }
+      const numbers = new Map(searchIndex.ids.map(function(id, i) { return [id, i]; }));
+      if (birdEntries.some(function(entry) { return numbers.has(entry.id); })) {
+        entryIds = birdEntries.map(function(entry) { return numbers.get(entry.id); });
+      }
+      if (searchInput.value) {
+        render(visibility(searchInput.value));
+      }
+    };
+    document.head.appendChild(script);
+  }
+
+  if (searchInput) {
+    loadIndex();
+    searchInput.addEventListener('input', function() {
+      clearTimeout(timer);
+      timer = setTimeout(function() {
+        render(visibility(searchInput.value));
+      }, SEARCH_DELAY);
+    });
+  }
 
   // Add collapsible sections
   const collapsibleHeaders = document.querySelectorAll('.collapsible');
@@ -27,4 +146,4 @@ document.addEventListener('DOMContentLoaded', function() {
       }
     });
   });
-});
\ No newline at end of file
+});
@@ -0,0 +1 @@
+window.SEARCH_INDEX = {"version":1,"gram":3,"ids":["black-kite","red-naped-ibis","peregrine-falcon","shikra","white-breasted-waterhen","indian-pond-heron","black-crowned-night-heron","cattle-egret","little-egret","blue-rock-pigeon","spotted-dove","little-brown-dove","red-wattled-lapwing","asian-koel","grey-bellied-cuckoo","common-hawk-cuckoo","greater-coucal","rose-ringed-parakeet","alexandrine-parakeet","plum-headed-parakeet","house-swift","asian-palm-swift","white-breasted-kingfisher","common-kingfisher","asian-green-bee-eater","coppersmith-barbet","dusky-crag-martin","barn-swallow","red-rumped-swallow","wire-tailed-swallow","long-tailed-shrike","golden-oriole","black-drongo","ashy-drongo","common-myna","jungle-myna","brahminy-starling","oriental-magpie-robin","spot-breasted-fantail","pied-bushchat","red-vented-bulbul","red-whiskered-bulbul","large-grey-babbler","tickells-blue-flycatcher","ashy-prinia","jungle-prinia","common-tailorbird","lesser-whitethroat","house-sparrow","baya-weaver","indian-robin","oriental-white-eye","scaly-breasted-munia","rufous-treepie","house-crow","large-billed-crow","spotted-owlet","mottled-wood-owl","indian-grey-hornbill","indian-roller","black-headed-cuckoo-shrike","small-minivet","tickells-flowerpecker","grey-wagtail","white-wagtail","white-browed-wagtail","common-iora","asian-tit","purple-sunbird","purple-rumped-sunbird"],"words":["accipiter","acridotheres","aegithina","affinis","african","alba","albogularis","alcedo","alexandrine","alexandrinus","amaurornis","apus","ardeola","argya","ashy","asian","asiaticus","athene","atthis","babbler","backed","badius","balasiensis","banded","barbet","barn","baya","bee","bellied","benghalensis","billed","bird","birostris","black","blue","brahminy","brain","brainfever","brama","breasted","browed","brown","bubulcus","buff","bulbul","bushchat","cacomantis","cafer","caprata","cattle","cecropis","centropus","ceylon","chinensis","cinerea","cinereous","cinereus","cinnamomeus","cinnyris","columba","common","concolor","coppersmith","copsychus","coracias","coracina","corvus","coucal","crag","crow","crowned","cuckoo","curruca","cyanocephala","cyornis","cypsiurus","daurica","dendrocitta","dicaeum","dicrurus","did","do","domesticus","dove","drongo","duck","dusky","dyal","eater","egret","egretta","erythrorhynchos","eudynamys","eupatria","eurasian","european","eye","falco","falcon","fantail","fever","flowerpecker","flycatcher","forest","fulicatus","fuscus","garzetta","golden","goshawk","gray","grayii","great","greater","green","grey","haemacephala","haemacephalus","halcyon","hawk","he","headed","hen","heron","hierococcyx","hirundo","honeysucker","hornbill","house","ibis","indian","indicus","iora","it","jay","jocosus","jungle","king","kingfisher","kite","koel","krameri","lanius","lapwing","large","laughing","leptocoma","lesser","leucophaeus","little","livia","lonchura","long","macrocercus","macrorhynchos","maderaspatensis","magpie","malcolmi","malcolms","marshalls","martin","megalaima","melanoptera","merops","migrans","milvus","minivet","motacilla","mottled","mountain","munia","muscicapa","myna","mynah","naped","necked","night","northern","nycticorax","ocellata","ocyceros","oriental","orientalis","oriole","oriolus","orthotomus","owl","owlet","paddybird","pagoda","pagodarum","palm","palpebrosus","papillosa","parakeet","pariah","parus","passer","passerinus","pearl","peregrinator","peregrine","peregrinus","pericrocotus","pheasant","philippinus","phoenicurus","pie","pied","pigeon","plaintive","ploceus","plum","pond","prinia","pseudibis","psilopogon","psittacula","ptyonoprogne","punctulata","purple","pycnonotus","red","rhipidura","ring","ringed","river","robin","rock","roller","rose","rufous","rumped","rustica","saularis","saxicola","saxicoloides","scaly","schach","scolopacea","scolopaceus","senegal","senegalensis","shikra","shrike","siberian","sinensis","small","smithii","smyrna","smyrnensis","socialis","sparrow","spilopelia","splendens","spot","spotted","starling","streptopelia","strix","sturnia","sunbird","sutorius","swallow","swift","sylvatica","sylvia","tailed","tailorbird","throated","tickelliae","tickells","tiphia","tit","tree","treepie","tristis","turdoides","vagabunda","vanellus","varius","vented","wagtail","water","waterhen","wattled","weaver","whiskered","white","whitethroat","wire","wood","yellow","zapornia","zeylonica","zosterops","कंठाची","कडा","करडा","करण","कवडी","कवड्या","कारुण्य","काळा","काळ्या","कावळा","कोकीळ","कोतवाल","खाटिक","खाटीक","गप्पीदास","गवती","गोमेट","घर","घार","घुबड","चरक","चष्मेवाला","चिमणी","छातीचा","छातीची","छोटा","जंगली","जांभळा","जांभळ्या","टकाचोर","टिकेलचा","टिकेलची","टिटवी","टोई","ठिपकेवाला","ठिपकेवाली","ठिपकेवाले","डोक्याचा","डोमकावळा","ढोकरी","तपकिरी","तांबट","ताड","तारबाली","दयाळ","धनेश","धीवर","धूसर","धोबी","नाचण","निळी","नीलपंख","पंकोळी","पांढरा","पांढऱ्या","पाकोळी","पाणकोंबडी","पारवा","पावश्या","पिंगळा","पुठ्ठ्याचा","पुठ्ठ्याची","पोपट","फुलटोचा","बगळा","बहिरी","बुड्या","बुलबुल","भांगपाडी","भारतीय","भारद्वाज","भिंगरी","भुबईचा","मनोली","माळ","माशीमार","मैना","राखी","राघू","राजपोपट","रात्र","रान","रामगंगा","लांब","लाल","वटवट्या","वन","वेडा","शराटी","शिंजीर","शिंपी","शिक्रा","शिपाई","शुभ्रकंठी","शेपटीचा","ससाणा","सातभाई","सामान्य","साळुंकी","सुगरण","सुभग","हळद्या","होला"],"postings":[[3],[34,35],[66],[20],[39],[64],[38],[23],[18],[18],[4],[20],[5],[42],[33,44],[13,20,21,24,67],[68],[56],[23],[42],[7],[3],[21],[3],[25],[27],[49],[24],[14],[59],[55],[12,15,37],[58],[0,1,6,32,50,60],[9,43,59],[36],[15],[15],[56],[4,22,38,52],[65],[11],[7],[7],[40,41],[39],[14],[40],[39],[7],[28],[16],[69],[10],[63],[67],[67],[61],[68],[9],[4,9,13,15,16,23,34,39,40,46,47,54,58,66],[26],[25],[37,50],[59],[60],[54,55],[16],[26],[16,32,54,55],[6],[14,15,60],[47],[19],[43],[21],[28],[53],[62],[32,33],[12],[12],[48],[9,10,11],[32,33],[2],[26,35],[37],[24],[7,8],[8],[62],[13],[18],[23],[59,64],[51],[2],[2],[38],[15],[62],[43],[57],[50],[35],[8],[31],[3],[14,42,58,63],[5],[2],[16],[24],[14,42,58,63,67],[25],[25],[22],[2,15],[12],[19,60],[4],[5,6,7],[15],[26,27,28,29],[68],[58],[20,48,54],[1,7],[1,5,34,35,46,48,50,53,54,55,57,58,59,65,67],[12],[66],[12],[59],[41],[35,45,55],[32],[22,23],[0],[13],[17],[30],[12],[42,55,65],[11],[69],[47],[33],[3,8,11,20,24],[9],[52],[30,46],[32],[55],[65],[37],[42],[42],[66],[26],[25],[60],[24],[0],[0],[61],[63,64,65],[57],[63],[52],[43],[34,35,36],[34],[1,66],[10,17],[6],[59],[6],[57],[58],[37,51],[24],[31],[31],[46],[57],[56,57],[5],[36],[36],[11,21],[51],[1],[17,18,19],[0],[67],[48],[14],[10],[2],[2],[2],[61],[16],[49],[4],[53],[39,64,65],[9],[14],[49],[19],[5],[44,45],[1],[25],[17,18,19],[26],[52],[68,69],[40,41],[1,12,28,40,41],[38],[17],[17],[23],[37,50],[9],[59],[17],[53],[28,69],[27],[37],[39],[50],[52],[30],[13],[13],[11],[11],[3],[30,60],[47],[16],[24,61],[29],[22],[22],[44],[48],[10,11],[54],[38],[10,38,56,57],[36],[10,11],[57],[36],[68,69],[46],[27,28,29],[20,21],[45],[47],[29,30,46],[46],[22,38],[43],[43,62],[66],[67],[53],[53],[34],[42],[53],[12],[15],[40],[63,64,65],[4],[4],[12],[49],[41],[4,22,38,51,64,65],[47],[29],[57],[66],[4],[69],[51],[38],[26],[63],[18],[67],[39],[14],[1],[60],[54],[13,14,60],[32,33],[60],[30],[39],[7],[61],[20],[0],[57],[50],[51],[48],[22],[4],[8,11,47,61],[35],[68],[69],[53],[62],[43],[12],[19],[10],[52],[57],[60],[55],[5,6],[11],[25],[21],[29],[37],[58],[22,23],[26],[63,64,65],[38],[43],[59],[26],[64],[4,22,38,65],[20,21],[4],[9],[15],[56],[69],[28],[18,19],[62],[7,8],[2],[40],[40,41],[36],[58,59],[16],[27,28,29],[65],[52],[27],[43],[35,36],[33,42,44,58],[24],[17],[6],[45],[67],[30],[28,40],[44,45,47],[57],[24],[1],[68,69],[46],[3],[41],[47],[30],[2],[42],[23],[34],[49],[66],[31],[10,11]],"grams":{"abb":[19],"abu":[277],"acc":[0],"ace":[115,116,238,239],"ach":[237],"aci":[64,65,166],"ack":[20,33],"aco":[46],"acr":[1,152,153],"acu":[216],"add":[187],"ade":[120,154],"adi":[21],"aeg":[2],"aem":[115,116],"aeu":[78,147],"afe":[47],"aff":[3],"afr":[4],"aga":[277],"ago":[188,189],"agp":[155],"agt":[281],"ahm":[35],"ail":[99,266,267,281],"aim":[160],"ain":[36,37,168,209],"ake":[193],"ala":[22,73,115,160],"alb":[5,6],"alc":[7,97,98,117,156,157],"ale":[8,9,29,241],"ali":[181,250],"all":[158,246,262],"alm":[190],"alp":[191],"alu":[116],"aly":[236],"ama":[10,38],"ame":[140],"amo":[57],"amy":[92],"and":[8,9,23],"ane":[278],"ani":[141],"ano":[73,161],"ans":[163],"ant":[46,99,203],"apa":[170],"ape":[173],"api":[192],"apo":[292],"apr":[48],"apu":[11],"apw":[142],"ara":[193],"arb":[24],"ard":[12],"arg":[13,143],"ari":[6,194,233,279],"arl":[198,256],"arn":[25],"arr":[251],"ars":[158],"art":[159],"aru":[189,195],"arz":[106],"asa":[203],"ash":[14],"asi":[15,16,22,94],"asp":[154],"ass":[196,197],"ast":[39],"ata":[48,178,218],"atc":[102],"ate":[88,112,154,268,282,283],"ath":[17],"ati":[16,264],"ato":[199],"atr":[93],"att":[18,49,284],"atu":[104],"aug":[144],"aul":[233],"aur":[10,76],"ave":[285],"awk":[108,118],"axi":[234,235],"aya":[26],"ayi":[110],"bab":[19],"bac":[20],"bad":[21],"bal":[22],"ban":[23],"bar":[24,25],"bay":[26],"bbl":[19],"bee":[27],"bel":[28],"ben":[29],"ber":[244],"bet":[24],"bil":[30,126],"bin":[226],"bir":[31,32,187,260,267],"bis":[128,214],"bla":[33],"ble":[19],"blu":[34],"bog":[6],"bra":[35,36,37,38],"bre":[39],"bro":[40,41,191],"bub":[42],"buf":[43],"bul":[42,44],"bun":[277],"bus":[45],"cac":[46],"cae":[78],"caf":[47],"cal":[67,236],"can":[4],"cap":[48,170],"cat":[49,102,104],"cci":[0],"ccy":[123],"cea":[238],"cec":[50],"ced":[7],"cel":[178],"cen":[51],"cep":[73,115,116],"cer":[152,179],"ceu":[210,239],"cey":[52],"cha":[45,237],"che":[102],"chi":[53],"cho":[91,153],"chu":[63,150],"cia":[64,250],"cic":[170],"cil":[166],"cin":[54,55,56,57,58,65],"cip":[0],"cit":[77],"cke":[20,101,125,174,269,270],"cko":[71],"cno":[220],"coc":[123],"col":[59,61,156,157,234,235,238,239],"com":[46,60,145],"con":[61,98],"cop":[62,63,147],"cor":[64,65,66,177],"cos":[134],"cot":[202],"cou":[67],"cra":[68],"cri":[1],"cro":[50,69,70,152,153,202],"cru":[79],"cti":[177],"ctu":[218],"cuc":[71],"cul":[216],"cur":[72,205],"cus":[16,42,82,105,130,152],"cya":[73],"cyc":[179],"cyo":[74,117],"cyp":[75],"cyx":[123],"dar":[189],"dau":[76],"ddy":[187],"ded":[23,120],"den":[77,107,253],"deo":[12],"der":[154],"des":[235,276],"dia":[129],"dib":[214],"dic":[78,79,130],"did":[80],"diu":[21],"doi":[276],"dom":[82],"dot":[1],"dov":[83],"dri":[8,9],"dro":[77,84],"duc":[85],"dur":[222],"dus":[86],"dya":[87],"dyb":[187],"dyn":[92],"ead":[120],"ean":[95],"ear":[198],"eas":[39,203],"eat":[88,111,112],"eav":[285],"ebr":[191],"eck":[101,174],"ecr":[50],"edo":[7],"een":[113],"eep":[274],"eet":[193],"ega":[160,240,241],"egi":[2],"egr":[89,90,199,200,201],"ela":[161],"eli":[252,257],"ell":[28,178,269,270,278,291],"ema":[115,116],"end":[77,253],"ene":[17,240,241],"eng":[29],"eni":[205],"ens":[22,29,53,154,241,245,249,253],"ent":[51,180,181,280],"eol":[12],"eon":[208],"eou":[55],"eph":[73,115,116],"epi":[274],"ept":[145,257],"era":[154,161],"erc":[152],"ere":[1,54,55,56,199,200,201,286],"erh":[283],"eri":[140,197,202,244],"ern":[176],"ero":[122,123,162,179,294],"erp":[101],"ers":[62],"ery":[91],"ess":[146],"est":[82,103],"eth":[288],"ett":[90,106],"euc":[147],"eud":[92,214],"eum":[78],"eup":[93],"eur":[94,95],"eus":[56,57,147,210,239],"eve":[37,100],"exa":[8,9],"eye":[96],"eyl":[52,293],"eys":[125],"fal":[97,98],"fan":[99],"fer":[47],"fev":[37,100],"ffi":[3],"fin":[3],"fis":[137],"flo":[101],"fly":[102],"for":[103],"fou":[230],"fri":[4],"ful":[104],"fus":[105],"gab":[277],"gal":[160,240,241],"gar":[106],"ged":[224],"geo":[208],"gfi":[137],"gha":[29],"ghi":[144],"ght":[175],"git":[2],"gle":[135],"gne":[217],"god":[188,189],"gol":[107],"gon":[215],"gos":[108],"gpi":[155],"gra":[109,110,163],"gre":[89,90,111,112,113,114],"gri":[199,200,201],"gta":[281],"gul":[6],"gya":[13],"hac":[237],"hae":[115,116,147],"hal":[29,73,115,116,117,158],"hat":[45],"haw":[108,118],"hch":[45],"hea":[120,203],"hen":[17,121,283],"her":[1,102,122,137,176],"hia":[271],"hie":[123],"hii":[247],"hik":[242],"hil":[204],"hin":[2,53,144],"hip":[222],"hir":[124],"his":[18,286],"hit":[287,288],"hmi":[35],"hoe":[205],"hon":[125],"hor":[126],"hos":[91,153],"hot":[184],"hou":[127],"hri":[243],"hro":[91,268,288],"hur":[150],"hus":[63],"hyn":[91,153],"iae":[269],"iah":[194],"ial":[250],"ian":[15,94,129,244],"ias":[64],"iat":[16],"ibe":[244],"ibi":[128,214],"ica":[4,76,78,104,170,232,264,293],"ick":[269,270],"ico":[177,234,235],"icr":[79,202],"icu":[16,82,130,205],"ide":[235,276],"ido":[1],"idu":[222],"ied":[28,207],"ien":[22,180,181],"ier":[123],"ift":[263],"ige":[208],"igh":[175],"igr":[163],"ike":[243],"ikr":[242],"ile":[266],"ili":[204],"ill":[30,126,166,192],"ilo":[215,252,267],"ilv":[164],"ima":[160],"ina":[2,65,199],"ind":[129,130],"ine":[8,53,54,55,56,200,245],"inf":[37],"ing":[136,137,142,144,223,224,256],"ini":[3,165,213],"inn":[57,58],"int":[209],"inu":[9,197,201,204],"iny":[35],"iol":[182,183],"ior":[131],"iph":[271],"ipi":[0,222],"ipp":[204],"ird":[31,187,260,267],"ire":[289],"iro":[32],"iru":[124],"ish":[137],"isk":[286],"ist":[275],"ite":[0,138,287,288],"ith":[2,62,247],"itt":[77,148,216],"iur":[75],"ius":[21,141,261,279],"ive":[165,209,225],"ivi":[149],"jay":[133],"joc":[134],"jun":[135],"ked":[20,174],"kee":[193],"kel":[269,270],"ker":[101,125,286],"kin":[136,137],"kit":[138],"koe":[139],"koo":[71],"kra":[140,242],"lac":[33],"lai":[160,209],"lan":[141,161],"lap":[142],"lar":[6,143,233],"las":[22],"lat":[178,218],"lau":[144],"lba":[5],"lbo":[6],"lbu":[44],"lce":[7],"lco":[97,98,156,157],"lcu":[42],"lcy":[117],"lde":[107],"led":[30,167,266,284],"len":[29,241,253],"lep":[145],"ler":[19,228],"les":[146],"let":[186],"leu":[147],"lex":[8,9],"lia":[252,257,269],"lic":[104],"lie":[28],"lin":[256],"lip":[204],"lis":[181,250],"lit":[148],"liv":[149],"lla":[166,178],"lle":[30,228],"lli":[28,269],"llo":[192,262,291],"lls":[158,270],"llu":[278],"lmi":[156],"lms":[157],"loc":[210],"loi":[235],"lon":[52,150,151,293],"lop":[215,238,239,252],"lor":[61,267],"los":[192],"low":[101,262,291],"lpe":[191],"lue":[34],"lum":[59,211],"lus":[116,183,278],"lva":[264],"lvi":[265],"lvu":[164],"lyc":[102],"mac":[115,116,152,153],"mad":[154],"mag":[155],"mal":[156,157,246],"man":[46],"mar":[158,159],"mau":[10],"mba":[59],"meg":[160],"mel":[161],"mer":[140,162],"mes":[82],"meu":[57],"mig":[163],"mil":[164],"min":[35,165],"mit":[62,247],"mmo":[60],"mom":[57],"mon":[60],"mot":[166,167],"mou":[168],"mpe":[231],"mun":[169],"mus":[170,184],"myn":[171,172],"myr":[248,249],"mys":[92],"nah":[172],"nam":[57,92],"nap":[173],"nat":[199],"nbi":[126,260],"nch":[91,150,153],"nco":[61],"nct":[218],"nda":[277],"nde":[23,253],"ndi":[129,130],"ndo":[124],"ndr":[8,9,77],"nec":[174],"ned":[70],"neg":[240,241],"nel":[278],"nen":[53,245,249],"ner":[54,55,56],"ney":[125],"nfe":[37],"nge":[224],"ngf":[137],"ngh":[29],"ngl":[135],"ngo":[84],"nia":[169,213,259,292],"nic":[205,293],"nig":[175],"nis":[3,10,74],"niu":[141],"niv":[165],"nna":[57],"nny":[58],"noc":[73],"non":[220],"nop":[161,217],"nor":[176],"not":[220],"nsi":[22,29,53,154,241,245,249],"nta":[99,168,180,181],"nte":[280],"nti":[46,209],"ntr":[51],"nus":[9,197,201,204],"nyc":[177],"nyr":[58],"oat":[268,288],"obi":[226],"occ":[123],"oce":[73,152,178,210],"oci":[77,250],"ock":[227],"oco":[123,134,145,202],"ocy":[179],"oda":[188,189],"oel":[139],"oen":[205],"ogn":[217],"ogo":[215],"ogu":[6],"oid":[235,276],"ola":[12,234],"old":[107],"ole":[182],"oll":[228],"olm":[156,157],"olo":[61,235,238,239],"olu":[59,183],"oma":[46,145],"ome":[57,82],"omm":[60],"omu":[184],"onc":[61,150],"ond":[212],"one":[125],"ong":[84,151],"oni":[293],"ono":[217,220],"ood":[290],"opa":[238,239],"ope":[95,252,257],"oph":[147],"opi":[50],"opo":[215],"opp":[62],"opr":[217],"ops":[63,162,294],"opt":[161],"opu":[51],"ora":[64,65,131,177],"orb":[267],"ore":[103],"orh":[91,153],"ori":[180,181,182,183,261],"orn":[10,74,126,292],"ort":[176,184],"orv":[66],"osa":[192],"ose":[229],"osh":[108],"ost":[32,294],"osu":[134,191],"ota":[166],"oth":[1],"oto":[184],"ott":[167,255],"otu":[202,220],"ouc":[67],"oun":[168],"ous":[55,127,230],"ove":[83],"owe":[40,101],"owl":[185,186],"own":[41,70],"pac":[238,239],"pad":[187],"pag":[188,189],"pal":[190,191],"pap":[192],"par":[193,194,195,251],"pas":[196,197],"pat":[93,154],"pea":[95,198],"peb":[191],"pec":[101],"ped":[173,231],"pel":[252,257],"per":[62,199,200,201,202],"pha":[73,115,116,147],"phe":[203],"phi":[204,271],"pho":[205],"pid":[222],"pie":[155,206,207,274],"pig":[208],"pil":[192,252],"pin":[204],"pis":[50],"pit":[0],"pla":[209],"ple":[219,253],"plo":[210],"plu":[211],"pog":[215],"pon":[212],"por":[292],"pot":[254,255],"ppe":[62],"ppi":[204],"pra":[48],"pri":[213],"pro":[217],"pse":[214],"psi":[75,215,216],"psy":[63],"pte":[161],"pto":[145,257],"pty":[217],"pun":[218],"pur":[219],"pus":[11,51],"pwi":[142],"pyc":[220],"rac":[64,65],"rag":[68],"rah":[35],"rai":[36,37],"rak":[193],"ram":[38,140],"ran":[163],"ras":[94,154],"rat":[48],"rax":[177],"ray":[109,110],"rbe":[24],"rbi":[267],"rcu":[152],"rde":[12],"rdo":[276],"rea":[39,54,111,112],"red":[221,286],"ree":[113,273,274],"reg":[199,200,201],"reo":[55],"rep":[257],"res":[1,103],"ret":[89,90],"reu":[56],"rey":[114],"rge":[143],"rgy":[13],"rhe":[283],"rhi":[222],"rhy":[91,153],"ria":[93,194,244],"ric":[4,76,202],"rid":[1],"rie":[180,181],"rik":[243],"rin":[8,9,197,199,200,201,213,223,224],"rio":[182,183],"ris":[6,32,58,233,275],"riu":[261,279],"riv":[225],"rix":[258],"rli":[256],"rna":[248],"rnb":[126],"rne":[249],"rni":[10,74,259,292],"roa":[268,288],"rob":[226],"roc":[77,123,152,202,227],"rog":[217],"rol":[228],"ron":[84,122],"rop":[50,51,95,162,294],"ror":[10,91,153],"ros":[32,179,191,229],"row":[40,41,69,70,251],"rpe":[101],"rpl":[219],"rro":[251],"rru":[72],"rsh":[158],"rsm":[62],"rth":[176,184],"rti":[159],"ruc":[72],"ruf":[230],"rum":[189,231],"run":[124],"rur":[79],"rus":[75,79,195,205,232],"rvu":[66],"ryt":[91],"rze":[106],"san":[203],"sau":[233],"sax":[234,235],"sca":[236],"sch":[237],"sci":[170],"sco":[238,239],"scu":[105],"sen":[240,241],"ser":[146,196,197],"seu":[214],"sha":[108,158],"shc":[45],"she":[137],"shi":[242],"shr":[243],"shy":[14],"sia":[15,16,94],"sib":[244],"sie":[22],"sil":[215],"sin":[245],"sis":[22,29,53,154,241,245,249],"sit":[216],"siu":[75],"ske":[286],"sky":[86],"sma":[246],"smi":[62,247],"smy":[248,249],"soc":[250],"spa":[154,251],"spi":[252],"spl":[253],"spo":[254,255],"sse":[146,196,197],"sta":[256],"ste":[39,294],"sti":[82,232,275],"str":[32,257,258],"stu":[259],"suc":[125],"sun":[260],"sus":[134,191],"sut":[261],"swa":[262],"swi":[263],"syc":[63],"syl":[264,265],"tac":[166,216],"tai":[99,168,266,267,281],"tal":[180,181],"tar":[256],"tch":[102],"ted":[39,255,268,280],"ten":[154],"ter":[0,88,112,161,282,283,294],"tet":[288],"the":[1,17,176],"thi":[2,18,247],"tho":[184],"thr":[91,268,288],"tic":[16,82,177,232,264,269,270],"tin":[159],"tip":[271],"tis":[46,275],"tit":[272],"tiv":[209],"tle":[49,148,167,284],"toc":[145],"tom":[184],"top":[257],"tor":[199,261],"tre":[257,273,274],"tri":[32,93,258,275],"tro":[51],"tta":[77,90,106,216],"tte":[255],"tth":[18],"ttl":[49,148,167,284],"tul":[218],"tur":[259,276],"tus":[104,202,220],"tyo":[217],"ubu":[42],"uca":[67,72],"uck":[71,85,125],"uco":[147],"udi":[214],"udy":[92],"uff":[43],"ufo":[230],"ugh":[144],"ula":[6,216,218,233],"ulb":[44],"ulc":[42],"uli":[104],"umb":[59],"ump":[231],"unb":[260],"unc":[218],"und":[124,277],"ung":[135],"uni":[169],"unt":[168],"upa":[93],"ura":[94,150,222],"urd":[276],"uri":[76],"urn":[259],"uro":[10,95],"urp":[219],"urr":[72],"uru":[75,79,205],"usc":[105,170],"use":[127],"ush":[45],"usk":[86],"ust":[232],"uto":[261],"vag":[277],"van":[278],"var":[279],"vat":[264],"ven":[280],"ver":[37,100,225,285],"vet":[165],"via":[149,265],"vus":[66,164],"wag":[281],"wal":[262],"wat":[282,283,284],"wea":[285],"wed":[40],"wer":[101],"whi":[286,287,288],"wif":[263],"win":[142],"wir":[289],"wle":[186],"wne":[70],"woo":[290],"xan":[8,9],"xic":[234,235],"yal":[87],"yan":[73],"ybi":[187],"yca":[102],"yce":[179],"ych":[63],"ycn":[220],"yct":[177],"yel":[291],"yii":[110],"ylo":[52,293],"ylv":[264,265],"yna":[92,171,172],"ync":[91,153],"yon":[117,217],"yor":[74],"yps":[75],"yri":[58],"yrn":[248,249],"ysu":[125],"yth":[91],"zap":[292],"zet":[106],"zey":[293],"zos":[294],"ंकी":[393],"ंको":[347],"ंगप":[363],"ंगर":[366],"ंगल":[321],"ंगळ":[354],"ंगा":[377],"ंजी":[384],"ंठा":[295],"ंठी":[388],"ंढर":[348],"ंढऱ":[349],"ंपी":[385],"ंबट":[336],"ंबड":[351],"ंभळ":[322,323],"ईचा":[367],"कंठ":[295,388],"कडा":[296],"करड":[297],"करण":[298],"करी":[334],"कवड":[299,300],"काच":[324],"कार":[301],"काळ":[302,303],"काव":[304,333],"किर":[335],"कीळ":[305],"केल":[325,326],"केव":[329,330,331],"कों":[351],"कोक":[305],"कोत":[306],"कोळ":[347,350],"क्य":[332],"क्र":[386],"खाट":[307,308],"गंग":[377],"गपा":[363],"गप्":[309],"गरण":[394],"गरी":[366],"गली":[321],"गळा":[354,359],"गवत":[310],"गोम":[311],"घार":[313],"घुब":[314],"चरक":[315],"चष्":[316],"चिम":[317],"चोर":[324],"छात":[318,319],"छोट":[320],"जंग":[321],"जपो":[374],"जां":[322,323],"जीर":[384],"टका":[324],"टवट":[380],"टवी":[327],"टिक":[307,325,326],"टिट":[327],"टीक":[308],"टीच":[389],"टोई":[328],"टोच":[358],"ट्य":[380],"ठाच":[295],"ठिप":[329,330,331],"ठ्ठ":[355,356],"ठ्य":[355,356],"डोक":[332],"डोम":[333],"ड्य":[300,361],"ढरा":[348],"ढऱ्":[349],"ढोक":[334],"णको":[351],"ण्य":[301],"तपक":[335],"तभा":[391],"तवा":[306],"तां":[336],"ताड":[337],"तार":[338],"तीच":[318,319],"तीय":[364],"त्र":[375],"दया":[339],"दास":[309],"द्य":[396],"द्व":[365],"धने":[340],"धीव":[341],"धूस":[342],"धोब":[343],"नाच":[344],"निळ":[345],"नील":[346],"नेश":[340],"नोल":[368],"न्य":[392],"पंक":[347],"पंख":[346],"पकि":[335],"पके":[329,330,331],"पटी":[389],"पां":[348,349],"पाई":[387],"पाक":[350],"पाड":[363],"पाण":[351],"पार":[352],"पाव":[353],"पिं":[354],"पीद":[309],"पुठ":[355,356],"पोप":[357,374],"प्प":[309],"फुल":[358],"बईच":[367],"बगळ":[359],"बडी":[351],"बहि":[360],"बाल":[338],"बुड":[361],"बुल":[362],"भळा":[322],"भळ्":[323],"भां":[363],"भाई":[391],"भार":[364,365],"भिं":[366],"भुब":[367],"भ्र":[388],"मका":[333],"मगं":[377],"मणी":[317],"मनो":[368],"मान":[392],"मार":[370],"माळ":[369],"माश":[370],"मेट":[311],"मेव":[316],"मैन":[371],"याच":[332,355,356],"याळ":[339],"रकं":[388],"रडा":[297],"रती":[364],"रद्":[365],"रबा":[338],"रवा":[352],"राख":[372],"राघ":[373],"राज":[374],"राट":[383],"रात":[375],"रान":[376],"राम":[377],"रुण":[301],"ऱ्य":[349],"लचा":[325],"लची":[326],"लटो":[358],"लपं":[346],"लबु":[362],"लां":[378],"लाल":[379],"ळद्":[396],"ळुं":[393],"ळ्य":[303,323],"वटव":[380],"वट्":[380],"वडी":[299],"वड्":[300],"वती":[310],"वळा":[304,333],"वश्":[353],"वाज":[365],"वाल":[306,316,329,330,331],"वेड":[382],"शरा":[383],"शिं":[384,385],"शिक":[386],"शिप":[387],"शीम":[370],"शुभ":[388],"शेप":[389],"श्य":[353],"ष्म":[316],"ससा":[390],"साण":[390],"सात":[391],"साम":[392],"साळ":[393],"सुग":[394],"सुभ":[395],"हळद":[396],"हिर":[360],"होल":[397],"ांग":[363],"ांढ":[348,349],"ांब":[336,378],"ांभ":[322,323],"ाको":[350],"ाखी":[372],"ाघू":[373],"ाचण":[344],"ाचा":[332,355],"ाची":[295,356],"ाचो":[324],"ाजप":[374],"ाटि":[307],"ाटी":[308,383],"ाडी":[363],"ाणक":[351],"ाणा":[390],"ातभ":[391],"ाती":[318,319],"ात्":[375],"ान्":[392],"ामग":[377],"ामा":[392],"ारत":[364],"ारद":[365],"ारब":[338],"ारव":[352],"ारु":[301],"ाला":[316,329],"ाली":[330,338],"ाले":[331],"ाळा":[302],"ाळु":[393],"ाळ्":[303],"ावळ":[304,333],"ावश":[353],"ाशी":[370],"िंग":[354,366],"िंज":[384],"िंप":[385],"िके":[325,326],"िक्":[386],"िटव":[327],"िपक":[329,330,331],"िपा":[387],"िमण":[317],"िरी":[335,360],"िळी":[345],"ीचा":[318,389],"ीची":[319],"ीदा":[309],"ीमा":[370],"ीलप":[346],"ीवर":[341],"ुंक":[393],"ुगर":[394],"ुठ्":[355,356],"ुड्":[361],"ुण्":[301],"ुबई":[367],"ुबड":[314],"ुभग":[395],"ुभ्":[388],"ुलट":[358],"ुलब":[362],"ूसर":[342],"ेडा":[382],"ेपट":[389],"ेलच":[325,326],"ेवा":[316,329,330,331],"ैना":[371],"ोंब":[351],"ोकर":[334],"ोकी":[305],"ोक्":[332],"ोचा":[358],"ोटा":[320],"ोतव":[306],"ोपट":[357,374],"ोबी":[343],"ोमक":[333],"ोमे":[311],"ोला":[397],"ोली":[368],"ोळी":[347,350],"्ठ्":[355,356],"्पी":[309],"्मे":[316],"्या":[300,303,323,332,349,353,355,356,361,380,396],"्रक":[388],"्रा":[386],"्वा":[365]}};
@@ -0,0 +1,30 @@
+import os
+import sys
+from getpass import getpass
+from pathlib import Path
+
+API_KEY_ENV = 'EBIRD_API_KEY'
+
+# Read when the environment variable is unset; keep it private (chmod 600)
+DEFAULT_KEY_FILE = Path.home() / '.config' / 'sppu-bird-guide' / 'ebird_api_key'
+
+
+def load_api_key(key_file=None, prompt=True):
+    """eBird API key from the environment, a key file, or an interactive prompt, in that order"""
+    api_key = os.environ.get(API_KEY_ENV, '').strip()
+    if api_key:
+        return api_key
+
+    path = Path(key_file) if key_file else DEFAULT_KEY_FILE
+    try:
+        api_key = path.read_text(encoding='utf-8').strip()
+    except OSError:
+        if key_file:
+            raise SystemExit(f"Could not read the eBird API key from {path}")
+    if api_key:
+        return api_key
+
+    # Cron jobs and pipelines have no terminal to prompt on
+    if prompt and sys.stdin.isatty():
+        return getpass("Enter your eBird API key: ")
+    raise SystemExit(f"No eBird API key: set {API_KEY_ENV} or write the key to {path}")
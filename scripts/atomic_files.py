@@ -0,0 +1,45 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Read once at import, since changing the umask to read it is not thread-safe
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+@contextmanager
+def open_atomic(path, mode='w', encoding='utf-8'):
+    """File object whose contents replace path with one rename when the block ends without error.
+
+    Every writer gets its own temporary file next to path, so concurrent
+    writers (threads, processes or other machines on shared storage) never
+    rename each other's half-written files; the last complete write wins.
+    """
+    path = Path(path)
+    f = tempfile.NamedTemporaryFile(mode, dir=path.parent, prefix=f".{path.name}.", suffix='.tmp',
+                                    delete=False, encoding=None if 'b' in mode else encoding)
+    try:
+        with f:
+            yield f
+        # NamedTemporaryFile creates files readable only by their owner
+        os.chmod(f.name, 0o666 & ~UMASK)
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+        raise
+
+
+def write_text_atomic(path, text):
+    """Write a UTF-8 text file through a temporary file and an atomic rename"""
+    with open_atomic(path) as f:
+        f.write(text)
+
+
+def write_bytes_atomic(path, data):
+    """Write a binary file through a temporary file and an atomic rename"""
+    with open_atomic(path, 'wb') as f:
+        f.write(data)
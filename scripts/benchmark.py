@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import resource
+import statistics
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import catalog
+import download_ebird_images
+import http_client
+import metrics
+from bird_names import COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES
+from manifest import Manifest
+from render_html import GuideRenderer
+from stand_in_server import StandIn, StandInServer
+from taxonomy_cache import load_taxonomy
+from taxonomy_index import TaxonomyIndex
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+GUIDE_SOURCE = WORKSPACE_ROOT / 'latex' / 'bird_guide.tex'
+
+# Metrics where a larger value is an improvement; everything else is a cost
+HIGHER_IS_BETTER = {'species_per_s', 'mb_per_s'}
+REGRESSION_TOLERANCE = 0.10
+
+
+def percentiles(samples):
+    """Median and 95th percentile of a list of timings"""
+    ordered = sorted(samples)
+    return {
+        'p50': ordered[len(ordered) // 2],
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def misspell(name, rng):
+    """Drop, double or swap one letter, the way names get mangled in field lists"""
+    i = rng.randrange(1, len(name) - 1)
+    return rng.choice((
+        name[:i] + name[i + 1:],
+        name[:i] + name[i] + name[i:],
+        name[:i - 1] + name[i] + name[i - 1] + name[i + 1:],
+    ))
+
+
+def bench_taxonomy(api_key):
+    """Cold fetch, warm disk load and conditional revalidation of the taxonomy"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        table = load_taxonomy(api_key, cache_dir)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        load_taxonomy(api_key, cache_dir)
+        warm = time.perf_counter() - start
+        start = time.perf_counter()
+        load_taxonomy(api_key, cache_dir, max_age=0)
+        revalidate = time.perf_counter() - start
+    return table, {
+        'species': len(table),
+        'cold_fetch_ms': cold * 1000,
+        'warm_load_ms': warm * 1000,
+        'revalidate_ms': revalidate * 1000,
+    }
+
+
+def bench_lookup(table, birds):
+    """Index build time and per-query latency of exact and fuzzy species-code lookups"""
+    start = time.perf_counter()
+    index = TaxonomyIndex(table, COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    index.matcher
+    matcher_build = time.perf_counter() - start
+
+    exact = []
+    for bird in birds:
+        start = time.perf_counter()
+        index.lookup(bird['common_name'], bird['latin_name'])
+        exact.append((time.perf_counter() - start) * 1e6)
+
+    rng = random.Random(0)
+    fuzzy = []
+    resolved = 0
+    for bird in birds:
+        start = time.perf_counter()
+        match = index.lookup(misspell(bird['common_name'], rng), misspell(bird['latin_name'], rng))
+        fuzzy.append((time.perf_counter() - start) * 1e6)
+        expected = index.lookup(bird['common_name'], bird['latin_name'])
+        if match and expected and match[0] == expected[0]:
+            resolved += 1
+
+    return {
+        'index_build_ms': build * 1000,
+        'matcher_build_ms': matcher_build * 1000,
+        'exact_us': percentiles(exact),
+        'fuzzy_us': percentiles(fuzzy),
+        'fuzzy_accuracy': resolved / len(birds),
+    }
+
+
+def bench_download(stand_in, table, birds, api_key, workers):
+    """End-to-end downloader throughput against the stand-in server, without the response cache"""
+    download_ebird_images.TAXONOMY_CACHE = table
+    download_ebird_images.TAXONOMY_INDEX = None
+    download_ebird_images.get_taxonomy_index(api_key)
+    requests_before, bytes_before = stand_in.requests, stand_in.bytes_sent
+
+    with tempfile.TemporaryDirectory() as images_dir:
+        images_dir = Path(images_dir)
+        manifest = Manifest(images_dir / 'manifest.json')
+        tracemalloc.start()
+        start = time.perf_counter()
+        # The downloader narrates every step; keep that out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda bird: download_ebird_images.process_bird(bird, images_dir, api_key, manifest),
+                    birds,
+                ))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        downloaded = sum(path.stat().st_size for path in images_dir.glob('*.jpg'))
+
+    download_ebird_images.TAXONOMY_CACHE = None
+    download_ebird_images.TAXONOMY_INDEX = None
+    download_ebird_images.CREDITS.clear()
+    succeeded = sum(1 for success, _ in results if success)
+    return {
+        'workers': workers,
+        'species': len(birds),
+        'succeeded': succeeded,
+        'seconds': elapsed,
+        'species_per_s': succeeded / elapsed,
+        'mb_per_s': downloaded / elapsed / 1e6,
+        'requests': stand_in.requests - requests_before,
+        'bytes_served': stand_in.bytes_sent - bytes_before,
+        'peak_traced_mb': peak / 1e6,
+        'stages': {
+            name: {'calls': stats['calls'], 'seconds': stats['seconds']}
+            for name, stats in metrics.METRICS.summary()['stages'].items()
+        },
+    }
+
+
+def bench_render(repeats):
+    """Catalog extraction and HTML rendering time for the English guide"""
+    source = GUIDE_SOURCE.read_text(encoding='utf-8')
+    parse = []
+    render = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        entries = catalog.parse_source(GUIDE_SOURCE)
+        parse.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        GuideRenderer('en', credits_dir=WORKSPACE_ROOT / 'images').render(source, entries)
+        render.append((time.perf_counter() - start) * 1000)
+    return {
+        'entries': len(entries),
+        'catalog_ms': statistics.median(parse),
+        'render_ms': statistics.median(render),
+    }
+
+
+def flatten(results, prefix=''):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(current, previous):
+    """Print metric changes against an earlier results file; returns the regressed metrics"""
+    if current['config'] != previous.get('config'):
+        print(f"  Note: configurations differ ({previous.get('config')} before)")
+    now = flatten(current['results'])
+    before = flatten(previous['results'])
+    regressions = []
+    for name in sorted(now):
+        if name not in before or not before[name]:
+            continue
+        change = now[name] / before[name] - 1
+        worse = -change if name.rsplit('.', 1)[-1] in HIGHER_IS_BETTER else change
+        is_timing = name.endswith(('_ms', '_us', '.p50', '.p95', 'seconds', '_mb')) or \
+            name.rsplit('.', 1)[-1] in HIGHER_IS_BETTER
+        flag = ''
+        if is_timing and worse > REGRESSION_TOLERANCE:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"  {name:40} {before[name]:12.3f} -> {now[name]:12.3f} ({change:+.1%}){flag}")
+    return regressions
+
+
+def main(argv=None):
+    """Benchmark lookups, downloads and rendering against a local eBird stand-in"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--species', type=int, default=17000, help="Synthetic taxonomy size")
+    parser.add_argument('--image-kb', type=int, default=300, help="Size of every served image in KB")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent birds in the download benchmark")
+    parser.add_argument('--repeats', type=int, default=5, help="Repeats of the render benchmark")
+    parser.add_argument('--output', type=Path, default=WORKSPACE_ROOT / '.cache' / 'benchmarks' / 'latest.json',
+                        help="Where to write the results JSON")
+    parser.add_argument('--compare', type=Path, help="Earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    api_key = 'stand-in'
+    birds = download_ebird_images.extract_bird_info(GUIDE_SOURCE)
+    stand_in = StandIn(args.species, args.image_kb * 1024, args.latency, args.error_rate)
+    saved_cache = http_client._response_cache
+    http_client.set_response_cache(None)
+    results = {}
+    try:
+        with StandInServer(stand_in):
+            with contextlib.redirect_stdout(io.StringIO()):
+                table, results['taxonomy'] = bench_taxonomy(api_key)
+            print(f"taxonomy: {results['taxonomy']['cold_fetch_ms']:.0f} ms cold, "
+                  f"{results['taxonomy']['warm_load_ms']:.0f} ms warm")
+            results['lookup'] = bench_lookup(table, birds)
+            print(f"lookup: exact p50 {results['lookup']['exact_us']['p50']:.1f} us, "
+                  f"fuzzy p50 {results['lookup']['fuzzy_us']['p50']:.1f} us")
+            results['download'] = bench_download(stand_in, table, birds, api_key, args.workers)
+            print(f"download: {results['download']['species_per_s']:.1f} species/s, "
+                  f"{results['download']['mb_per_s']:.1f} MB/s")
+    finally:
+        http_client.set_response_cache(saved_cache)
+    results['render'] = bench_render(args.repeats)
+    print(f"render: catalog {results['render']['catalog_ms']:.1f} ms, html {results['render']['render_ms']:.1f} ms")
+    results['process'] = {'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'config': {
+            'species': args.species,
+            'image_kb': args.image_kb,
+            'latency': args.latency,
+            'error_rate': args.error_rate,
+            'workers': args.workers,
+        },
+        'results': results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        print(f"Compared with {args.compare}:")
+        if compare(report, previous):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
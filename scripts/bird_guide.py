@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Command modules are imported inside each command: requests and Pillow alone
+# take longer to import than resolve or credits take to run.
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+
+
+def resolve(argv):
+    """Resolve common or scientific names to eBird species codes, offline when the taxonomy is cached"""
+    parser = argparse.ArgumentParser(prog='bird_guide.py resolve', description=resolve.__doc__)
+    parser.add_argument('names', nargs='*', help="Names to resolve; '-' reads one name per line from stdin")
+    parser.add_argument('--file', type=Path, metavar='CSV',
+                        help="Species list CSV with common name and/or scientific name columns")
+    parser.add_argument('--json', action='store_true', help="Print one JSON object per name instead of TSV")
+    parser.add_argument('--refresh', action='store_true', help="Revalidate the cached taxonomy online first")
+    parser.add_argument('--api-key-file', type=Path, metavar='FILE',
+                        help="Read the eBird API key from FILE when EBIRD_API_KEY is unset")
+    args = parser.parse_args(argv)
+
+    from bird_names import COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES
+    from taxonomy_cache import CACHE_DIR, TAXONOMY_FILE, TaxonomyTable, load_taxonomy
+    from taxonomy_index import TaxonomyIndex
+
+    birds = []
+    for name in args.names:
+        if name == '-':
+            birds.extend({'common_name': line.strip(), 'latin_name': line.strip()}
+                         for line in sys.stdin if line.strip())
+        else:
+            birds.append({'common_name': name, 'latin_name': name})
+    if args.file:
+        from bulk_download import read_species_list
+        birds.extend(read_species_list(args.file))
+    if not birds:
+        parser.error("no names given")
+
+    # Species codes barely change between taxonomy releases, so any cached copy will do
+    taxonomy = None if args.refresh else TaxonomyTable.load(CACHE_DIR / TAXONOMY_FILE)
+    if taxonomy is None:
+        from api_key import load_api_key
+        api_key = load_api_key(args.api_key_file)
+        taxonomy = load_taxonomy(api_key, max_age=0) if args.refresh else load_taxonomy(api_key)
+    if not taxonomy:
+        raise SystemExit("Could not load the eBird taxonomy")
+    index = TaxonomyIndex(taxonomy, COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES)
+
+    unresolved = 0
+    for bird in birds:
+        common_name = bird.get('common_name') or bird.get('latin_name', '')
+        latin_name = TAXONOMIC_UPDATES.get(bird.get('latin_name'), bird.get('latin_name') or common_name)
+        match = index.lookup(common_name, latin_name)
+        code, match_type = (match[0], match[1]) if match else (None, None)
+        names = index.species(code) if code else None
+        unresolved += match is None
+        if args.json:
+            print(json.dumps({
+                'query': common_name,
+                'species_code': code,
+                'match_type': match_type,
+                'common_name': names[0] if names else None,
+                'scientific_name': names[1] if names else None,
+            }, ensure_ascii=False))
+        else:
+            print('\t'.join((common_name, code or '', match_type or '', *(names or ('', '')))))
+    if unresolved:
+        print(f"{unresolved} of {len(birds)} names could not be resolved", file=sys.stderr)
+        raise SystemExit(1)
+
+
+def fetch(argv):
+    """Download images and credits for the guide's birds, or for a species list with --species-list"""
+    import download_ebird_images
+    sys.argv[0] = 'bird_guide.py fetch'
+    download_ebird_images.main(argv)
+
+
+def credits(argv):
+    """Regenerate credits.json and credits.tex from the download manifest, without going online"""
+    parser = argparse.ArgumentParser(prog='bird_guide.py credits', description=credits.__doc__)
+    parser.add_argument('--images-dir', type=Path, default=WORKSPACE_ROOT / 'images',
+                        help="Directory holding the images and manifest.json (default: images)")
+    parser.add_argument('--import-sidecars', action='store_true',
+                        help="Also fold legacy <image>_credit.txt files into the credits database")
+    parser.add_argument('--check', action='store_true',
+                        help="Only report outdated credits, exiting 1 if there are any")
+    args = parser.parse_args(argv)
+
+    from image_credits import CREDITS_TEX, CreditsDatabase, credit_lines, format_credit
+    from manifest import Manifest
+
+    database = CreditsDatabase(args.images_dir)
+    outdated = database.import_sidecars() if args.import_sidecars else 0
+    manifest = Manifest(args.images_dir / 'manifest.json')
+    for image_name, entry in sorted(manifest.entries.items()):
+        if not entry.get('credit'):
+            continue
+        lines = credit_lines(format_credit(entry['credit']))
+        if database.get(image_name) != lines:
+            print(f"{'Outdated' if image_name in database else 'Missing'} credit: {image_name}")
+            database.credits[image_name] = lines
+            outdated += 1
+    try:
+        tex_current = (args.images_dir / CREDITS_TEX).read_text(encoding='utf-8') == database.tex()
+    except OSError:
+        tex_current = False
+
+    if args.check:
+        if outdated or not tex_current:
+            raise SystemExit(1)
+        return
+    if outdated or not tex_current:
+        database.save()
+    print(f"{len(database.credits)} credits, {outdated} updated")
+
+
+def build(argv):
+    """Incrementally build the HTML guides, PDFs and their images"""
+    import build
+    sys.argv[0] = 'bird_guide.py build'
+    build.main(argv)
+
+
+def bench(argv):
+    """Benchmark lookups, downloads and rendering against a local eBird stand-in"""
+    import benchmark
+    sys.argv[0] = 'bird_guide.py bench'
+    benchmark.main(argv)
+
+
+COMMANDS = {command.__name__: command for command in (resolve, fetch, credits, build, bench)}
+
+
+def main(argv=None):
+    """Command line entry point for the bird guide scripts"""
+    parser = argparse.ArgumentParser(
+        description=main.__doc__,
+        epilog="The eBird API key is read from EBIRD_API_KEY or ~/.config/sppu-bird-guide/ebird_api_key. "
+               "Run 'bird_guide.py COMMAND --help' for the options of a command.",
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+    for name, command in COMMANDS.items():
+        # Each command parses its own options, so the full help stays next to its code
+        subparsers.add_parser(name, help=command.__doc__, add_help=False)
+    args, rest = parser.parse_known_args(argv)
+    COMMANDS[args.command](rest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Known taxonomic updates - map old names to new eBird names
+TAXONOMIC_UPDATES = {
+    'Milvus migrans': 'Milvus migrans',  # Black Kite - same
+    'Accipiter badius': 'Accipiter badius',  # Shikra - same
+    'Amaurornis phoenicurus': 'Zapornia phoenicurus',  # White-breasted Waterhen - updated
+    'Ardeola grayii': 'Ardeola grayii',  # Indian Pond Heron - same
+    'Nycticorax nycticorax': 'Nycticorax nycticorax',  # Black-crowned Night Heron - same
+    'Bubulcus ibis': 'Bubulcus ibis',  # Cattle Egret - same
+    'Egretta garzetta': 'Egretta garzetta',  # Little Egret - same
+    'Columba livia': 'Columba livia',  # Blue Rock Pigeon - same
+    'Streptopelia chinensis': 'Spilopelia chinensis',  # Spotted Dove - updated
+    'Streptopelia senegalensis': 'Spilopelia senegalensis',  # Little Brown Dove - updated
+    'Vanellus indicus': 'Vanellus indicus',  # Red-wattled Lapwing - same
+    'Eudynamys scolopacea': 'Eudynamys scolopaceus',  # Asian Koel - updated
+    'Centropus sinensis': 'Centropus sinensis',  # Greater Coucal - same
+    'Psittacula krameri': 'Psittacula krameri',  # Rose-ringed Parakeet - same
+    'Psittacula eupatria': 'Alexandrinus eupatria',  # Alexandrine Parakeet - updated
+    'Psittacula cyanocephala': 'Psittacula cyanocephala',  # Plum-headed Parakeet - same
+    'Apus affinis': 'Apus affinis',  # House Swift - same
+    'Halcyon smyrnensis': 'Halcyon smyrnensis',  # White-breasted Kingfisher - same
+    'Megalaima haemacephala': 'Psilopogon haemacephalus',  # Coppersmith Barbet - updated
+    'Hirundo concolor': 'Ptyonoprogne concolor',  # Dusky Crag Martin - updated
+    'Hirundo rustica': 'Hirundo rustica',  # Barn Swallow - same
+    'Hirundo daurica': 'Cecropis daurica',  # Red-rumped Swallow - updated
+    'Hirundo smithii': 'Hirundo smithii',  # Wire-tailed Swallow - same
+    'Lanius schach': 'Lanius schach',  # Long-tailed Shrike - same
+    'Oriolus oriolus': 'Oriolus oriolus',  # Golden Oriole - same
+    'Dicrurus macrocercus': 'Dicrurus macrocercus',  # Black Drongo - same
+    'Dicrurus leucophaeus': 'Dicrurus leucophaeus',  # Ashy Drongo - same
+    'Acridotheres tristis': 'Acridotheres tristis',  # Common Myna - same
+    'Copsychus saularis': 'Copsychus saularis',  # Oriental Magpie-Robin - same
+    'Pycnonotus cafer': 'Pycnonotus cafer',  # Red-vented Bulbul - same
+    'Pycnonotus jocosus': 'Pycnonotus jocosus',  # Red-whiskered Bulbul - same
+    'Turdoides malcolmi': 'Argya malcolmi',  # Large Grey Babbler - updated
+    'Muscicapa tickelliae': 'Cyornis tickelliae',  # Tickell's Blue Flycatcher - updated
+    'Prinia socialis': 'Prinia socialis',  # Ashy Prinia - same
+    'Prinia sylvatica': 'Prinia sylvatica',  # Jungle Prinia - same
+    'Passer domesticus': 'Passer domesticus',  # House Sparrow - same
+    'Ploceus philippinus': 'Ploceus philippinus',  # Baya Weaver - same
+    'Copsychus fulicatus': 'Saxicoloides fulicatus',  # Indian Robin - updated
+    'Zosterops palpebrosus': 'Zosterops palpebrosus',  # Oriental White-eye - same
+    'Lonchura punctulata': 'Lonchura punctulata',  # Scaly-breasted Munia - same
+    'Corvus splendens': 'Corvus splendens',  # House Crow - same
+    'Corvus macrorhynchos': 'Corvus macrorhynchos',  # Large-billed Crow - same
+    'Athene brama': 'Athene brama',  # Spotted Owlet - same
+    'Ocyceros birostris': 'Ocyceros birostris',  # Indian Grey Hornbill - same
+    'Coracias benghalensis': 'Coracias benghalensis',  # Indian Roller - same
+    'Coracina melanoptera': 'Coracina melanoptera',  # Black-headed Cuckoo-shrike - same
+    'Pericrocotus cinnamomeus': 'Pericrocotus cinnamomeus',  # Small Minivet - same
+    'Dicaeum erythrorhynchos': 'Dicaeum erythrorhynchos',  # Tickell's Flowerpecker - same
+    'Sylvia curruca': 'Curruca curruca',  # Lesser Whitethroat - updated
+    'Cacomantis passerinus': 'Cacomantis passerinus',  # Grey-bellied Cuckoo - same
+    'Saxicola caprata': 'Saxicola caprata',  # Pied Bushchat - same
+    'Hierococcyx varius': 'Hierococcyx varius',  # Common Hawk-Cuckoo - same
+    'Strix ocellata': 'Strix ocellata',  # Mottled Wood Owl - same
+    'Motacilla cinerea': 'Motacilla cinerea',  # Grey Wagtail - same
+    'Motacilla alba': 'Motacilla alba',  # White Wagtail - same
+    'Ardeola grayii': 'Ardeola grayii',  # Indian Pond Heron - same
+    'Sturnia pagodarum': 'Sturnia pagodarum',  # Brahminy Starling - same
+    'Aegithina tiphia': 'Aegithina tiphia',  # Common Iora - same
+    'Cinnyris asiaticus': 'Cinnyris asiaticus',  # Purple Sunbird - same
+    'Acridotheres fuscus': 'Acridotheres fuscus',  # Jungle Myna - same
+    'Orthotomus sutorius': 'Orthotomus sutorius',  # Common Tailorbird - same
+    'Merops orientalis': 'Merops orientalis',  # Asian Green Bee-eater - same
+    'Parus cinereus': 'Parus cinereus',  # Asian Tit (Cinereous Tit) - same
+    'Leptocoma zeylonica': 'Leptocoma zeylonica',  # Purple-rumped Sunbird - same
+    'Rhipidura albogularis': 'Rhipidura albogularis',  # Spot-breasted Fantail - same
+    'Falco peregrinus': 'Falco peregrinus',  # Peregrine Falcon - same
+    'Cypsiurus balasiensis': 'Cypsiurus balasiensis',  # Asian Palm Swift - same
+    'Dendrocitta vagabunda': 'Dendrocitta vagabunda',  # Rufous Treepie - same
+    'Pseudibis papillosa': 'Pseudibis papillosa',  # Red-naped Ibis - same
+    'Alcedo atthis': 'Alcedo atthis',  # Common Kingfisher - same
+    'Motacilla maderaspatensis': 'Motacilla maderaspatensis',  # White-browed Wagtail - same
+}
+
+# Common name variants to help with matching
+COMMON_NAME_VARIANTS = {
+    'Blue Rock Pigeon': ['Rock Pigeon', 'Rock Dove', 'Common Pigeon'],
+    'Little Brown Dove': ['Laughing Dove', 'Senegal Dove', 'Palm Dove'],
+    'Asian Koel': ['Common Koel', 'Eastern Koel'],
+    'White-breasted Kingfisher': ['White-throated Kingfisher', 'Smyrna Kingfisher'],
+    'House Swift': ['Little Swift', 'Asian House Swift'],
+    'Large Grey Babbler': ['Large Gray Babbler', "Malcolm's Babbler"],
+    'Large-billed Crow': ['Jungle Crow', 'Large-billed Crow', 'Indian Jungle Crow'],
+    'House Crow': ['Indian House Crow', 'Common House Crow'],
+    'Indian Grey Hornbill': ['Indian Gray Hornbill', 'Common Grey Hornbill'],
+    'Indian Roller': ['Blue Jay', 'Northern Roller', 'European Roller'],
+    'Spotted Dove': ['Spilopelia chinensis', 'Pearl-necked Dove'],
+    'Black Drongo': ['King Crow'],
+    'Common Myna': ['Indian Myna', 'Common Mynah'],
+    'Red-vented Bulbul': ['Common Bulbul'],
+    'Oriental Magpie-Robin': ['Magpie Robin', 'Dyal Bird'],
+    'House Sparrow': ['Indian Sparrow'],
+    'Asian Koel': ['Koel', 'Common Koel'],
+    'Greater Coucal': ['Crow Pheasant', 'Common Coucal'],
+    'Red-wattled Lapwing': ['Did-he-do-it Bird'],
+    'Rose-ringed Parakeet': ['Ring-necked Parakeet'],
+    'Indian Robin': ['Black Robin', 'Indian Black Robin'],
+    'Cattle Egret': ['Buff-backed Heron'],
+    'Black Kite': ['Pariah Kite'],
+    'Shikra': ['Little Banded Goshawk'],
+    'White-breasted Waterhen': ['White-breasted Water Hen', 'Common Waterhen'],
+    'Lesser Whitethroat': ['Common Lesser Whitethroat', 'Siberian Lesser Whitethroat'],
+    'Grey-bellied Cuckoo': ['Gray-bellied Cuckoo', 'Plaintive Cuckoo'],
+    'Pied Bushchat': ['Common Pied Bushchat', 'African Pied Bushchat'],
+    'Common Hawk-Cuckoo': ['Brainfever Bird', 'Brain-fever Bird'],
+    'Mottled Wood Owl': ['Forest Spotted Owlet', 'Indian Wood Owl'],
+    'Grey Wagtail': ['Gray Wagtail', 'Mountain Wagtail'],
+    'White Wagtail': ['Pied Wagtail', 'European White Wagtail'],
+    'Indian Pond Heron': ['Paddybird', 'Pond Heron'],
+    'Brahminy Starling': ['Brahminy Myna', 'Pagoda Starling', 'Pagoda Myna'],
+    'Common Iora': ['Marshall\'s Iora', 'Yellow-naped Iora'],
+    'Purple Sunbird': ['Purple Honeysucker'],
+    'Jungle Myna': ['Indian Jungle Myna', 'Dusky Myna'],
+    'Common Tailorbird': ['Indian Tailorbird', 'Long-tailed Tailorbird'],
+    'Asian Green Bee-eater': ['Little Green Bee-eater', 'Small Green Bee-eater'],
+    'Asian Tit': ['Cinereous Tit', 'Grey Tit', 'Indian Grey Tit'],
+    'Purple-rumped Sunbird': ['Ceylon Purple-rumped Sunbird'],
+    'Spot-breasted Fantail': ['White-spotted Fantail', 'White-throated Fantail'],
+    'Peregrine Falcon': ['Duck Hawk', 'Great Falcon'],
+    'Asian Palm Swift': ['Palm Swift', 'Asian Palm-Swift'],
+    'Rufous Treepie': ['Indian Treepie', 'Rufous Tree Pie'],
+    'Red-naped Ibis': ['Indian Black Ibis', 'Black Ibis'],
+    'Common Kingfisher': ['Eurasian Kingfisher', 'River Kingfisher'],
+    'White-browed Wagtail': ['Large Pied Wagtail', 'Indian Pied Wagtail'],
+}
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import catalog
+import image_derivatives
+import publish
+import render_html
+import search_index
+from atomic_files import open_atomic
+from manifest import file_sha256
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+LATEX_DIR = WORKSPACE_ROOT / 'latex'
+HTML_DIR = WORKSPACE_ROOT / 'html'
+IMG_DIR = WORKSPACE_ROOT / 'images'
+PDF_DIR = WORKSPACE_ROOT / 'pdf'
+SEASONALITY_FILE = WORKSPACE_ROOT / 'data' / 'seasonality.json'
+SCRIPTS_DIR = WORKSPACE_ROOT / 'scripts'
+STATE_FILE = WORKSPACE_ROOT / '.cache' / 'build' / 'state.json'
+TEX_BUILD_DIR = WORKSPACE_ROOT / '.cache' / 'build' / 'tex'
+
+STATE_VERSION = 1
+
+# tex4ht configuration for the XeTeX build, generated rather than tracked
+TEX4HT_ENV = r"""\def\Apply{\HCode{<link rel="stylesheet" type="text/css" href="style.css" />\Hnewline}}
+\Configure{VERSION}{}
+\Configure{DOCTYPE}{\HCode{<!DOCTYPE html>\Hnewline}}
+\Configure{HTML}{\HCode{<html>\Hnewline}}{\HCode{\Hnewline</html>}}
+\Configure{@HEAD}{}
+\Configure{@HEAD}{\HCode{<meta charset="UTF-8" />\Hnewline}}
+\Configure{@HEAD}{\HCode{<meta name="viewport" content="width=device-width, initial-scale=1"/>\Hnewline}}
+\Configure{@HEAD}{\Apply}
+"""
+
+SCRIPT_TAG = '<script src="script.js"></script>'
+
+# Printed documents: target name -> (source stem, engine)
+DOCUMENTS = {
+    'pdf-en': ('bird_guide', 'pdflatex'),
+    'pdf-mr': ('bird_guide_marathi', 'xelatex'),
+    'slides-en': ('bird_guide_presentation', 'pdflatex'),
+    'slides-mr': ('bird_guide_marathi_presentation', 'xelatex'),
+}
+
+# Files a pass writes and the next pass reads; the build has converged once they stop changing
+RERUN_EXTENSIONS = ('.aux', '.toc', '.out', '.nav', '.snm', '.ind', '.lof', '.lot')
+MAX_PASSES = 5
+
+TARGET_GROUPS = {
+    'html': ('images', 'html-en', 'html-mr', 'search'),
+    'pdf': tuple(DOCUMENTS),
+}
+TARGET_GROUPS['release'] = TARGET_GROUPS['html'] + ('publish',) + TARGET_GROUPS['pdf']
+
+
+class Target:
+    """A build output with the input files that determine it"""
+
+    def __init__(self, name, inputs, outputs, action, deps=()):
+        self.name = name
+        self.inputs = inputs
+        self.outputs = outputs
+        self.action = action
+        self.deps = deps
+
+    def input_files(self):
+        files = set()
+        for pattern in self.inputs:
+            if any(char in pattern for char in '*?['):
+                files.update(WORKSPACE_ROOT.glob(pattern))
+            else:
+                files.add(WORKSPACE_ROOT / pattern)
+        return sorted(path for path in files if path.is_file())
+
+    def output_files(self):
+        return [WORKSPACE_ROOT / pattern for pattern in self.outputs]
+
+
+class BuildState:
+    """Content hashes of every target's inputs and outputs from the last build"""
+
+    def __init__(self, path=STATE_FILE):
+        self.path = Path(path)
+        self.targets = {}
+        self.files = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == STATE_VERSION:
+                self.targets = data['targets']
+                self.files = data['files']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def digest(self, path):
+        """sha256 of a file, reusing the previous hash while size and mtime match"""
+        stat = path.stat()
+        key = str(path.relative_to(WORKSPACE_ROOT))
+        cached = self.files.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime_ns:
+            return cached['sha256']
+        digest = file_sha256(path)
+        self.files[key] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': digest}
+        return digest
+
+    def snapshot(self, paths):
+        return {
+            str(path.relative_to(WORKSPACE_ROOT)): self.digest(path)
+            for path in paths if path.exists()
+        }
+
+    def changes(self, target):
+        """Why a target needs rebuilding, or an empty list if it is up to date"""
+        recorded = self.targets.get(target.name)
+        if not recorded:
+            return ['never built']
+        reasons = []
+        inputs = self.snapshot(target.input_files())
+        for path in sorted(set(inputs) | set(recorded['inputs'])):
+            if inputs.get(path) != recorded['inputs'].get(path):
+                reasons.append(f"{path} changed")
+        outputs = target.output_files()
+        for path in outputs:
+            key = str(path.relative_to(WORKSPACE_ROOT))
+            if not path.exists():
+                reasons.append(f"{key} missing")
+            elif self.digest(path) != recorded['outputs'].get(key):
+                reasons.append(f"{key} modified")
+        return reasons
+
+    def record(self, target):
+        self.targets[target.name] = {
+            'inputs': self.snapshot(target.input_files()),
+            'outputs': self.snapshot(target.output_files()),
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open_atomic(self.path) as f:
+            json.dump({'version': STATE_VERSION, 'targets': self.targets, 'files': self.files}, f, indent=1)
+
+
+def write_if_changed(path, content):
+    """Write a generated file only when its content differs, keeping mtimes stable"""
+    path = Path(path)
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            return False
+    except OSError:
+        pass
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def run(command, cwd, env=None):
+    print(f"  $ {' '.join(command)}")
+    subprocess.run(command, cwd=cwd, env=env, check=True)
+
+
+def run_quiet(command, cwd, env=None, log_file=None):
+    """Run a command with its output captured so parallel builds do not interleave"""
+    result = subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, errors='replace')
+    if result.returncode != 0:
+        output = result.stdout
+        if log_file and Path(log_file).exists():
+            output = Path(log_file).read_text(encoding='utf-8', errors='replace')
+        tail = '\n'.join(output.splitlines()[-20:])
+        raise RuntimeError(f"{command[0]} exited with status {result.returncode}\n{tail}")
+
+
+def rerun_snapshot(build_dir):
+    """Hashes of the auxiliary files that feed back into the next pass"""
+    return {
+        path.name: file_sha256(path)
+        for path in sorted(build_dir.iterdir()) if path.suffix in RERUN_EXTENSIONS
+    }
+
+
+def compile_pdf(stem, engine):
+    """Compile one document in its own build directory, rerunning until its aux files converge"""
+    def action():
+        # Sources reference ../images, so TeX runs from latex/ and writes everything else aside
+        build_dir = TEX_BUILD_DIR / stem
+        build_dir.mkdir(parents=True, exist_ok=True)
+        env = dict(os.environ, TEXINPUTS=f".:{build_dir}:")
+        command = [engine, '-interaction=nonstopmode', '-halt-on-error',
+                   f'-output-directory={build_dir}', f'{stem}.tex']
+        style = LATEX_DIR / f"{stem}.ist"
+
+        before = rerun_snapshot(build_dir)
+        for passes in range(1, MAX_PASSES + 1):
+            index_files = {path: file_sha256(path) for path in build_dir.glob('*.idx')}
+            run_quiet(command, LATEX_DIR, env, build_dir / f"{stem}.log")
+            for idx in build_dir.glob('*.idx'):
+                if file_sha256(idx) != index_files.get(idx) or not idx.with_suffix('.ind').exists():
+                    makeindex = ['makeindex', '-q']
+                    if style.exists():
+                        makeindex += ['-s', str(style)]
+                    run_quiet(makeindex + [idx.name], build_dir)
+            after = rerun_snapshot(build_dir)
+            if after == before:
+                break
+            before = after
+        else:
+            print(f"  {stem}: auxiliary files still changing after {MAX_PASSES} passes")
+
+        PDF_DIR.mkdir(exist_ok=True)
+        shutil.copyfile(build_dir / f"{stem}.pdf", PDF_DIR / f"{stem}.pdf")
+        print(f"  {stem}.pdf: {passes} pass{'es' if passes > 1 else ''}")
+    return action
+
+
+def add_script_tag(html_file):
+    content = html_file.read_text(encoding='utf-8', errors='surrogateescape')
+    if SCRIPT_TAG not in content:
+        content = content.replace('</body>', f'{SCRIPT_TAG}\n</body>', 1)
+        html_file.write_text(content, encoding='utf-8', errors='surrogateescape')
+
+
+def rewrite_images(html_file):
+    """Point a freshly built page at the responsive image derivatives, if built"""
+    index = image_derivatives.load_index(HTML_DIR / 'images')
+    if index:
+        image_derivatives.rewrite_html(html_file, index)
+
+
+def build_images():
+    if image_derivatives.Image is None:
+        # Without derivatives.json the pages keep pointing at the original images/
+        print("images: skipped, Pillow is not installed (pip install Pillow); the HTML uses the full-size images")
+        return
+    image_derivatives.update_derivatives(IMG_DIR, HTML_DIR / 'images')
+
+
+def build_search_index():
+    birds = catalog.Catalog().birds()
+    search_index.write_search_index(search_index.build_search_index(birds), HTML_DIR / 'search-index.js')
+
+
+def render_python(stem, lang):
+    def action():
+        tex_file = LATEX_DIR / f"{stem}.tex"
+        renderer = render_html.GuideRenderer(lang, credits_dir=IMG_DIR, seasonality_file=SEASONALITY_FILE)
+        html = renderer.render(tex_file.read_text(encoding='utf-8'), catalog.load_source(tex_file))
+        output = HTML_DIR / f"{stem}.html"
+        output.write_text(html, encoding='utf-8')
+        rewrite_images(output)
+    return action
+
+
+def render_htlatex():
+    # Intermediates are kept in latex/ so later runs start warm
+    run(['htlatex', 'bird_guide.tex', 'config.cfg,xhtml,charset=utf-8', ' -cunihtf -utf8'], LATEX_DIR)
+    finish_tex4ht('bird_guide')
+
+
+def render_xetex():
+    env = dict(os.environ, TEXMFHOME=str(LATEX_DIR))
+    write_if_changed(LATEX_DIR / 'tex4ht.env', TEX4HT_ENV)
+    run(['xelatex', '-no-pdf', 'bird_guide_marathi.tex'], LATEX_DIR, env)
+    run(['tex4ht', '-f', 'bird_guide_marathi.tex'], LATEX_DIR, env)
+    run(['t4ht', '-f', 'bird_guide_marathi.tex'], LATEX_DIR, env)
+    finish_tex4ht('bird_guide_marathi')
+
+
+def finish_tex4ht(stem):
+    output = HTML_DIR / f"{stem}.html"
+    shutil.move(str(LATEX_DIR / f"{stem}.html"), output)
+    css = LATEX_DIR / f"{stem}.css"
+    if css.exists():
+        shutil.move(str(css), HTML_DIR / css.name)
+    add_script_tag(output)
+    rewrite_images(output)
+
+
+def make_targets(renderer):
+    """The dependency graph, in an order where every target follows its deps"""
+    credit_inputs = ['images/credits.json', 'html/images/derivatives.json']
+    if renderer == 'python':
+        code_inputs = [
+            'scripts/render_html.py',
+            'scripts/latex_parser.py',
+            'scripts/catalog.py',
+            'scripts/templates/*.html',
+            'data/seasonality.json',
+        ]
+        english = render_python('bird_guide', 'en')
+        marathi = render_python('bird_guide_marathi', 'mr')
+        english_inputs = ['latex/bird_guide.tex', *credit_inputs, *code_inputs]
+        marathi_inputs = ['latex/bird_guide_marathi.tex', *credit_inputs, *code_inputs]
+    else:
+        english = render_htlatex
+        marathi = render_xetex
+        english_inputs = ['latex/bird_guide.tex', 'latex/config.cfg', 'latex/seasonality.tex',
+                          'images/credits.tex', *credit_inputs]
+        marathi_inputs = [
+            'latex/bird_guide_marathi.tex',
+            'latex/bird_guide_marathi.ist',
+            'latex/config_marathi.cfg',
+            'latex/head.cfg',
+            'latex/tex4ht-xetex.cfg',
+            'latex/texmf.cnf',
+            'scripts/build.py',
+            'latex/seasonality.tex',
+            'images/credits.tex',
+            *credit_inputs,
+        ]
+
+    targets = [
+        Target('images', ['images/*.jpg', 'scripts/image_derivatives.py'],
+               ['html/images/derivatives.json'], build_images),
+        Target('html-en', english_inputs, ['html/bird_guide.html'], english, deps=('images',)),
+        Target('html-mr', marathi_inputs, ['html/bird_guide_marathi.html'], marathi, deps=('images',)),
+        Target('search', [
+            'latex/bird_guide.tex',
+            'latex/bird_guide_marathi.tex',
+            'scripts/search_index.py',
+            'scripts/bird_names.py',
+        ], ['html/search-index.js'], build_search_index),
+        Target('publish', [
+            'html/*.html',
+            'html/*.css',
+            'html/*.js',
+            'html/images/derivatives.json',
+            'images/*.jpg',
+            'scripts/publish.py',
+            'scripts/templates/sw.js',
+        ], ['dist/precache-manifest.json'], publish.publish, deps=('html-en', 'html-mr', 'search')),
+    ]
+    for name, (stem, engine) in DOCUMENTS.items():
+        inputs = [f'latex/{stem}.tex', f'latex/{stem}.ist', 'images/*.jpg', 'images/credits.tex',
+                  'latex/seasonality.tex']
+        targets.append(Target(name, inputs, [f'pdf/{stem}.pdf'], compile_pdf(stem, engine)))
+    return targets
+
+
+def select_targets(targets, names):
+    """Requested targets plus everything they depend on, in graph order"""
+    by_name = {target.name: target for target in targets}
+    wanted = set()
+    pending = []
+    for name in names or ['html']:
+        pending.extend(TARGET_GROUPS.get(name, (name,)))
+    while pending:
+        name = pending.pop()
+        if name not in by_name:
+            choices = ', '.join([*TARGET_GROUPS, *by_name])
+            raise SystemExit(f"Unknown target {name!r}; choose from {choices}")
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(by_name[name].deps)
+    return [target for target in targets if target.name in wanted]
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def build(targets, state, force=False, dry_run=False, jobs=None):
+    """Rebuild the targets whose inputs changed, running independent targets concurrently.
+
+    Each target starts as soon as its dependencies are done. The heavy lifting
+    happens in TeX subprocesses and the image process pool, so threads are
+    enough to keep every target busy at once. Returns (rebuilt, failed) names.
+    """
+    rebuilt = []
+    failed = []
+    done = set()
+    pending = list(targets)
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs or len(targets) or 1) as executor:
+        while pending or running:
+            for target in list(pending):
+                if any(dep in failed for dep in target.deps):
+                    pending.remove(target)
+                    print(f"{target.name}: skipped, a dependency failed")
+                    failed.append(target.name)
+                    continue
+                if not all(dep in done for dep in target.deps):
+                    continue
+                pending.remove(target)
+                reasons = ['forced'] if force else state.changes(target)
+                if not reasons:
+                    print(f"{target.name}: up to date")
+                    done.add(target.name)
+                    continue
+                print(f"{target.name}: rebuilding ({'; '.join(reasons[:3])}{'; ...' if len(reasons) > 3 else ''})")
+                if dry_run:
+                    done.add(target.name)
+                    continue
+                running[executor.submit(timed, target.action)] = target
+
+            if not running:
+                # Targets finished without running anything may have unblocked others
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                target = running.pop(future)
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    print(f"{target.name}: failed: {e}")
+                    failed.append(target.name)
+                    continue
+                print(f"{target.name}: built in {elapsed:.1f}s")
+                state.record(target)
+                state.save()
+                rebuilt.append(target.name)
+                done.add(target.name)
+    return rebuilt, failed
+
+
+def main(argv=None):
+    """Incrementally build the HTML guides and their images"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('targets', nargs='*',
+                        help="Targets or groups to build: html (default), pdf, release, or a single target")
+    parser.add_argument('--renderer', choices=('python', 'tex4ht'), default='python',
+                        help="Render HTML directly from the sources or through the TeX toolchain")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if nothing changed")
+    parser.add_argument('--dry-run', action='store_true', help="Only report what would be rebuilt")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help="Targets to build at once (default: all that are ready)")
+    args = parser.parse_args(argv)
+
+    HTML_DIR.mkdir(exist_ok=True)
+    targets = select_targets(make_targets(args.renderer), args.targets)
+    state = BuildState()
+    start = time.perf_counter()
+    rebuilt, failed = build(targets, state, args.force, args.dry_run, args.jobs)
+    state.save()
+    if rebuilt:
+        print(f"Built {len(rebuilt)} target{'s' if len(rebuilt) > 1 else ''} in {time.perf_counter() - start:.1f}s")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from api_key import load_api_key
+from bird_names import TAXONOMIC_UPDATES
+from image_credits import CreditsDatabase
+from download_ebird_images import (
+    get_credits,
+    get_taxonomy_index,
+    image_name_for,
+    is_up_to_date,
+    process_bird,
+)
+from manifest import Manifest
+from work_queue import POLL_SECONDS, Heartbeat, worker_name
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+RESULTS_FILE = 'results.jsonl'
+
+# Accepted spellings of each column, compared case-insensitively
+COLUMN_NAMES = {
+    'common_name': ('common_name', 'common name', 'english name', 'english_name', 'primary_com_name'),
+    'latin_name': ('latin_name', 'scientific_name', 'scientific name', 'sci_name', 'latin name'),
+    'species_code': ('species_code', 'species code', 'code', 'speciescode'),
+}
+
+# Manifest and credits saves are batched; the results file is the per-species checkpoint,
+# and carries each image's manifest entry and credit so an interrupted batch can be rebuilt
+MANIFEST_SAVE_EVERY = 50
+
+
+def read_species_list(csv_file):
+    """Yield a bird dict per row of a species list CSV, one row at a time"""
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        columns = {}
+        for field, names in COLUMN_NAMES.items():
+            for column in reader.fieldnames or ():
+                if column.strip().lower() in names:
+                    columns[field] = column
+                    break
+        if not columns:
+            raise ValueError(f"{csv_file} has no common name, scientific name or species code column")
+        for row in reader:
+            bird = {field: (row.get(column) or '').strip() for field, column in columns.items()}
+            if any(bird.values()):
+                yield bird
+
+
+def bird_key(bird):
+    """Stable identity of a species list row, used to match it against the checkpoint"""
+    return bird.get('species_code') or (bird.get('latin_name') or bird.get('common_name', '')).lower()
+
+
+def load_completed(results_file):
+    """Latest result in the checkpoint for each species whose latest result succeeded, by key"""
+    latest = {}
+    try:
+        with open(results_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    # A line cut short by an interruption
+                    continue
+                latest[result['key']] = result
+    except OSError:
+        pass
+    return {key: result for key, result in latest.items() if result['status'] == 'ok'}
+
+
+def restore_results(results, manifest, credits):
+    """Put back manifest entries and credits that were checkpointed but not yet saved; returns how many"""
+    restored = 0
+    for result in results:
+        entry = result.get('manifest')
+        if not entry:
+            continue
+        current = manifest.get(result['image'])
+        if current is None or current.get('updated', '') < entry.get('updated', ''):
+            manifest.entries[result['image']] = entry
+            if result.get('credit'):
+                credits.credits[result['image']] = result['credit']
+            restored += 1
+    return restored
+
+
+def complete_names(birds, index):
+    """Fill in names from the taxonomy for rows given only by species code"""
+    for bird in birds:
+        bird['latin_name'] = TAXONOMIC_UPDATES.get(bird.get('latin_name'), bird.get('latin_name', ''))
+        if bird.get('species_code') and not (bird.get('common_name') and bird.get('latin_name')):
+            names = index.species(bird['species_code'])
+            if names:
+                bird['common_name'] = bird.get('common_name') or names[0]
+                bird['latin_name'] = bird.get('latin_name') or names[1]
+        if not bird.get('common_name'):
+            # Files are named after the common name, so fall back to whatever identifies the row
+            bird['common_name'] = bird.get('latin_name') or bird.get('species_code')
+        yield bird
+
+
+def bounded_map(function, items, workers):
+    """Like executor.map, but reads at most a couple of items ahead of the results"""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append((item, executor.submit(function, item)))
+            if len(pending) >= workers * 2:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+
+def run_bulk(birds, output_dir, api_key, workers=1, refresh=False):
+    """Stream birds through the downloader, appending each result to the checkpoint.
+
+    Returns (succeeded, failed, skipped) counts.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results_file = output_dir / RESULTS_FILE
+    manifest = Manifest(output_dir / 'manifest.json', save_every=MANIFEST_SAVE_EVERY)
+    credits = get_credits(output_dir)
+    credits.save_every = MANIFEST_SAVE_EVERY
+    completed = {} if refresh else load_completed(results_file)
+    restored = restore_results(completed.values(), manifest, credits)
+    if restored:
+        # The previous run stopped between batched saves
+        print(f"Restored {restored} manifest entries from {results_file}")
+        manifest.save()
+        credits.save()
+    index = get_taxonomy_index(api_key)
+    if not index:
+        raise RuntimeError("Could not fetch taxonomy data")
+
+    skipped = 0
+
+    def pending(birds):
+        nonlocal skipped
+        for bird in birds:
+            bird['key'] = bird_key(bird)
+            if bird['key'] in completed:
+                skipped += 1
+                continue
+            yield bird
+
+    def run(bird):
+        if not refresh and is_up_to_date(bird, output_dir, manifest):
+            return True, None
+        return process_bird(bird, output_dir, api_key, manifest)
+
+    succeeded = failed = 0
+    try:
+        with open(results_file, 'a', encoding='utf-8') as out:
+            for bird, (success, reason) in bounded_map(run, complete_names(pending(birds), index), workers):
+                image_name = image_name_for(bird)
+                entry = manifest.get(image_name) if success else None
+                result = {
+                    'key': bird['key'],
+                    'common_name': bird['common_name'],
+                    'latin_name': bird['latin_name'],
+                    'species_code': entry['species_code'] if entry else bird.get('species_code'),
+                    'image': image_name if success else None,
+                    'catalog_id': entry['catalog_id'] if entry else None,
+                    'status': 'ok' if success else 'failed',
+                    'reason': reason,
+                    'manifest': entry,
+                    'credit': credits.get(image_name) if success else None,
+                }
+                out.write(json.dumps(result, ensure_ascii=False) + '\n')
+                out.flush()
+                if success:
+                    succeeded += 1
+                else:
+                    failed += 1
+                print(f"[{succeeded + failed + skipped}] {bird['common_name']}: {result['status']}")
+    finally:
+        manifest.save()
+        credits.save()
+    return succeeded, failed, skipped
+
+
+def collect_results(queue, output_dir):
+    """Merge the manifest entries and credits recorded in a queue into output_dir"""
+    manifest = Manifest(output_dir / 'manifest.json')
+    credits = CreditsDatabase(output_dir)
+    results = queue.results()
+    for result in results:
+        manifest.entries[result['image']] = result['manifest']
+        if result.get('credit'):
+            credits.credits[result['image']] = result['credit']
+    manifest.save()
+    credits.save()
+    return len(results)
+
+
+def run_queue(queue, output_dir, api_key, workers=1):
+    """Work through a shared WorkQueue until no job is left, then merge its results.
+
+    Returns the queue's job counts by state.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Workers on other machines write to the same directory, so the manifest and
+    # credits only live in memory here; the queue holds every result instead
+    manifest = Manifest(output_dir / 'manifest.json', save_every=float('inf'))
+    credits = get_credits(output_dir)
+    credits.save_every = float('inf')
+    index = get_taxonomy_index(api_key)
+    if not index:
+        raise RuntimeError("Could not fetch taxonomy data")
+    worker = worker_name()
+
+    def run(thread_number):
+        name = f"{worker}/{thread_number}"
+        while True:
+            job = queue.lease(name)
+            if job is None:
+                # Jobs leased by other workers come back here if those workers die
+                if queue.counts().get('leased'):
+                    time.sleep(POLL_SECONDS)
+                    continue
+                return
+            key, bird = job
+            bird = next(complete_names([bird], index))
+            image_name = image_name_for(bird)
+            with Heartbeat(queue, key, name):
+                try:
+                    if is_up_to_date(bird, output_dir, manifest):
+                        success, reason = True, None
+                    else:
+                        success, reason = process_bird(bird, output_dir, api_key, manifest)
+                except Exception as e:
+                    success, reason = False, f"{type(e).__name__}: {e}"
+            result = None
+            if success:
+                result = {'image': image_name, 'manifest': manifest.get(image_name), 'credit': credits.get(image_name)}
+            if not queue.finish(key, name, success, reason, result):
+                print(f"{bird['common_name']}: lease lost, result discarded")
+            else:
+                print(f"{bird['common_name']}: {'ok' if success else reason}")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run, range(workers)))
+
+    # Idle workers all get here together; only the one that claims the merge writes the files
+    if queue.claim_merge(worker):
+        print(f"Merged {collect_results(queue, output_dir)} results into {output_dir}")
+        queue.finish_merge(worker)
+    return queue.counts()
+
+
+def main(argv=None):
+    """Download images and credits for a large species list, resumably"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('species_list', type=Path,
+                        help="CSV with common name, scientific name and/or species code columns")
+    parser.add_argument('--output-dir', type=Path, default=WORKSPACE_ROOT / 'images' / 'bulk',
+                        help="Where images, credits and the results checkpoint go")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Number of species to process concurrently (default: 4)")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Process every species again, ignoring earlier results")
+    parser.add_argument('--api-key-file', type=Path, metavar='FILE',
+                        help="Read the eBird API key from FILE when EBIRD_API_KEY is unset")
+    args = parser.parse_args(argv)
+
+    api_key = load_api_key(args.api_key_file)
+    birds = read_species_list(args.species_list)
+    try:
+        succeeded, failed, skipped = run_bulk(birds, args.output_dir, api_key, args.workers, args.refresh)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; rerun to resume from {args.output_dir / RESULTS_FILE}")
+        raise SystemExit(130)
+    print(f"\n{succeeded} downloaded, {failed} failed, {skipped} already done")
+    print(f"Results in {args.output_dir / RESULTS_FILE}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from atomic_files import open_atomic
+from latex_parser import BIRDENTRY_FIELDS, iter_birdentries, plain_text
+from manifest import file_sha256
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+CACHE_DIR = WORKSPACE_ROOT / '.cache' / 'catalog'
+
+# Guide sources by language code
+SOURCES = {
+    'en': WORKSPACE_ROOT / 'latex' / 'bird_guide.tex',
+    'mr': WORKSPACE_ROOT / 'latex' / 'bird_guide_marathi.tex',
+}
+
+CATALOG_VERSION = 1
+
+TEXT_FIELDS = BIRDENTRY_FIELDS[2:-1]
+
+
+def parse_source(tex_file):
+    """Parse every \\birdentry in a guide source into catalog records"""
+    with open(tex_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    records = []
+    for entry in iter_birdentries(text):
+        records.append({
+            'image': entry['image'],
+            'name': plain_text(entry['name']),
+            'latin_name': plain_text(entry['latin']),
+            'fields': {field: plain_text(entry[field]) for field in TEXT_FIELDS},
+            'tex': {field: entry[field] for field in BIRDENTRY_FIELDS},
+            'offset': entry['offset'],
+            'end': entry['end'],
+        })
+    return records
+
+
+def load_source(tex_file, cache_dir=CACHE_DIR):
+    """Catalog records for one source, reparsed only when the file changes"""
+    tex_file = Path(tex_file)
+    stat = tex_file.stat()
+    cache_file = Path(cache_dir) / f"{tex_file.stem}.json"
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('version') != CATALOG_VERSION or cached.get('path') != str(tex_file.resolve()):
+            cached = None
+    except (OSError, ValueError):
+        cached = None
+
+    if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime:
+        return cached['entries']
+
+    digest = file_sha256(tex_file)
+    if cached and cached['sha256'] == digest:
+        # Touched but unchanged: refresh the recorded mtime and keep the entries
+        entries = cached['entries']
+    else:
+        entries = parse_source(tex_file)
+
+    data = {
+        'version': CATALOG_VERSION,
+        'path': str(tex_file.resolve()),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'sha256': digest,
+        'entries': entries,
+    }
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open_atomic(cache_file) as f:
+        json.dump(data, f, ensure_ascii=False)
+    return entries
+
+
+class Catalog:
+    """Structured bird catalog across guide languages, indexed by image filename"""
+
+    def __init__(self, sources=None, cache_dir=CACHE_DIR):
+        self.sources = dict(sources or SOURCES)
+        self.entries = {lang: load_source(path, cache_dir) for lang, path in self.sources.items()}
+        self.by_image = {}
+        for lang, entries in self.entries.items():
+            for entry in entries:
+                self.by_image.setdefault(entry['image'], {})[lang] = entry
+
+    def __len__(self):
+        return len(self.by_image)
+
+    def get(self, image, lang='en'):
+        """Entry for an image filename in one language, or None"""
+        return self.by_image.get(image, {}).get(lang)
+
+    def birds(self):
+        """Per-image records in English guide order, with every language attached"""
+        order = [entry['image'] for entry in self.entries.get('en', [])]
+        order += [image for image in self.by_image if image not in order]
+        return [{'image': image, **self.by_image[image]} for image in order]
+
+    def to_json(self):
+        return {
+            'version': CATALOG_VERSION,
+            'birds': [
+                {'image': bird['image'], **{
+                    lang: {key: value for key, value in bird[lang].items() if key not in ('offset', 'end')}
+                    for lang in self.sources if lang in bird
+                }}
+                for bird in self.birds()
+            ],
+        }
+
+
+def main():
+    """Build the bird catalog from the guide sources and print or save it as JSON"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--output', type=Path, help="Write the catalog here instead of stdout")
+    args = parser.parse_args()
+
+    catalog = Catalog()
+    text = json.dumps(catalog.to_json(), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"Wrote {len(catalog)} birds to {args.output}")
+    else:
+        sys.stdout.write(text + '\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -2,231 +2,137 @@
 import os
 import re
 import json
-import requests
-from getpass import getpass
+import unicodedata
 from pathlib import Path
-from difflib import get_close_matches
 import time
-import csv
-from io import StringIO
-
-# Known taxonomic updates - map old names to new eBird names
-TAXONOMIC_UPDATES = {
-    'Milvus migrans': 'Milvus migrans',  # Black Kite - same
-    'Accipiter badius': 'Accipiter badius',  # Shikra - same
-    'Amaurornis phoenicurus': 'Zapornia phoenicurus',  # White-breasted Waterhen - updated
-    'Ardeola grayii': 'Ardeola grayii',  # Indian Pond Heron - same
-    'Nycticorax nycticorax': 'Nycticorax nycticorax',  # Black-crowned Night Heron - same
-    'Bubulcus ibis': 'Bubulcus ibis',  # Cattle Egret - same
-    'Egretta garzetta': 'Egretta garzetta',  # Little Egret - same
-    'Columba livia': 'Columba livia',  # Blue Rock Pigeon - same
-    'Streptopelia chinensis': 'Spilopelia chinensis',  # Spotted Dove - updated
-    'Streptopelia senegalensis': 'Spilopelia senegalensis',  # Little Brown Dove - updated
-    'Vanellus indicus': 'Vanellus indicus',  # Red-wattled Lapwing - same
-    'Eudynamys scolopacea': 'Eudynamys scolopaceus',  # Asian Koel - updated
-    'Centropus sinensis': 'Centropus sinensis',  # Greater Coucal - same
-    'Psittacula krameri': 'Psittacula krameri',  # Rose-ringed Parakeet - same
-    'Psittacula eupatria': 'Alexandrinus eupatria',  # Alexandrine Parakeet - updated
-    'Psittacula cyanocephala': 'Psittacula cyanocephala',  # Plum-headed Parakeet - same
-    'Apus affinis': 'Apus affinis',  # House Swift - same
-    'Halcyon smyrnensis': 'Halcyon smyrnensis',  # White-breasted Kingfisher - same
-    'Megalaima haemacephala': 'Psilopogon haemacephalus',  # Coppersmith Barbet - updated
-    'Hirundo concolor': 'Ptyonoprogne concolor',  # Dusky Crag Martin - updated
-    'Hirundo rustica': 'Hirundo rustica',  # Barn Swallow - same
-    'Hirundo daurica': 'Cecropis daurica',  # Red-rumped Swallow - updated
-    'Hirundo smithii': 'Hirundo smithii',  # Wire-tailed Swallow - same
-    'Lanius schach': 'Lanius schach',  # Long-tailed Shrike - same
-    'Oriolus oriolus': 'Oriolus oriolus',  # Golden Oriole - same
-    'Dicrurus macrocercus': 'Dicrurus macrocercus',  # Black Drongo - same
-    'Dicrurus leucophaeus': 'Dicrurus leucophaeus',  # Ashy Drongo - same
-    'Acridotheres tristis': 'Acridotheres tristis',  # Common Myna - same
-    'Copsychus saularis': 'Copsychus saularis',  # Oriental Magpie-Robin - same
-    'Pycnonotus cafer': 'Pycnonotus cafer',  # Red-vented Bulbul - same
-    'Pycnonotus jocosus': 'Pycnonotus jocosus',  # Red-whiskered Bulbul - same
-    'Turdoides malcolmi': 'Argya malcolmi',  # Large Grey Babbler - updated
-    'Muscicapa tickelliae': 'Cyornis tickelliae',  # Tickell's Blue Flycatcher - updated
-    'Prinia socialis': 'Prinia socialis',  # Ashy Prinia - same
-    'Prinia sylvatica': 'Prinia sylvatica',  # Jungle Prinia - same
-    'Passer domesticus': 'Passer domesticus',  # House Sparrow - same
-    'Ploceus philippinus': 'Ploceus philippinus',  # Baya Weaver - same
-    'Copsychus fulicatus': 'Saxicoloides fulicatus',  # Indian Robin - updated
-    'Zosterops palpebrosus': 'Zosterops palpebrosus',  # Oriental White-eye - same
-    'Lonchura punctulata': 'Lonchura punctulata',  # Scaly-breasted Munia - same
-    'Corvus splendens': 'Corvus splendens',  # House Crow - same
-    'Corvus macrorhynchos': 'Corvus macrorhynchos',  # Large-billed Crow - same
-    'Athene brama': 'Athene brama',  # Spotted Owlet - same
-    'Ocyceros birostris': 'Ocyceros birostris',  # Indian Grey Hornbill - same
-    'Coracias benghalensis': 'Coracias benghalensis',  # Indian Roller - same
-    'Coracina melanoptera': 'Coracina melanoptera',  # Black-headed Cuckoo-shrike - same
-    'Pericrocotus cinnamomeus': 'Pericrocotus cinnamomeus',  # Small Minivet - same
-    'Dicaeum erythrorhynchos': 'Dicaeum erythrorhynchos',  # Tickell's Flowerpecker - same
-    'Sylvia curruca': 'Curruca curruca',  # Lesser Whitethroat - updated
-    'Cacomantis passerinus': 'Cacomantis passerinus',  # Grey-bellied Cuckoo - same
-    'Saxicola caprata': 'Saxicola caprata',  # Pied Bushchat - same
-    'Hierococcyx varius': 'Hierococcyx varius',  # Common Hawk-Cuckoo - same
-    'Strix ocellata': 'Strix ocellata',  # Mottled Wood Owl - same
-    'Motacilla cinerea': 'Motacilla cinerea',  # Grey Wagtail - same
-    'Motacilla alba': 'Motacilla alba',  # White Wagtail - same
-    'Ardeola grayii': 'Ardeola grayii',  # Indian Pond Heron - same
-    'Sturnia pagodarum': 'Sturnia pagodarum',  # Brahminy Starling - same
-    'Aegithina tiphia': 'Aegithina tiphia',  # Common Iora - same
-    'Cinnyris asiaticus': 'Cinnyris asiaticus',  # Purple Sunbird - same
-    'Acridotheres fuscus': 'Acridotheres fuscus',  # Jungle Myna - same
-    'Orthotomus sutorius': 'Orthotomus sutorius',  # Common Tailorbird - same
-    'Merops orientalis': 'Merops orientalis',  # Asian Green Bee-eater - same
-    'Parus cinereus': 'Parus cinereus',  # Asian Tit (Cinereous Tit) - same
-    'Leptocoma zeylonica': 'Leptocoma zeylonica',  # Purple-rumped Sunbird - same
-    'Rhipidura albogularis': 'Rhipidura albogularis',  # Spot-breasted Fantail - same
-    'Falco peregrinus': 'Falco peregrinus',  # Peregrine Falcon - same
-    'Cypsiurus balasiensis': 'Cypsiurus balasiensis',  # Asian Palm Swift - same
-    'Dendrocitta vagabunda': 'Dendrocitta vagabunda',  # Rufous Treepie - same
-    'Pseudibis papillosa': 'Pseudibis papillosa',  # Red-naped Ibis - same
-    'Alcedo atthis': 'Alcedo atthis',  # Common Kingfisher - same
-    'Motacilla maderaspatensis': 'Motacilla maderaspatensis',  # White-browed Wagtail - same
-}
-
-# Common name variants to help with matching
-COMMON_NAME_VARIANTS = {
-    'Blue Rock Pigeon': ['Rock Pigeon', 'Rock Dove', 'Common Pigeon'],
-    'Little Brown Dove': ['Laughing Dove', 'Senegal Dove', 'Palm Dove'],
-    'Asian Koel': ['Common Koel', 'Eastern Koel'],
-    'White-breasted Kingfisher': ['White-throated Kingfisher', 'Smyrna Kingfisher'],
-    'House Swift': ['Little Swift', 'Asian House Swift'],
-    'Large Grey Babbler': ['Large Gray Babbler', "Malcolm's Babbler"],
-    'Large-billed Crow': ['Jungle Crow', 'Large-billed Crow', 'Indian Jungle Crow'],
-    'House Crow': ['Indian House Crow', 'Common House Crow'],
-    'Indian Grey Hornbill': ['Indian Gray Hornbill', 'Common Grey Hornbill'],
-    'Indian Roller': ['Blue Jay', 'Northern Roller', 'European Roller'],
-    'Spotted Dove': ['Spilopelia chinensis', 'Pearl-necked Dove'],
-    'Black Drongo': ['King Crow'],
-    'Common Myna': ['Indian Myna', 'Common Mynah'],
-    'Red-vented Bulbul': ['Common Bulbul'],
-    'Oriental Magpie-Robin': ['Magpie Robin', 'Dyal Bird'],
-    'House Sparrow': ['Indian Sparrow'],
-    'Asian Koel': ['Koel', 'Common Koel'],
-    'Greater Coucal': ['Crow Pheasant', 'Common Coucal'],
-    'Red-wattled Lapwing': ['Did-he-do-it Bird'],
-    'Rose-ringed Parakeet': ['Ring-necked Parakeet'],
-    'Indian Robin': ['Black Robin', 'Indian Black Robin'],
-    'Cattle Egret': ['Buff-backed Heron'],
-    'Black Kite': ['Pariah Kite'],
-    'Shikra': ['Little Banded Goshawk'],
-    'White-breasted Waterhen': ['White-breasted Water Hen', 'Common Waterhen'],
-    'Lesser Whitethroat': ['Common Lesser Whitethroat', 'Siberian Lesser Whitethroat'],
-    'Grey-bellied Cuckoo': ['Gray-bellied Cuckoo', 'Plaintive Cuckoo'],
-    'Pied Bushchat': ['Common Pied Bushchat', 'African Pied Bushchat'],
-    'Common Hawk-Cuckoo': ['Brainfever Bird', 'Brain-fever Bird'],
-    'Mottled Wood Owl': ['Forest Spotted Owlet', 'Indian Wood Owl'],
-    'Grey Wagtail': ['Gray Wagtail', 'Mountain Wagtail'],
-    'White Wagtail': ['Pied Wagtail', 'European White Wagtail'],
-    'Indian Pond Heron': ['Paddybird', 'Pond Heron'],
-    'Brahminy Starling': ['Brahminy Myna', 'Pagoda Starling', 'Pagoda Myna'],
-    'Common Iora': ['Marshall\'s Iora', 'Yellow-naped Iora'],
-    'Purple Sunbird': ['Purple Honeysucker'],
-    'Jungle Myna': ['Indian Jungle Myna', 'Dusky Myna'],
-    'Common Tailorbird': ['Indian Tailorbird', 'Long-tailed Tailorbird'],
-    'Asian Green Bee-eater': ['Little Green Bee-eater', 'Small Green Bee-eater'],
-    'Asian Tit': ['Cinereous Tit', 'Grey Tit', 'Indian Grey Tit'],
-    'Purple-rumped Sunbird': ['Ceylon Purple-rumped Sunbird'],
-    'Spot-breasted Fantail': ['White-spotted Fantail', 'White-throated Fantail'],
-    'Peregrine Falcon': ['Duck Hawk', 'Great Falcon'],
-    'Asian Palm Swift': ['Palm Swift', 'Asian Palm-Swift'],
-    'Rufous Treepie': ['Indian Treepie', 'Rufous Tree Pie'],
-    'Red-naped Ibis': ['Indian Black Ibis', 'Black Ibis'],
-    'Common Kingfisher': ['Eurasian Kingfisher', 'River Kingfisher'],
-    'White-browed Wagtail': ['Large Pied Wagtail', 'Indian Pied Wagtail'],
-}
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import catalog
+import http_client
+from api_key import load_api_key
+import metrics
+from manifest import Manifest
+from http_archive import HttpArchive
+from response_cache import ResponseCache
+from taxonomy_cache import load_taxonomy
+from bird_names import COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES
+from image_credits import CREDIT_FIELDS, CreditsDatabase, format_credit
+from page_scanner import PageScanner
+from taxonomy_index import TaxonomyIndex
 
 # Global cache for taxonomy data
 TAXONOMY_CACHE = None
+TAXONOMY_INDEX = None
+
+# One credits database per images directory, shared by every worker
+CREDITS = {}
+
+ASSET_URL = 'https://cdn.download.ams.birds.cornell.edu/api/v1/asset/{}'
+FULL_WIDTH = 2400
+
+# Photos compared per species; 1 takes the first one on the page without scoring
+CANDIDATES = 1
+
+# Runs of characters not allowed in image filenames made from common names
+NON_SLUG = re.compile(r'[^a-z0-9]+')
 
 def fetch_taxonomy(api_key):
-    """Fetch and cache the eBird taxonomy data"""
+    """Fetch the eBird taxonomy through the shared on-disk cache"""
     global TAXONOMY_CACHE
     if (TAXONOMY_CACHE is not None):
         return TAXONOMY_CACHE
-        
-    url = "https://api.ebird.org/v2/ref/taxonomy/ebird"
-    headers = {
-        "X-eBirdApiToken": api_key
-    }
-    
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        if (response.status_code == 200):
-            TAXONOMY_CACHE = list(csv.DictReader(StringIO(response.text)))
-            return TAXONOMY_CACHE
-    except Exception as e:
-        print(f"Error fetching taxonomy: {e}")
-        return None
+
+    with metrics.stage('taxonomy'):
+        if http_client.recording():
+            # Revalidate so the archive holds the taxonomy too
+            TAXONOMY_CACHE = load_taxonomy(api_key, max_age=0)
+        else:
+            TAXONOMY_CACHE = load_taxonomy(api_key)
+    return TAXONOMY_CACHE
 
 def extract_bird_info(tex_file):
-    """Extract bird names and Latin names from the LaTeX file"""
-    with open(tex_file, 'r') as f:
-        content = f.read()
-    
-    # Find all birdentry commands
-    pattern = r'\\birdentry{([^}]*)}{\\textit{([^}]*)}'
-    matches = re.finditer(pattern, content)
-    
+    """Extract bird names and Latin names from the catalog of a LaTeX file"""
     birds = []
-    for match in matches:
-        common_name = match.group(1)
-        latin_name = match.group(2)
+    for entry in catalog.load_source(tex_file):
         # Update to current taxonomy if needed
-        current_latin_name = TAXONOMIC_UPDATES.get(latin_name, latin_name)
+        current_latin_name = TAXONOMIC_UPDATES.get(entry['latin_name'], entry['latin_name'])
         birds.append({
-            'common_name': common_name,
-            'latin_name': current_latin_name
+            'common_name': entry['name'],
+            'latin_name': current_latin_name,
+            'image': entry['image']
         })
     return birds
 
-def get_ebird_species_code(common_name, latin_name, api_key):
-    """Get the eBird species code by searching through taxonomy CSV"""
-    # Get taxonomy data from cache or fetch it
+def get_taxonomy_index(api_key):
+    """Build the taxonomy lookup index once per run"""
+    global TAXONOMY_INDEX
+    if TAXONOMY_INDEX is not None:
+        return TAXONOMY_INDEX
+
     taxonomy_data = fetch_taxonomy(api_key)
     if not taxonomy_data:
+        return None
+    TAXONOMY_INDEX = TaxonomyIndex(taxonomy_data, COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES)
+    return TAXONOMY_INDEX
+
+def get_ebird_species_code(common_name, latin_name, api_key):
+    """Get the eBird species code from the indexed taxonomy"""
+    index = get_taxonomy_index(api_key)
+    if not index:
         print("Could not fetch taxonomy data")
         return None
-        
-    try:
-        # First try scientific name match
-        for row in taxonomy_data:
-            # Check scientific name match
-            if row['SCIENTIFIC_NAME'].lower() == latin_name.lower():
-                print(f"Found match by scientific name: {row['SCIENTIFIC_NAME']}")
-                return row['SPECIES_CODE']
-        
-        # If no scientific match, try common name
-        for row in taxonomy_data:
-            if row['COMMON_NAME'].lower() == common_name.lower():
-                print(f"Found match by common name: {row['COMMON_NAME']}")
-                return row['SPECIES_CODE']
-        
-        # Try variants if available
-        if common_name in COMMON_NAME_VARIANTS:
-            for variant in COMMON_NAME_VARIANTS[common_name]:
-                for row in taxonomy_data:
-                    if row['COMMON_NAME'].lower() == variant.lower():
-                        print(f"Found match through variant: {variant}")
-                        return row['SPECIES_CODE']
-        
-        # Try genus match as last resort
-        genus = latin_name.split()[0]
-        for row in taxonomy_data:
-            if row['SCIENTIFIC_NAME'].lower().startswith(genus.lower()):
-                print(f"Found genus match: {row['SCIENTIFIC_NAME']}")
-                return row['SPECIES_CODE']
-                
-    except Exception as e:
-        print(f"Error searching taxonomy: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    print(f"No match found for {common_name} ({latin_name})")
-    return None
+
+    with metrics.stage('resolve'):
+        match = index.lookup(common_name, latin_name)
+    if not match:
+        print(f"No match found for {common_name} ({latin_name})")
+        return None
+
+    species_code, match_type, matched_name = match
+    if match_type == 'variant':
+        print(f"Found match through variant: {matched_name}")
+    else:
+        print(f"Found {match_type} match: {matched_name}")
+    return species_code
+
+def candidate_assets(url, headers):
+    """Response and the first CANDIDATES distinct asset ids of a page, reading no further than needed"""
+    scanner = PageScanner(CANDIDATES)
+    response = http_client.scan(url, scanner, headers=headers)
+    return response, scanner.ids
+
+def choose_asset(asset_ids):
+    """Score a small rendition of each candidate in parallel and return the best asset id"""
+    if len(asset_ids) == 1:
+        return asset_ids[0]
+    # numpy and Pillow are only needed when comparing candidates
+    from image_quality import THUMBNAIL_WIDTH, score_image
+
+    def score(asset_id):
+        try:
+            with metrics.stage('thumbnail'):
+                response = http_client.get(f"{ASSET_URL.format(asset_id)}/{THUMBNAIL_WIDTH}")
+                response.raise_for_status()
+            metrics.count('thumbnail_bytes', len(response.content))
+            # Decoding and the numpy metrics release the GIL, so threads score in parallel
+            with metrics.stage('score'):
+                return score_image(response.content)
+        except Exception as e:
+            print(f"Could not score asset {asset_id}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(asset_ids)) as executor:
+        scores = list(executor.map(score, asset_ids))
+    scored = [(result['score'], -position, asset_id)
+              for position, (asset_id, result) in enumerate(zip(asset_ids, scores)) if result]
+    for asset_id, result in zip(asset_ids, scores):
+        print(f"  {asset_id}: " + (', '.join(f"{name} {value:.2f}" for name, value in result.items())
+                                   if result else "not scored"))
+    if not scored:
+        return asset_ids[0]
+    # Ties go to the photo listed first on the page
+    return max(scored)[2]
 
 def get_best_image(species_code, api_key):
     """Get the best quality image for a species from eBird"""
@@ -238,20 +144,19 @@ def get_best_image(species_code, api_key):
     }
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        matches = re.findall(r'https://cdn\.download\.ams\.birds\.cornell\.edu/api/v1/asset/(\d+)', response.text)
-        print(matches)
+        with metrics.stage('scrape'):
+            response, matches = candidate_assets(url, headers)
+            response.raise_for_status()
         if matches:
-            asset_id = matches[0]
+            asset_id = choose_asset(matches)
             print(f"Found image asset: {asset_id}")
             
             details_url = f"https://search.macaulaylibrary.org/api/v1/asset/{asset_id}"
-            details_response = requests.get(details_url)
+            with metrics.stage('metadata'):
+                details_response = http_client.get(details_url)
+                details = details_response.json() if details_response.status_code == 200 else None
             
-            if details_response.status_code == 200:
-                details = details_response.json()
+            if details is not None:
                 
                 # Enhanced location formatting
                 location = "Unknown location"
@@ -269,7 +174,7 @@ def get_best_image(species_code, api_key):
                     photographer = f"{photographer} ({photographer_url})"
 
                 return {
-                    'url': f"https://cdn.download.ams.birds.cornell.edu/api/v1/asset/{asset_id}/2400",
+                    'url': f"{ASSET_URL.format(asset_id)}/{FULL_WIDTH}",
                     'photographer': photographer,
                     'date': details.get('obsDt', '').split('T')[0],  # Format date without time
                     'location': location,
@@ -280,7 +185,7 @@ def get_best_image(species_code, api_key):
             else:
                 # Fallback with basic info if details aren't available
                 return {
-                    'url': f"https://cdn.download.ams.birds.cornell.edu/api/v1/asset/{asset_id}/2400",
+                    'url': f"{ASSET_URL.format(asset_id)}/{FULL_WIDTH}",
                     'photographer': 'Unknown',
                     'date': '',  # Ensure date field exists
                     'location': 'Unknown location',
@@ -294,185 +199,396 @@ def get_best_image(species_code, api_key):
             
             # Try ML catalog search as fallback
             catalog_url = f"https://search.macaulaylibrary.org/catalog/search?taxonCode={species_code}&sort=rating_desc&mediaType=photo"
-            response = requests.get(catalog_url, headers=headers)
+            with metrics.stage('scrape'):
+                response, matches = candidate_assets(catalog_url, headers)
+                if response.status_code != 200:
+                    matches = []
             
-            if response.status_code == 200:
-                matches = re.findall(r'https://cdn\.download\.ams\.birds\.cornell\.edu/api/v1/asset/(\d+)', response.text)
-                if matches:
-                    asset_id = matches[0]
-                    print(f"Found image through catalog: {asset_id}")
-                    return {
-                        'url': f"https://cdn.download.ams.birds.cornell.edu/api/v1/asset/{asset_id}/2400",
-                        'photographer': 'Unknown',
-                        'date': '',  # Ensure date field exists
-                        'location': 'Unknown location',
-                        'catalog_id': asset_id,
-                        'rights_holder': '',  # Ensure rights_holder field exists
-                        'license': 'Macaulay Library © Cornell Lab of Ornithology'
-                    }
+            if matches:
+                asset_id = choose_asset(matches)
+                print(f"Found image through catalog: {asset_id}")
+                return {
+                    'url': f"{ASSET_URL.format(asset_id)}/{FULL_WIDTH}",
+                    'photographer': 'Unknown',
+                    'date': '',  # Ensure date field exists
+                    'location': 'Unknown location',
+                    'catalog_id': asset_id,
+                    'rights_holder': '',  # Ensure rights_holder field exists
+                    'license': 'Macaulay Library © Cornell Lab of Ornithology'
+                }
                     
     except Exception as e:
         print(f"Error getting image: {e}")
     
     return None
 
-def download_image(url, filename, credit_info):
-    """Download image and save credit information"""
+def parse_content_range(value):
+    """Return (start, total) from a Content-Range header; total is None if unknown"""
+    match = re.match(r'bytes (?:(\d+)-\d+|\*)/(\d+|\*)', value or '')
+    if not match:
+        return None, None
+    start = int(match.group(1)) if match.group(1) else None
+    total = int(match.group(2)) if match.group(2) != '*' else None
+    return start, total
+
+def part_info_file(part_filename):
+    return f"{part_filename}.json"
+
+def read_part_info(part_filename):
+    """The URL and ETag a .part file was downloaded from, or {} if unknown"""
+    try:
+        with open(part_info_file(part_filename), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def remove_part(part_filename):
+    for path in (part_filename, part_info_file(part_filename)):
+        if os.path.exists(path):
+            os.remove(path)
+
+def fetch_to_part(url, part_filename):
+    """Download url into a .part file, resuming when possible; returns (complete, etag)"""
+    with metrics.stage('download'):
+        return _fetch_to_part(url, part_filename)
+
+def _fetch_to_part(url, part_filename):
+    offset = os.path.getsize(part_filename) if os.path.exists(part_filename) else 0
+    info = read_part_info(part_filename)
+    # Only a strong ETag proves the bytes on disk belong to the image being served now
+    if offset and (info.get('url') != url or not info.get('etag') or info['etag'].startswith('W/')):
+        print("Partial download is from another image or cannot be verified, starting over")
+        remove_part(part_filename)
+        offset = 0
+    # If-Range makes the server send the whole image instead of a range if it has changed
+    headers = {'Range': f"bytes={offset}-", 'If-Range': info['etag']} if offset else {}
+    
+    with http_client.stream(url, headers=headers) as response:
+        if response.status_code == 416 and offset:
+            # Either the part file is already complete or it no longer matches
+            _, total = parse_content_range(response.headers.get('content-range'))
+            if total == offset and response.headers.get('ETag') in (None, info['etag']):
+                return True, info['etag']
+            print("Partial download is stale, starting over")
+            remove_part(part_filename)
+            return _fetch_to_part(url, part_filename)
+        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        
+        if response.status_code == 206:
+            start, total = parse_content_range(response.headers.get('content-range'))
+            if start != offset:
+                raise ValueError(f"Server resumed at byte {start}, expected {offset}")
+            print(f"Resuming download at {offset} bytes")
+            mode = 'ab'
+        else:
+            # The image changed or the server ignored the Range header, so all of it is coming again
+            if offset:
+                print("Server sent the whole image, starting over")
+            offset = 0
+            total = int(response.headers.get('content-length', 0)) or None
+            mode = 'wb'
+        
+        with open(part_info_file(part_filename), 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag}, f)
+        
+        # Save image in chunks, reporting progress at most once a second
+        downloaded = offset
+        progress = metrics.Progress(os.path.basename(part_filename), total)
+        progress.done = offset
+        print("Saving image...")
+        with open(part_filename, mode) as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if chunk:
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    progress.update(len(chunk))
+        metrics.count('bytes_downloaded', downloaded - offset)
+    
+    print(f"Downloaded {downloaded - offset} bytes")
+    if total is not None and downloaded != total:
+        print(f"Error: Got {downloaded} of {total} bytes, keeping partial download")
+        return False, etag
+    return downloaded > 0, etag
+
+def download_image(url, filename):
+    """Download an image, returning the response ETag info or None"""
+    part_filename = f"{filename}.part"
     try:
-        # Download image in chunks with progress
         print(f"Downloading from {url}")
-        with requests.get(url, stream=True) as response:
-            response.raise_for_status()
-            
-            # Get total size if available
-            file_size = int(response.headers.get('content-length', 0))
-            
-            # Save image in chunks with progress
-            downloaded = 0
-            print("Saving image...")
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if file_size > 0:
-                            percent = (downloaded / file_size) * 100
-                            print(f"Progress: {percent:.1f}%", end='\r')
-            
-            print(f"\nDownloaded {downloaded} bytes")
-            
-            # Verify the file
-            if os.path.exists(filename) and os.path.getsize(filename) > 0:
-                # Save enhanced credit information
-                credit_filename = filename.replace('.jpg', '_credit.txt')
-                credit_text = []
-                
-                # Add photographer with URL if available
-                credit_text.append(credit_info.get('photographer', 'Unknown'))
-                
-                # Add location and date if available
-                location_date = []
-                if credit_info.get('location'):
-                    location_date.append(credit_info['location'])
-                if credit_info.get('date'):  # Use get() to safely check for date
-                    location_date.append(credit_info['date'])
-                if location_date:
-                    credit_text.append(' - '.join(location_date))
-                
-                # Add attribution and license
-                if credit_info.get('rights_holder'):  # Use get() to safely check
-                    credit_text.append(f"© {credit_info['rights_holder']}")
-                credit_text.append(credit_info.get('license', 'Macaulay Library © Cornell Lab of Ornithology'))
-                credit_text.append(f"ML{credit_info['catalog_id']}")
-                
-                with open(credit_filename, 'w') as f:
-                    f.write('\n'.join(credit_text))
-                return True
-            else:
-                print("Error: Downloaded file is empty or missing")
-                if os.path.exists(filename):
-                    os.remove(filename)
-                return False
+        complete, etag = fetch_to_part(url, part_filename)
+        if not complete:
+            print("Error: Downloaded file is incomplete or empty")
+            return None
+        
+        # Only complete images ever appear under their final name
+        os.replace(part_filename, filename)
+        remove_part(part_filename)
+        return {'etag': etag}
                 
     except Exception as e:
         print(f"Error downloading image: {e}")
-        if os.path.exists(filename):
-            os.remove(filename)
+        if os.path.exists(part_filename):
+            print("Keeping partial download for the next run")
+        return None
+
+def image_name_for(bird):
+    """Image filename used for a bird in images/: the guide's own name, or one made like it"""
+    if bird.get('image'):
+        return bird['image']
+    # Slash and hybrid taxa like "Common/Jungle Myna" must not become subdirectories
+    name = unicodedata.normalize('NFKD', bird['common_name']).encode('ascii', 'ignore').decode('ascii')
+    slug = NON_SLUG.sub('-', name.lower().replace("'", '')).strip('-')
+    return f"{slug or bird.get('species_code') or 'bird'}.jpg"
+
+def get_credits(images_dir):
+    """The credits database for an images directory, loaded once per run"""
+    key = Path(images_dir).resolve()
+    if key not in CREDITS:
+        CREDITS[key] = CreditsDatabase(images_dir)
+    return CREDITS[key]
+
+def recorded_catalog_id(entry, credit_lines):
+    """Macaulay asset id of the image on disk, from the manifest or its recorded credit"""
+    if entry and entry.get('catalog_id'):
+        return entry['catalog_id']
+    for line in credit_lines or ():
+        match = re.fullmatch(r'ML(\d+)', line)
+        if match:
+            return match.group(1)
+    return None
+
+def is_up_to_date(bird, images_dir, manifest):
+    """Check a bird against the manifest without touching the network"""
+    image_name = image_name_for(bird)
+    if not manifest.is_current(image_name, bird, images_dir):
         return False
+    
+    credits = get_credits(images_dir)
+    if image_name not in credits:
+        entry = manifest.get(image_name)
+        credits.record(image_name, format_credit(entry['credit']))
+        print(f"Restored credit for {bird['common_name']} from manifest")
+    return True
 
-def main():
-    """Main function to download images and generate credit files"""
-    # Set to True to regenerate credit files even if images exist
-    download_credit = True
+def process_bird(bird, images_dir, api_key, manifest):
+    """Fetch the image and credit for one bird, returning (success, failure_reason)"""
+    image_name = image_name_for(bird)
+    image_filename = images_dir / image_name
+    credits = get_credits(images_dir)
     
-    workspace_root = Path(__file__).parent.parent
-    api_key = getpass("Enter your eBird API key: ")
+    # Get species code, unless the species list already supplied it
+    species_code = bird.get('species_code') or get_ebird_species_code(bird['common_name'], bird['latin_name'], api_key)
+    if not species_code:
+        print(f"Could not find species code for {bird['latin_name']}")
+        return False, "No species code found"
     
+    # Get best image info
+    image_info = get_best_image(species_code, api_key)
+    if not image_info:
+        print(f"Could not find image info for {bird['common_name']}")
+        return False, "No image found"
+    
+    entry = manifest.get(image_name)
+    etag = entry.get('etag') if entry else None
+    current_id = recorded_catalog_id(entry, credits.get(image_name)) if image_filename.exists() else None
+    
+    if current_id != image_info['catalog_id'] or http_client.recording():
+        # Missing image, or the species page now features a different photo.
+        # Recordings fetch every image so they can be replayed from scratch.
+        result = download_image(image_info['url'], str(image_filename))
+        if not result:
+            print(f"Failed to download image for {bird['common_name']}")
+            return False, "Download failed"
+        etag = result['etag']
+        print(f"Successfully downloaded image for {bird['common_name']}")
+
+    # A new photo, or the same one whose credit may have changed
+    try:
+        credits.record(image_name, format_credit(image_info))
+    except Exception as e:
+        print(f"Error saving credit: {e}")
+        return False, "Credit update failed"
+    
+    manifest.record(
+        image_name, image_filename,
+        common_name=bird['common_name'],
+        latin_name=bird['latin_name'],
+        species_code=species_code,
+        catalog_id=image_info['catalog_id'],
+        url=image_info['url'],
+        etag=etag,
+        credit={field: image_info.get(field, '') for field in CREDIT_FIELDS},
+    )
+    return True, None
+
+def finish_run(args, archive=None):
+    """Print the stage summary, write the requested metrics and profiles, and close any archive"""
+    if archive:
+        archive.close()
+        print(f"{'Recorded' if args.record else 'Replayed'} {len(archive)} responses: {archive.path}")
+    print(metrics.METRICS.report())
+    if args.metrics:
+        metrics.METRICS.write(args.metrics)
+    metrics.METRICS.write_profiles()
+
+def parse_host_limit(value):
+    """Parse a HOST=N command line option"""
+    host, _, limit = value.partition('=')
+    if not host or not limit.isdigit() or int(limit) < 1:
+        raise argparse.ArgumentTypeError(f"expected HOST=N, got {value!r}")
+    return host, int(limit)
+
+def main(argv=None):
+    """Main function to download images and record their credits"""
+    global CANDIDATES
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of birds to process concurrently (default: 1)")
+    parser.add_argument('--host-limit', type=parse_host_limit, action='append', default=[],
+                        metavar='HOST=N', help="Maximum concurrent requests to HOST")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Re-check every bird online, ignoring the manifest")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Do not use the on-disk HTTP response cache")
+    parser.add_argument('--cache-only', action='store_true',
+                        help="Serve every request from the response cache and never go online")
+    parser.add_argument('--metrics', type=Path, metavar='FILE',
+                        help="Write a run summary as JSON, or Prometheus text if FILE ends in .prom")
+    parser.add_argument('--profile', type=Path, metavar='DIR',
+                        help="Write cProfile statistics and allocation sites per stage to DIR")
+    parser.add_argument('--api-key-file', type=Path, metavar='FILE',
+                        help="Read the eBird API key from FILE when EBIRD_API_KEY is unset")
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument('--record', type=Path, metavar='ARCHIVE',
+                               help="Process every bird online and record all responses into ARCHIVE (.zip)")
+    archive_group.add_argument('--replay', type=Path, metavar='ARCHIVE',
+                               help="Process every bird from a recorded ARCHIVE, without any network access")
+    parser.add_argument('--candidates', type=int, default=CANDIDATES, metavar='N',
+                        help="Score thumbnails of the first N photos per species and download only the best "
+                             f"(default: {CANDIDATES}, the first photo)")
+    parser.add_argument('--species-list', type=Path, metavar='CSV',
+                        help="Fetch every species in CSV instead of the guide's birds, resumably")
+    parser.add_argument('--output-dir', type=Path,
+                        help="Where --species-list and --queue images go (default: images/bulk)")
+    parser.add_argument('--queue', type=Path, metavar='DB',
+                        help="Lease species from a job table shared with other workers and machines; "
+                             "--species-list adds its species to the table first")
+    parser.add_argument('--retry-failed', action='store_true',
+                        help="With --queue, give species that failed for good another set of attempts")
+    args = parser.parse_args(argv)
+
+    CANDIDATES = max(1, args.candidates)
+
+    if args.profile:
+        metrics.METRICS.enable_profiling(args.profile)
+
+    for host, limit in args.host_limit:
+        http_client.set_host_limit(host, limit)
+    if args.no_cache:
+        http_client.set_response_cache(None)
+    elif args.cache_only:
+        http_client.set_response_cache(ResponseCache(cache_only=True))
+
+    archive = None
+    if args.record or args.replay:
+        archive = HttpArchive(args.record or args.replay, 'record' if args.record else 'replay')
+        http_client.set_archive(archive)
+        # Skipping up-to-date birds would leave them out of the run
+        args.refresh = True
+
+    workspace_root = Path(__file__).parent.parent
+
+    if args.queue:
+        # Imported here because bulk_download imports this module
+        from bulk_download import bird_key, read_species_list, run_queue
+        from work_queue import WorkQueue
+        output_dir = args.output_dir or workspace_root / 'images' / 'bulk'
+        queue = WorkQueue(args.queue)
+        if args.species_list:
+            added = queue.add((bird_key(bird), bird) for bird in read_species_list(args.species_list))
+            print(f"Added {added} species to {args.queue}")
+        if args.retry_failed:
+            print(f"Requeued {queue.retry_failed()} failed species")
+        api_key = 'replay' if args.replay else load_api_key(args.api_key_file)
+        counts = run_queue(queue, output_dir, api_key, args.workers)
+        print(f"\n{counts.get('done', 0)} done, {counts.get('failed', 0)} failed, "
+              f"{counts.get('pending', 0) + counts.get('leased', 0)} still queued")
+        for key, reason in queue.failures():
+            print(f"  {key}: {reason}")
+        finish_run(args, archive)
+        if counts.get('failed'):
+            raise SystemExit(1)
+        return
+
+    if args.species_list:
+        # Imported here because bulk_download imports this module
+        from bulk_download import read_species_list, run_bulk
+        output_dir = args.output_dir or workspace_root / 'images' / 'bulk'
+        api_key = 'replay' if args.replay else load_api_key(args.api_key_file)
+        succeeded, failed, skipped = run_bulk(read_species_list(args.species_list), output_dir,
+                                              api_key, args.workers, args.refresh)
+        print(f"\n{succeeded} downloaded, {failed} failed, {skipped} already done")
+        finish_run(args, archive)
+        if failed:
+            raise SystemExit(1)
+        return
+
     images_dir = workspace_root / 'images'
     images_dir.mkdir(exist_ok=True)
+    manifest = Manifest(images_dir / 'manifest.json')
     
     tex_file = workspace_root / 'latex' / 'bird_guide.tex'
     birds = extract_bird_info(tex_file)
     
     total_birds = len(birds)
-    success_count = 0
     failed_birds = []
-    
-    for i, bird in enumerate(birds, 1):
-        print(f"Processing {bird['common_name']} ({i}/{total_birds})...")
-        
-        image_filename = images_dir / f"{bird['common_name'].lower().replace(' ', '-')}.jpg"
-        credit_filename = images_dir / f"{bird['common_name'].lower().replace(' ', '-')}_credit.txt"
-        credit_needed = download_credit or not credit_filename.exists()
-        
-        if image_filename.exists() and not credit_needed:
-            print(f"Image and credit exist for {bird['common_name']}, skipping.")
+
+    # Birds whose manifest entry still matches the files on disk need no network at all
+    if args.refresh:
+        stale_birds = birds
+    else:
+        stale_birds = [bird for bird in birds if not is_up_to_date(bird, images_dir, manifest)]
+    success_count = total_birds - len(stale_birds)
+    print(f"{success_count}/{total_birds} birds are up to date")
+    manifest.save()
+    if not stale_birds:
+        finish_run(args, archive)
+        return
+
+    # Replayed responses never carry the key, so none is needed
+    api_key = 'replay' if args.replay else load_api_key(args.api_key_file)
+
+    # Build the taxonomy index up front so workers never race to fetch it
+    get_taxonomy_index(api_key)
+
+    def run(numbered_bird):
+        i, bird = numbered_bird
+        print(f"Processing {bird['common_name']} ({i}/{len(stale_birds)})...")
+        return process_bird(bird, images_dir, api_key, manifest)
+
+    if args.workers > 1:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            # map() yields in submission order, keeping the summary deterministic
+            results = list(executor.map(run, enumerate(stale_birds, 1)))
+    else:
+        results = [run(numbered_bird) for numbered_bird in enumerate(stale_birds, 1)]
+
+    for bird, (success, reason) in zip(stale_birds, results):
+        if success:
             success_count += 1
-            continue
-            
-        # Get species code
-        species_code = get_ebird_species_code(bird['common_name'], bird['latin_name'], api_key)
-        if not species_code:
-            print(f"Could not find species code for {bird['latin_name']}")
-            failed_birds.append((bird['common_name'], "No species code found"))
-            continue
-        
-        # Get best image info
-        image_info = get_best_image(species_code, api_key)
-        if not image_info:
-            print(f"Could not find image info for {bird['common_name']}")
-            failed_birds.append((bird['common_name'], "No image found"))
-            continue
-            
-        if not image_filename.exists():
-            # Need to download image and create credit
-            if download_image(image_info['url'], str(image_filename), image_info):
-                print(f"Successfully downloaded image and credit for {bird['common_name']}")
-                success_count += 1
-            else:
-                print(f"Failed to download image for {bird['common_name']}")
-                failed_birds.append((bird['common_name'], "Download failed"))
-        elif credit_needed:
-            # Only create credit file
-            try:
-                # Get fresh image info for credit update
-                species_code = get_ebird_species_code(bird['common_name'], bird['latin_name'], api_key)
-                if not species_code:
-                    print(f"Could not find species code for credit update: {bird['common_name']}")
-                    continue
-                    
-                image_info = get_best_image(species_code, api_key)
-                if not image_info:
-                    print(f"Could not find image info for credit update: {bird['common_name']}")
-                    continue
-                
-                credit_text = []
-                if image_info['photographer'] != 'Unknown':
-                    credit_text.append(image_info['photographer'])
-                
-                location_date = []
-                if image_info['location'] != 'Unknown location':
-                    location_date.append(image_info['location'])
-                if image_info['date']:
-                    location_date.append(image_info['date'])
-                if location_date:
-                    credit_text.append(' - '.join(location_date))
-                
-                if image_info['rights_holder']:
-                    credit_text.append(f"© {image_info['rights_holder']}")
-                credit_text.append(image_info['license'])
-                credit_text.append(f"ML{image_info['catalog_id']}")
-                
-                with open(credit_filename, 'w') as f:
-                    f.write('\n'.join(filter(None, credit_text)))
-                print(f"Successfully created credit file for {bird['common_name']}")
-                success_count += 1
-            except Exception as e:
-                print(f"Error creating credit file: {e}")
-                failed_birds.append((bird['common_name'], "Credit file creation failed"))
+        elif reason:
+            failed_birds.append((bird['common_name'], reason))
 
-    # Special case for Cattle Egret handled similarly
-    # ...rest of existing code...
+    print(f"\nProcessed {success_count}/{total_birds} birds successfully")
+    if failed_birds:
+        print("Failed birds:")
+        for common_name, reason in failed_birds:
+            print(f"  {common_name}: {reason}")
+    finish_run(args, archive)
+    # A non-zero status lets cron and batch jobs notice failed birds
+    if success_count < total_birds:
+        raise SystemExit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,95 @@
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+# Accents on Latin letters; other scripts' combining signs, such as Devanagari vowel signs, are kept
+LATIN_ACCENTS = re.compile('[\u0300-\u036f]')
+APOSTROPHES = re.compile("['\u2019\u02bc]")
+
+
+def normalize(name):
+    """Lowercase unaccented form of a name with punctuation folded to single spaces"""
+    if name.isascii():
+        return NON_ALPHANUMERIC.sub(' ', name.lower().replace("'", '')).strip()
+    name = APOSTROPHES.sub('', unicodedata.normalize('NFKD', name.lower()))
+    name = unicodedata.normalize('NFC', LATIN_ACCENTS.sub('', name))
+    # Letters, marks and digits of any script make up words; everything else separates them
+    return ' '.join(''.join(c if unicodedata.category(c)[0] in 'LMN' else ' ' for c in name).split())
+
+
+def trigrams(name):
+    """Distinct trigrams of a normalized name, padded so word starts and ends count"""
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramMatcher:
+    """Ranked approximate lookup of names through an inverted trigram index.
+
+    Candidates are scored by the Dice coefficient of their trigram sets. A
+    name scoring at least t must share c >= t * |query| / (2 - t) trigrams
+    with the query, so it appears in at least one of the |query| - c + 1
+    rarest query trigrams; only those posting lists are read, which skips
+    the long lists of common trigrams like "ed " entirely. Hits in the rare
+    lists plus the number of skipped lists bound each candidate's score, so
+    most candidates are discarded before their trigrams are compared.
+    """
+
+    def __init__(self, names=()):
+        self.names = []
+        self.values = []
+        self.grams = []
+        self.sizes = []
+        self.postings = {}
+        self.exact = {}
+        for name, value in names:
+            self.add(name, value)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, value):
+        key = normalize(name)
+        if not key or key in self.exact:
+            return
+        number = len(self.names)
+        grams = trigrams(key)
+        self.names.append(name)
+        self.values.append(value)
+        self.grams.append(tuple(grams))
+        self.sizes.append(len(grams))
+        self.exact[key] = number
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(number)
+
+    def search(self, query, limit=5, threshold=0.5):
+        """Best matches as (score, name, value), highest score first"""
+        key = normalize(query)
+        if not key:
+            return []
+        number = self.exact.get(key)
+        if number is not None:
+            return [(1.0, self.names[number], self.values[number])]
+
+        grams = trigrams(key)
+        needed = max(1, math.ceil(threshold * len(grams) / (2 - threshold) - 1e-9))
+        postings = sorted((self.postings.get(gram, ()) for gram in grams), key=len)
+        skipped = needed - 1
+        shared = Counter()
+        for posting in postings[:len(grams) - skipped]:
+            shared.update(posting)
+
+        scored = []
+        for number, count in shared.items():
+            size = self.sizes[number]
+            if 2 * (count + skipped) < threshold * (len(grams) + size):
+                continue
+            score = 2 * len(grams.intersection(self.grams[number])) / (len(grams) + size)
+            if score >= threshold:
+                scored.append((score, number))
+        best = heapq.nlargest(limit, scored)
+        return [(round(score, 3), self.names[number], self.values[number]) for score, number in best]
@@ -1,42 +1,33 @@
 #!/usr/bin/env python3
-import requests
-from getpass import getpass
-import csv
-from io import StringIO
 from pathlib import Path
+import argparse
 import os
-import re
 
-def get_species_code(api_key, species="Shikra", scientific_name="Accipiter badius"):
-    """Test getting species code using eBird's taxonomy API"""
-    print(f"Looking up code for {species} ({scientific_name})")
-    
-    # Use the JSON format of taxonomy
-    url = "https://api.ebird.org/v2/ref/taxonomy/ebird?fmt=json"
-    headers = {
-        "X-eBirdApiToken": api_key
-    }
+import http_client
+import metrics
+from api_key import load_api_key
+from download_ebird_images import download_image as fetch_image, image_name_for
+from image_credits import CreditsDatabase
+from page_scanner import PageScanner
+from taxonomy_cache import load_taxonomy
+
+def get_species_code(taxonomy, species, scientific_name=None):
+    """Look up a species code by exact common or scientific name in the cached eBird taxonomy"""
+    scientific_name = scientific_name or species
+    print(f"Looking up code for {species}")
     
     try:
-        print("\nQuerying eBird taxonomy...")
-        response = requests.get(url, headers=headers)
-        print(f"Response status: {response.status_code}")
+        # Try exact matches first
+        for entry in taxonomy:
+            if entry['SCIENTIFIC_NAME'].lower() == scientific_name.lower() or entry['COMMON_NAME'].lower() == species.lower():
+                print(f"\nFound match:")
+                print(f"Code: {entry['SPECIES_CODE']}")
+                print(f"Scientific name: {entry['SCIENTIFIC_NAME']}")
+                print(f"Common name: {entry['COMMON_NAME']}")
+                return entry['SPECIES_CODE']
         
-        if response.status_code == 200:
-            species_list = response.json()
-            print(f"Retrieved {len(species_list)} species entries")
-            
-            # Try exact matches first
-            for entry in species_list:
-                if entry['sciName'].lower() == scientific_name.lower() or entry['comName'].lower() == species.lower():
-                    print(f"\nFound match:")
-                    print(f"Code: {entry['speciesCode']}")
-                    print(f"Scientific name: {entry['sciName']}")
-                    print(f"Common name: {entry['comName']}")
-                    return entry['speciesCode']
-            
-            print("\n✗ No exact match found")
-            return None
+        print("\n✗ No exact match found")
+        return None
             
     except Exception as e:
         print(f"\n✗ Error: {str(e)}")
@@ -57,19 +48,22 @@ def get_best_image(api_key, species_code):
     
     try:
         print("Getting species page...")
-        response = requests.get(url, headers=headers)
+        # Only the first image is used, so stop reading the page once it turns up
+        scanner = PageScanner()
+        with metrics.stage('scrape'):
+            response = http_client.scan(url, scanner, headers=headers)
         print(f"Response status: {response.status_code}")
         
         if response.status_code == 200:
-            # Look for the main image URL in the HTML
-            matches = re.findall(r'https://cdn\.download\.ams\.birds\.cornell\.edu/api/v1/asset/(\d+)', response.text)
+            matches = scanner.ids
             if matches:
                 asset_id = matches[0]  # Take the first image
                 print(f"Found asset ID: {asset_id}")
                 
                 # Get the image details from ML
                 details_url = f"https://search.macaulaylibrary.org/api/v1/asset/{asset_id}"
-                details_response = requests.get(details_url)
+                with metrics.stage('metadata'):
+                    details_response = http_client.get(details_url)
                 
                 if details_response.status_code == 200:
                     details = details_response.json()
@@ -97,10 +91,12 @@ def get_best_image(api_key, species_code):
                 
                 # Try ML catalog search as fallback
                 catalog_url = f"https://search.macaulaylibrary.org/catalog/search?taxonCode={species_code}&sort=rating_desc&mediaType=photo"
-                response = requests.get(catalog_url, headers=headers)
+                scanner = PageScanner()
+                with metrics.stage('scrape'):
+                    response = http_client.scan(catalog_url, scanner, headers=headers)
                 
                 if response.status_code == 200:
-                    matches = re.findall(r'https://cdn\.download\.ams\.birds\.cornell\.edu/api/v1/asset/(\d+)', response.text)
+                    matches = scanner.ids
                     if matches:
                         asset_id = matches[0]
                         print(f"Found image through catalog: {asset_id}")
@@ -124,119 +120,109 @@ def download_image(url, filename, credit_info):
     """Download the image and save credit information"""
     print(f"\nDownloading image to: {filename}")
     
+    # Same resumable .part file and rename as download_ebird_images, so an
+    # interrupted run never leaves a truncated image under its final name
+    if not fetch_image(url, filename):
+        print("✗ Error: Download did not complete; rerun to resume it")
+        return False
+    print(f"Final file size: {os.path.getsize(filename)} bytes")
+    
     try:
-        # Download image in chunks with progress
-        print(f"Requesting URL: {url}")
-        with requests.get(url, stream=True) as response:
-            print(f"Response status: {response.status_code}")
-            print(f"Content type: {response.headers.get('content-type', 'unknown')}")
-            print(f"Content length: {response.headers.get('content-length', 'unknown')} bytes")
-            
-            response.raise_for_status()
-            
-            # Save image in chunks with progress
-            file_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
-            
-            print("\nSaving image...")
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if file_size > 0:
-                            percent = (downloaded / file_size) * 100
-                            print(f"Progress: {percent:.1f}% ({downloaded}/{file_size} bytes)", end='\r')
-            
-            if file_size > 0:
-                print(f"\nDownloaded: {downloaded}/{file_size} bytes ({(downloaded/file_size)*100:.1f}%)")
-            else:
-                print(f"\nDownloaded: {downloaded} bytes")
-        
-        # Verify the downloaded file
-        if not os.path.exists(filename):
-            print("✗ Error: File was not created")
-            return False
-            
-        file_size = os.path.getsize(filename)
-        if file_size == 0:
-            print("✗ Error: Downloaded file is empty")
-            return False
-            
-        print(f"Final file size: {file_size} bytes")
-        
         # Save credit information
-        credit_filename = filename.replace('.jpg', '_credit.txt')
         credit_text = (
             f"{credit_info['photographer']} - {credit_info['location']}\n"
             f"{credit_info['license']}\n"
             f"ML{credit_info['catalog_id']}"
         )
-        with open(credit_filename, 'w') as f:
-            f.write(credit_text)
+        CreditsDatabase(Path(filename).parent).record(Path(filename).name, credit_text)
             
         print("✓ Successfully saved image and credit info")
         return True
         
     except Exception as e:
-        print(f"\n✗ Error downloading image: {str(e)}")
+        print(f"\n✗ Error saving credit: {str(e)}")
         import traceback
         traceback.print_exc()
-        
-        # Try to clean up partial downloads
-        if os.path.exists(filename):
-            try:
-                os.remove(filename)
-                print("Cleaned up partial download")
-            except:
-                pass
         return False
 
-def main():
+def main(argv=None):
+    """Look up eBird species codes and optionally download an image for each species"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('species', nargs='*',
+                        help="Common or scientific names to look up (default: test Shikra end to end)")
+    parser.add_argument('--expect', metavar='CODE', action='append',
+                        help="Expected code for each species, in order, to validate the lookup")
+    parser.add_argument('--download', action='store_true',
+                        help="Also download an image and record its credit for every species found")
+    parser.add_argument('--api-key-file', type=Path, metavar='FILE',
+                        help="Read the eBird API key from FILE when EBIRD_API_KEY is unset")
+    args = parser.parse_args(argv)
+    if not args.species:
+        args.species = ['Shikra']
+        args.expect = args.expect or ['shikra1']
+        args.download = True
+
     print("=" * 60)
     print("eBird Species Code and Image Download Test")
-    print("Target: Shikra (Accipiter badius)")
-    print("Expected code: shikra1")
+    print(f"Targets: {', '.join(args.species)}")
     print("=" * 60)
     
-    api_key = getpass("\nEnter your eBird API key: ")
-    print("\nStarting lookup...")
-    
-    # Get species code
-    code = get_species_code(api_key)
-    
-    if code:
+    api_key = load_api_key(args.api_key_file)
+    print("\nLoading eBird taxonomy...")
+    with metrics.stage('taxonomy'):
+        taxonomy = load_taxonomy(api_key)
+    if not taxonomy:
+        print("\n✗ Could not load the eBird taxonomy")
+        print("\nTroubleshooting tips:")
+        print("1. Check your API key at https://ebird.org/api/keygen")
+        print("2. Try accessing https://api.ebird.org/v2/ref/taxonomy/ebird directly")
+        raise SystemExit(1)
+    print(f"Retrieved {len(taxonomy)} species entries")
+
+    expected = args.expect or []
+    failures = 0
+    for number, species in enumerate(args.species):
+        print("\n" + "-" * 60)
+        code = get_species_code(taxonomy, species)
+        if not code:
+            print(f"\n✗ Could not find species code for {species}")
+            failures += 1
+            continue
         print(f"\nFound species code: {code}")
-        if code == 'shikra1':
+        if number < len(expected):
+            if code != expected[number]:
+                print(f"\n✗ Retrieved incorrect species code, expected {expected[number]}")
+                failures += 1
+                continue
             print("✓ Code validation passed")
-            
-            # Try to get image
-            image_info = get_best_image(api_key, code)
-            if image_info:
-                print("\nFound image, attempting download...")
-                
-                # Create images directory if it doesn't exist
-                images_dir = Path(__file__).parent.parent / 'images'
-                images_dir.mkdir(exist_ok=True)
-                
-                # Download image
-                image_filename = images_dir / "shikra.jpg"
-                if download_image(image_info['url'], str(image_filename), image_info):
-                    print("\n✓ Successfully downloaded image")
-                else:
-                    print("\n✗ Failed to download image")
-            else:
-                print("\n✗ Could not find suitable image")
+        if not args.download:
+            continue
+
+        # Try to get image
+        image_info = get_best_image(api_key, code)
+        if not image_info:
+            print("\n✗ Could not find suitable image")
+            failures += 1
+            continue
+        print("\nFound image, attempting download...")
+        
+        # Create images directory if it doesn't exist
+        images_dir = Path(__file__).parent.parent / 'images'
+        images_dir.mkdir(exist_ok=True)
+        
+        # Name the file the way the guide and download_ebird_images do, from the eBird common name
+        common_name = next(entry['COMMON_NAME'] for entry in taxonomy if entry['SPECIES_CODE'] == code)
+        image_filename = images_dir / image_name_for({'common_name': common_name, 'species_code': code})
+        if download_image(image_info['url'], str(image_filename), image_info):
+            print("\n✓ Successfully downloaded image")
         else:
-            print("\n✗ Retrieved incorrect species code")
-    else:
-        print("\n✗ Could not find species code")
-        print("\nTroubleshooting tips:")
-        print("1. Check your API key at https://ebird.org/api/keygen")
-        print("2. Try searching for Shikra at https://ebird.org/species")
-        print("3. Try accessing https://api.ebird.org/v2/ref/taxonomy/ebird directly")
+            print("\n✗ Failed to download image")
+            failures += 1
     print("=" * 60)
+    print(f"{len(args.species) - failures}/{len(args.species)} species succeeded")
+    print(metrics.METRICS.report())
+    if failures:
+        raise SystemExit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+ARCHIVE_VERSION = 1
+INDEX_NAME = 'responses.json'
+
+# Request headers dropped while recording: credentials must never reach the
+# archive, and conditional or partial requests would record bodies that only
+# make sense next to a particular local cache or .part file.
+UNRECORDED_HEADERS = {'x-ebirdapitoken', 'range', 'if-range', 'if-none-match', 'if-modified-since', 'authorization'}
+
+# Bodies that are already compressed are stored as they are
+STORED_TYPES = ('image/', 'video/', 'audio/', 'application/zip', 'application/gzip')
+
+
+class ArchiveMiss(requests.RequestException):
+    """Raised in replay mode for a request that was never recorded"""
+
+
+def recordable_headers(headers):
+    return {name: value for name, value in (headers or {}).items() if name.lower() not in UNRECORDED_HEADERS}
+
+
+class HttpArchive:
+    """Zip archive of recorded HTTP responses, written in record mode and served back in replay mode.
+
+    Responses are indexed by method and URL in responses.json; bodies are
+    stored once per sha256 under bodies/. A URL requested several times
+    replays its recordings in order, repeating the last one. Replayed bodies
+    are read from the zip as the caller consumes them, so only the index is
+    held in memory however large the recording.
+    """
+
+    def __init__(self, path, mode='replay'):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"mode must be 'record' or 'replay', not {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.stored = set()
+        self.replayed = {}
+        if mode == 'record':
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.tmp_path = self.path.with_name(self.path.name + '.tmp')
+            self.zip = zipfile.ZipFile(self.tmp_path, 'w')
+            self.index = []
+        else:
+            self.zip = zipfile.ZipFile(self.path, 'r')
+            data = json.loads(self.zip.read(INDEX_NAME))
+            if data.get('version') != ARCHIVE_VERSION:
+                raise ValueError(f"{self.path} is not a version {ARCHIVE_VERSION} archive")
+            for entry in data['responses']:
+                self.entries.setdefault((entry['method'], entry['url']), []).append(entry)
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.entries.values())
+
+    def record(self, method, url, response):
+        """Add a response to the archive, reading its body if it was streamed"""
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        # requests has already decoded the body, so describe what is stored
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in ('content-encoding', 'content-length')}
+        if 'Content-Length' in response.headers:
+            headers['Content-Length'] = str(len(body))
+        entry = {
+            'method': method,
+            'url': url,
+            'status': response.status_code,
+            'headers': headers,
+            'encoding': response.encoding,
+            'body': digest,
+        }
+        content_type = response.headers.get('Content-Type', '')
+        compression = zipfile.ZIP_STORED if content_type.startswith(STORED_TYPES) else zipfile.ZIP_DEFLATED
+        with self.lock:
+            if digest not in self.stored:
+                self.zip.writestr(f"bodies/{digest}", body, compress_type=compression)
+                self.stored.add(digest)
+            self.index.append(entry)
+            self.entries.setdefault((method, url), []).append(entry)
+
+    def replay(self, method, url):
+        """Recorded response for a request, its body read from the archive on demand"""
+        with self.lock:
+            entries = self.entries.get((method, url))
+            if not entries:
+                raise ArchiveMiss(f"Not in archive {self.path}: {method} {url}")
+            number = self.replayed.get((method, url), 0)
+            self.replayed[(method, url)] = number + 1
+            entry = entries[min(number, len(entries) - 1)]
+            # Members of a zip opened for reading can be read from several threads at once
+            raw = self.zip.open(f"bodies/{entry['body']}")
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = url
+        response.encoding = entry.get('encoding')
+        # iter_content() and .content read from raw like a live streamed response
+        response.raw = raw
+        return response
+
+    def close(self):
+        """Finish the archive; a recording only replaces the file once it is complete"""
+        with self.lock:
+            if self.mode == 'record':
+                data = {'version': ARCHIVE_VERSION, 'responses': self.index}
+                self.zip.writestr(INDEX_NAME, json.dumps(data, ensure_ascii=False, indent=1),
+                                  compress_type=zipfile.ZIP_DEFLATED)
+                self.zip.close()
+                os.replace(self.tmp_path, self.path)
+            else:
+                self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
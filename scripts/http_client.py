@@ -0,0 +1,259 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+from http_archive import recordable_headers
+from page_scanner import CHUNK_SIZE
+from response_cache import CacheMiss, ResponseCache
+
+# Maximum simultaneous requests per host when running concurrently
+HOST_LIMITS = {
+    'api.ebird.org': 2,
+    'ebird.org': 4,
+    'search.macaulaylibrary.org': 4,
+    'cdn.download.ams.birds.cornell.edu': 6,
+}
+DEFAULT_HOST_LIMIT = 4
+
+# (connect, read) timeouts in seconds for every request
+TIMEOUT = (10, 60)
+
+# Retry policy for transient failures
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+RETRY_AFTER_MAX = 120.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Hosts whose requests are sent elsewhere, e.g. to a local stand-in server
+HOST_OVERRIDES = {}
+
+_semaphores = {}
+_semaphores_lock = threading.Lock()
+_session = None
+_session_lock = threading.Lock()
+_response_cache = ResponseCache()
+_archive = None
+
+
+def set_host_limit(host, limit):
+    """Override the concurrency limit for a host before any request is made"""
+    with _semaphores_lock:
+        HOST_LIMITS[host] = limit
+        _semaphores.pop(host, None)
+
+
+def _semaphore(host):
+    with _semaphores_lock:
+        semaphore = _semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+            _semaphores[host] = semaphore
+        return semaphore
+
+
+@contextmanager
+def host_slot(url):
+    """Hold one of the host's concurrency slots for the duration of a request"""
+    semaphore = _semaphore(urlsplit(url).hostname or '')
+    with semaphore:
+        yield
+
+
+def set_host_override(host, base_url):
+    """Send requests for host to base_url (scheme://host:port) instead; None removes it"""
+    if base_url is None:
+        HOST_OVERRIDES.pop(host, None)
+    else:
+        HOST_OVERRIDES[host] = base_url
+
+
+def _route(url):
+    parts = urlsplit(url)
+    base_url = HOST_OVERRIDES.get(parts.hostname)
+    if not base_url:
+        return url
+    base = urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+
+def set_response_cache(cache):
+    """Replace the response cache; None disables caching"""
+    global _response_cache
+    _response_cache = cache
+
+
+def set_archive(archive):
+    """Record every response into an HttpArchive, or serve them from it in replay mode; None stops"""
+    global _archive
+    _archive = archive
+
+
+def recording():
+    return _archive is not None and not _archive.replaying
+
+
+def _archived(url, **kwargs):
+    """Replay a GET from the archive, or send it and record the response"""
+    archive = _archive
+    if archive.replaying:
+        metrics.count('archive_replays')
+        return archive.replay('GET', url)
+    # Recording needs the network. The response cache is filled but never
+    # read, so the archive still sees every request.
+    _check_online(url)
+    kwargs['headers'] = recordable_headers(kwargs.get('headers'))
+    with host_slot(url):
+        response = _send('GET', url, **kwargs)
+        archive.record('GET', url, response)
+    if _response_cache is not None:
+        _response_cache.put(url, response)
+    return response
+
+
+def _check_online(url):
+    if _response_cache is not None and _response_cache.cache_only:
+        raise CacheMiss(f"Not cached and running cache-only: {url}")
+
+
+def session():
+    """Shared keep-alive session with one connection pool per host"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = max([DEFAULT_HOST_LIMIT, *HOST_LIMITS.values()])
+            adapter = HTTPAdapter(pool_connections=len(HOST_LIMITS) + 1, pool_maxsize=pool_size)
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def retry_after_delay(response):
+    """Seconds requested by a Retry-After header, or None"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), RETRY_AFTER_MAX)
+
+
+def _send(method, url, **kwargs):
+    kwargs.setdefault('timeout', TIMEOUT)
+    for attempt in range(MAX_RETRIES + 1):
+        metrics.count('http_requests')
+        try:
+            response = session().request(method, _route(url), **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            delay = retry_after_delay(response)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            response.close()
+            print(f"Got HTTP {response.status_code} from {url}, retrying in {delay:.1f}s")
+        metrics.count('http_retries')
+        time.sleep(delay)
+
+
+def get(url, **kwargs):
+    """GET through the response cache and shared session, with per-host limits, timeouts and retries"""
+    if _archive is not None:
+        # The archive has to see every request, so it bypasses the response cache
+        return _archived(url, **kwargs)
+    cache = _response_cache
+    if cache is not None:
+        response = cache.get(url)
+        if response is not None:
+            metrics.count('cache_hits')
+            return response
+    _check_online(url)
+    with host_slot(url):
+        response = _send('GET', url, **kwargs)
+    if cache is not None:
+        cache.put(url, response)
+    return response
+
+
+@contextmanager
+def stream(url, **kwargs):
+    """Streaming GET that keeps its host slot until the body has been read"""
+    if _archive is not None:
+        response = _archived(url, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+        return
+    _check_online(url)
+    with host_slot(url):
+        response = _send('GET', url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+
+
+def scan(url, scanner, **kwargs):
+    """GET a page into a PageScanner, closing the connection as soon as the scanner has seen enough.
+
+    Returns the response, whose body has been consumed by the scanner.
+    """
+    if _archive is not None:
+        # Replays need complete recordings, so archived pages are read in full
+        response = _archived(url, **kwargs)
+        scanner.feed(response.content)
+        scanner.finish()
+        return response
+    cache = _response_cache
+    if cache is not None:
+        response = cache.get(url, partial=True)
+        if response is not None:
+            scanner.feed(response.content)
+            # A prefix cached by an earlier scan may hold fewer matches than this one needs
+            if scanner.finish() or not response.partial or cache.cache_only:
+                metrics.count('cache_hits')
+                return response
+            scanner.reset()
+    _check_online(url)
+    chunks = []
+    with stream(url, **kwargs) as response:
+        if response.status_code != 200:
+            return response
+        stopped = False
+        for chunk in response.iter_content(CHUNK_SIZE):
+            chunks.append(chunk)
+            if scanner.feed(chunk):
+                stopped = True
+                break
+        if not stopped:
+            scanner.finish()
+    metrics.count('scan_bytes', scanner.bytes_read)
+    if stopped:
+        metrics.count('scan_early_stops')
+    if cache is not None:
+        cache.put(url, response, body=b''.join(chunks), partial=stopped)
+    return response
@@ -0,0 +1,135 @@
+import json
+import re
+import threading
+from pathlib import Path
+
+from atomic_files import write_text_atomic
+
+CREDITS_VERSION = 1
+CREDITS_FILE = 'credits.json'
+CREDITS_TEX = 'credits.tex'
+
+# Credit fields kept in the manifest so credits can be rebuilt offline
+CREDIT_FIELDS = ('photographer', 'date', 'location', 'catalog_id', 'rights_holder', 'license')
+
+
+def format_credit(credit_info):
+    """Format the credit sidecar text for an image"""
+    credit_text = []
+    
+    # Add photographer with URL if available
+    if credit_info.get('photographer', 'Unknown') != 'Unknown':
+        credit_text.append(credit_info['photographer'])
+    
+    # Add location and date if available
+    location_date = []
+    if credit_info.get('location', 'Unknown location') != 'Unknown location':
+        location_date.append(credit_info['location'])
+    if credit_info.get('date'):
+        location_date.append(credit_info['date'])
+    if location_date:
+        credit_text.append(' - '.join(location_date))
+    
+    # Add attribution and license
+    if credit_info.get('rights_holder'):
+        credit_text.append(f"© {credit_info['rights_holder']}")
+    credit_text.append(credit_info.get('license', 'Macaulay Library © Cornell Lab of Ornithology'))
+    credit_text.append(f"ML{credit_info['catalog_id']}")
+    return '\n'.join(credit_text)
+
+
+
+TEX_SPECIALS = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+}
+TEX_SPECIALS_PATTERN = re.compile('|'.join(re.escape(char) for char in TEX_SPECIALS))
+
+
+def tex_escape(text):
+    return TEX_SPECIALS_PATTERN.sub(lambda match: TEX_SPECIALS[match.group(0)], text)
+
+
+def credit_lines(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+class CreditsDatabase:
+    """Credit text for every image in a directory, kept as credits.json plus a generated credits.tex.
+
+    The documents load credits.tex once and look each image up with
+    \\imagecredit@<image name>, instead of opening a sidecar file per entry.
+    """
+
+    def __init__(self, images_dir, save_every=1):
+        self.images_dir = Path(images_dir)
+        self.path = self.images_dir / CREDITS_FILE
+        self.credits = {}
+        self.save_every = save_every
+        self.unsaved = 0
+        self.lock = threading.Lock()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CREDITS_VERSION:
+                self.credits = data.get('credits', {})
+        except (OSError, ValueError):
+            pass
+
+    def __contains__(self, image_name):
+        return image_name in self.credits
+
+    def get(self, image_name):
+        """Credit lines for an image, or None"""
+        return self.credits.get(image_name)
+
+    def record(self, image_name, text):
+        """Store the credit text for an image, saving when enough records are pending"""
+        lines = credit_lines(text)
+        with self.lock:
+            if self.credits.get(image_name) == lines:
+                return
+            self.credits[image_name] = lines
+            self.unsaved += 1
+            due = self.unsaved >= self.save_every
+        if due:
+            self.save()
+
+    def tex(self):
+        """The macro table loaded by the LaTeX documents"""
+        lines = [
+            f"% Generated from {CREDITS_FILE} by scripts/image_credits.py; do not edit",
+            r"\makeatletter",
+        ]
+        for image_name, credit in sorted(self.credits.items()):
+            lines.append(rf"\@namedef{{imagecredit@{image_name}}}{{{tex_escape(' '.join(credit))}}}")
+        lines.append(r"\makeatother")
+        return '\n'.join(lines) + '\n'
+
+    def save(self):
+        """Rewrite credits.json and credits.tex, each with one atomic rename"""
+        with self.lock:
+            data = {'version': CREDITS_VERSION, 'credits': dict(sorted(self.credits.items()))}
+            write_text_atomic(self.path, json.dumps(data, indent=2, ensure_ascii=False) + '\n')
+            write_text_atomic(self.images_dir / CREDITS_TEX, self.tex())
+            self.unsaved = 0
+
+    def import_sidecars(self):
+        """Fold any legacy <image>_credit.txt files into the database, returning how many changed"""
+        changed = 0
+        for credit_file in sorted(self.images_dir.glob('*_credit.txt')):
+            image_name = credit_file.name[:-len('_credit.txt')] + '.jpg'
+            lines = credit_lines(credit_file.read_text(encoding='utf-8'))
+            if lines and self.credits.get(image_name) != lines:
+                self.credits[image_name] = lines
+                changed += 1
+        return changed
+
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+import argparse
+import base64
+import io
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html import escape, unescape
+from pathlib import Path
+
+from atomic_files import open_atomic
+from manifest import file_sha256
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Rendition widths in pixels; sources narrower than a width are not upscaled
+WIDTHS = (480, 960, 1600)
+FALLBACK_WIDTH = 960
+PLACEHOLDER_WIDTH = 16
+
+# Preferred formats first; AVIF is skipped if this Pillow build cannot write it
+FORMATS = ('avif', 'webp', 'jpeg')
+EXTENSIONS = {'avif': 'avif', 'webp': 'webp', 'jpeg': 'jpg'}
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'jpeg': 'image/jpeg'}
+QUALITY = {'avif': 50, 'webp': 72, 'jpeg': 80}
+
+# Cards are two 48% columns of a 1200px page, full width on phones
+SIZES = '(max-width: 768px) 100vw, 576px'
+
+INDEX_FILE = 'derivatives.json'
+
+IMG_TAG = re.compile(r'<img\s+([^>]*?)\s*/?>', re.S)
+ATTRIBUTE = re.compile(r'''([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+SOURCE_SRC = re.compile(r'^(?:\.\./)?images/([^/]+\.jpg)$')
+
+
+def available_formats():
+    """Output formats supported by the installed Pillow"""
+    Image.init()
+    return [fmt for fmt in FORMATS if fmt.upper() in Image.SAVE]
+
+
+def target_widths(width):
+    return sorted({min(target, width) for target in WIDTHS})
+
+
+def derivative_name(source_name, width, digest, fmt):
+    return f"{Path(source_name).stem}-{width}.{digest[:10]}.{EXTENSIONS[fmt]}"
+
+
+def build_derivatives(source, output_dir, digest, formats):
+    """Render every width and format of one source image (runs in a worker process)"""
+    source = Path(source)
+    output_dir = Path(output_dir)
+    variants = []
+    with Image.open(source) as original:
+        image = original.convert('RGB')
+    width, height = image.size
+
+    for target in target_widths(width):
+        if target == width:
+            resized = image
+        else:
+            resized = image.resize((target, round(height * target / width)), Image.LANCZOS)
+        for fmt in formats:
+            name = derivative_name(source.name, target, digest, fmt)
+            path = output_dir / name
+            if not path.exists():
+                with open_atomic(path, 'wb') as f:
+                    resized.save(f, fmt.upper(), quality=QUALITY[fmt], optimize=fmt == 'jpeg')
+            variants.append({'format': fmt, 'width': target, 'file': name})
+
+    # A tiny JPEG stretched behind the real image while it loads
+    tiny = image.resize((PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))))
+    buffer = io.BytesIO()
+    tiny.save(buffer, 'JPEG', quality=40)
+    placeholder = 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+    return {
+        'sha256': digest,
+        'width': width,
+        'height': height,
+        'variants': variants,
+        'placeholder': placeholder,
+    }
+
+
+def load_index(output_dir):
+    try:
+        with open(Path(output_dir) / INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(output_dir, index):
+    path = Path(output_dir) / INDEX_FILE
+    with open_atomic(path) as f:
+        json.dump(dict(sorted(index.items())), f, indent=2)
+        f.write('\n')
+
+
+def is_fresh(record, digest, output_dir, formats):
+    if not record or record.get('sha256') != digest:
+        return False
+    if {variant['format'] for variant in record['variants']} != set(formats):
+        return False
+    return all((Path(output_dir) / variant['file']).exists() for variant in record['variants'])
+
+
+def update_derivatives(images_dir, output_dir, workers=None):
+    """Bring html/images up to date with images/, reprocessing only changed sources"""
+    images_dir = Path(images_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    formats = available_formats()
+
+    old_index = load_index(output_dir)
+    index = {}
+    pending = {}
+    failures = []
+    for source in sorted(images_dir.glob('*.jpg')):
+        digest = file_sha256(source)
+        record = old_index.get(source.name)
+        if is_fresh(record, digest, output_dir, formats):
+            index[source.name] = record
+        else:
+            pending[source.name] = (str(source), str(output_dir), digest, formats)
+
+    print(f"{len(index)} images up to date, {len(pending)} to process ({', '.join(formats)})")
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(build_derivatives, *args) for name, args in pending.items()}
+            for name, future in futures.items():
+                try:
+                    index[name] = future.result()
+                    print(f"Processed {name}")
+                except Exception as e:
+                    print(f"Error processing {name}: {e}")
+                    failures.append(name)
+
+    # Remove renditions of images that changed or disappeared
+    referenced = {variant['file'] for record in index.values() for variant in record['variants']}
+    for path in output_dir.iterdir():
+        if re.search(r'-\d+\.[0-9a-f]{10}\.(?:avif|webp|jpg)$', path.name) and path.name not in referenced:
+            path.unlink()
+
+    save_index(output_dir, index)
+    # Failed images are left out of the index, so the next run tries them again
+    if failures:
+        raise RuntimeError(f"Could not process {len(failures)} images: {', '.join(failures)}")
+    return index
+
+
+def srcset(record, fmt, prefix):
+    return ', '.join(
+        f"{prefix}{variant['file']} {variant['width']}w"
+        for variant in record['variants'] if variant['format'] == fmt
+    )
+
+
+def picture_markup(record, alt, prefix):
+    """<picture> element with modern formats, a JPEG fallback and a blurred placeholder"""
+    formats = []
+    for variant in record['variants']:
+        if variant['format'] not in formats:
+            formats.append(variant['format'])
+    jpegs = [variant for variant in record['variants'] if variant['format'] == 'jpeg']
+    fallback = min(jpegs, key=lambda variant: abs(variant['width'] - FALLBACK_WIDTH))
+
+    sources = ''.join(
+        f'<source type="{MIME_TYPES[fmt]}" srcset="{srcset(record, fmt, prefix)}" sizes="{SIZES}" />'
+        for fmt in formats if fmt != 'jpeg'
+    )
+    style = f"background-size:cover;background-image:url({record['placeholder']})"
+    return (
+        f'<picture>{sources}'
+        f'<img src="{prefix}{fallback["file"]}" srcset="{srcset(record, "jpeg", prefix)}" sizes="{SIZES}" '
+        f'width="{record["width"]}" height="{record["height"]}" alt="{escape(alt)}" '
+        f'loading="lazy" decoding="async" style="{style}" />'
+        f'</picture>'
+    )
+
+
+def rewrite_html(html_file, index, prefix='images/'):
+    """Point <img> tags at the derivatives; already rewritten tags are left alone"""
+    # tex4ht output is not always valid UTF-8, so stray bytes are passed through untouched
+    with open(html_file, 'r', encoding='utf-8', errors='surrogateescape') as f:
+        content = f.read()
+
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        attributes = {name: a or b for name, a, b in ATTRIBUTE.findall(match.group(1))}
+        source = SOURCE_SRC.match(attributes.get('src', ''))
+        record = index.get(source.group(1)) if source else None
+        if not record:
+            return match.group(0)
+        count += 1
+        # Attribute values are HTML already, and picture_markup escapes the alt text again
+        return picture_markup(record, unescape(attributes.get('alt', '')), prefix)
+
+    content = IMG_TAG.sub(replace, content)
+    with open(html_file, 'w', encoding='utf-8', errors='surrogateescape') as f:
+        f.write(content)
+    print(f"Rewrote {count} images in {html_file}")
+
+
+def main():
+    """Generate responsive image derivatives for the HTML guide"""
+    workspace_root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--images-dir', type=Path, default=workspace_root / 'images')
+    parser.add_argument('--output-dir', type=Path, default=workspace_root / 'html' / 'images')
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument('--html', type=Path, action='append',
+                        help="HTML file to rewrite (default: both guides)")
+    parser.add_argument('--no-html', action='store_true', help="Only generate the images")
+    args = parser.parse_args()
+
+    if Image is None:
+        parser.error("Pillow is required: pip install Pillow")
+
+    index = update_derivatives(args.images_dir, args.output_dir, args.workers)
+    if args.no_html:
+        return
+    html_files = args.html or [
+        workspace_root / 'html' / 'bird_guide.html',
+        workspace_root / 'html' / 'bird_guide_marathi.html',
+    ]
+    for html_file in html_files:
+        if html_file.exists():
+            rewrite_html(html_file, index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+# Width of the rendition fetched for every candidate; the scales below are tuned for it
+THUMBNAIL_WIDTH = 320
+
+# Laplacian variance at which a thumbnail counts as half sharp
+SHARPNESS_SCALE = 300.0
+
+# Share of the frame the bird's bounding box should cover: smaller is a distant
+# bird, larger is usually clutter with no clear subject
+SUBJECT_SHARE = (0.08, 0.45)
+
+# Share of edge energy along each axis that defines the subject's bounding box
+SUBJECT_ENERGY = 0.8
+
+# The guide's photo frames are landscape
+TARGET_ASPECT = 1.5
+
+WEIGHTS = {'sharpness': 0.4, 'exposure': 0.25, 'subject': 0.2, 'aspect': 0.15}
+
+
+def load_gray(data):
+    """Decode image bytes to a float32 grayscale array, letting JPEG decode at reduced size"""
+    with Image.open(io.BytesIO(data)) as image:
+        image.draft('L', (THUMBNAIL_WIDTH, THUMBNAIL_WIDTH))
+        gray = image.convert('L')
+        if gray.width > THUMBNAIL_WIDTH:
+            gray = gray.resize((THUMBNAIL_WIDTH, max(1, round(gray.height * THUMBNAIL_WIDTH / gray.width))))
+    return np.asarray(gray, dtype=np.float32)
+
+
+def sharpness(gray):
+    """Variance of the Laplacian, mapped to 0..1"""
+    laplacian = (gray[:-2, 1:-1] + gray[2:, 1:-1] + gray[1:-1, :-2] + gray[1:-1, 2:]
+                 - 4 * gray[1:-1, 1:-1])
+    variance = float(laplacian.var())
+    return variance / (variance + SHARPNESS_SCALE)
+
+
+def exposure(gray):
+    """Penalise clipped shadows and highlights and a mean far from mid-grey"""
+    histogram = np.bincount(gray.astype(np.uint8).ravel(), minlength=256) / gray.size
+    clipped = histogram[:3].sum() + histogram[253:].sum()
+    mean = float(gray.mean()) / 255
+    return max(0.0, 1 - 4 * clipped) * (1 - abs(mean - 0.5))
+
+
+def energy_span(profile):
+    """Fraction of an axis covered by the central SUBJECT_ENERGY of its edge energy"""
+    total = profile.sum()
+    if total <= 0:
+        return 1.0
+    cumulative = np.cumsum(profile) / total
+    tail = (1 - SUBJECT_ENERGY) / 2
+    start, end = np.searchsorted(cumulative, (tail, 1 - tail))
+    return (end - start + 1) / len(profile)
+
+
+def subject(gray):
+    """How well the bounding box of the edge energy fits SUBJECT_SHARE of the frame"""
+    magnitude = np.hypot(np.diff(gray, axis=0)[:, :-1], np.diff(gray, axis=1)[:-1, :])
+    # Faint texture such as bokeh or sky should not count as subject
+    magnitude[magnitude < magnitude.mean()] = 0
+    share = energy_span(magnitude.sum(axis=1)) * energy_span(magnitude.sum(axis=0))
+    low, high = SUBJECT_SHARE
+    if share < low:
+        return share / low
+    if share > high:
+        return max(0.0, 1 - (share - high) / (1 - high))
+    return 1.0
+
+
+def aspect(width, height):
+    """1 at TARGET_ASPECT, falling off with the log of the ratio"""
+    return float(np.exp(-2 * abs(np.log(width / height / TARGET_ASPECT))))
+
+
+def score_image(data):
+    """Quality metrics and their weighted score for one candidate image, or None if it cannot be decoded"""
+    try:
+        gray = load_gray(data)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    if min(gray.shape) < 8:
+        return None
+    scores = {
+        'sharpness': sharpness(gray),
+        'exposure': exposure(gray),
+        'subject': subject(gray),
+        'aspect': aspect(gray.shape[1], gray.shape[0]),
+    }
+    scores['score'] = sum(WEIGHTS[name] * value for name, value in scores.items())
+    return {name: round(float(value), 3) for name, value in scores.items()}
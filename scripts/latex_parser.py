@@ -0,0 +1,176 @@
+import re
+
+# The nine arguments of \birdentry, in order
+BIRDENTRY_FIELDS = (
+    'name',
+    'latin',
+    'size',
+    'status',
+    'field_characters',
+    'best_seen',
+    'habits',
+    'nesting',
+    'image',
+)
+
+COMMAND_NAME = re.compile(r'[A-Za-z@]+\*?|.', re.S)
+WHITESPACE = re.compile(r'\s*')
+
+
+def skip_space(text, pos):
+    return WHITESPACE.match(text, pos).end()
+
+
+def skip_comment(text, pos):
+    """Position just after the end of a % comment starting at pos"""
+    end = text.find('\n', pos)
+    return len(text) if end == -1 else end + 1
+
+
+def read_group(text, pos, open_char='{', close_char='}'):
+    """Read a balanced group at pos (after optional whitespace).
+
+    Returns (content, end) or (None, pos) when no group starts there.
+    Escaped braces and % comments are honoured while counting nesting.
+    """
+    start = skip_space(text, pos)
+    if start >= len(text) or text[start] != open_char:
+        return None, pos
+    depth = 0
+    i = start
+    while i < len(text):
+        char = text[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '%':
+            i = skip_comment(text, i)
+            continue
+        if char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i], i + 1
+        i += 1
+    raise ValueError(f"Unbalanced {open_char} starting at offset {start}")
+
+
+def read_optional(text, pos):
+    """Read an optional [...] argument; returns (content, end) or (None, pos)"""
+    return read_group(text, pos, '[', ']')
+
+
+def read_arguments(text, pos, count):
+    """Read count mandatory {...} arguments starting at pos"""
+    args = []
+    for _ in range(count):
+        arg, end = read_group(text, pos)
+        if arg is None:
+            raise ValueError(f"Expected {count} arguments at offset {pos}, found {len(args)}")
+        args.append(arg)
+        pos = end
+    return args, pos
+
+
+def read_environment(text, pos, name):
+    """Body of \\begin{name}...\\end{name} where pos is just after \\begin{name}"""
+    begin = f'\\begin{{{name}}}'
+    end = f'\\end{{{name}}}'
+    depth = 1
+    i = pos
+    while depth:
+        next_begin = text.find(begin, i)
+        next_end = text.find(end, i)
+        if next_end == -1:
+            raise ValueError(f"Missing {end} for environment at offset {pos}")
+        if next_begin != -1 and next_begin < next_end:
+            depth += 1
+            i = next_begin + len(begin)
+        else:
+            depth -= 1
+            i = next_end + len(end)
+    return text[pos:i - len(end)], i
+
+
+def iter_commands(text, name):
+    """Yield the start and argument position of every \\name outside comments"""
+    i = 0
+    while True:
+        i = text.find('\\', i)
+        if i == -1:
+            return
+        # A backslash is only a command if it is not itself escaped or commented out
+        line_start = text.rfind('\n', 0, i) + 1
+        if _in_comment(text, line_start, i):
+            i = skip_comment(text, i)
+            continue
+        match = COMMAND_NAME.match(text, i + 1)
+        if match.group(0) == name:
+            yield i, match.end()
+        i = match.end()
+
+
+def _in_comment(text, line_start, pos):
+    i = line_start
+    while i < pos:
+        if text[i] == '\\':
+            i += 2
+            continue
+        if text[i] == '%':
+            return True
+        i += 1
+    return False
+
+
+def document_body(text):
+    """Preamble and body of a LaTeX document"""
+    begin = text.find('\\begin{document}')
+    if begin == -1:
+        return '', text
+    end = text.find('\\end{document}', begin)
+    body_start = begin + len('\\begin{document}')
+    return text[:begin], text[body_start:end if end != -1 else len(text)]
+
+
+def preamble_value(preamble, name):
+    """Argument of a one-argument preamble command such as \\title"""
+    for _, pos in iter_commands(preamble, name):
+        value, _ = read_group(preamble, pos)
+        if value is not None:
+            return value
+    return None
+
+
+def iter_birdentries(text):
+    """Yield the nine raw LaTeX arguments of every \\birdentry call as a dict"""
+    for start, pos in iter_commands(text, 'birdentry'):
+        # The \newcommand{\birdentry}[9]{...} definition has no arguments and is skipped
+        try:
+            args, end = read_arguments(text, pos, len(BIRDENTRY_FIELDS))
+        except ValueError:
+            continue
+        entry = dict(zip(BIRDENTRY_FIELDS, (arg.strip() for arg in args)))
+        entry['offset'] = start
+        entry['end'] = end
+        yield entry
+
+
+PLAIN_REPLACEMENTS = (
+    (re.compile(r'(?<!\\)%[^\n]*'), ''),
+    (re.compile(r'\\\\(\[[^\]]*\])?'), ' '),
+    (re.compile(r'\\([&%$#_{}])'), r'\1'),
+    (re.compile(r'\\[A-Za-z@]+\*?\s*'), ''),
+    (re.compile(r'[{}]'), ''),
+    (re.compile(r'---'), '\u2014'),
+    (re.compile(r'--'), '\u2013'),
+    (re.compile(r'~'), '\u00a0'),
+    (re.compile(r'\s+'), ' '),
+)
+
+
+def plain_text(text):
+    """Strip LaTeX markup from a short field, keeping its text"""
+    for pattern, replacement in PLAIN_REPLACEMENTS:
+        text = pattern.sub(replacement, text)
+    return text.strip()
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from atomic_files import open_atomic
+
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path):
+    """Hex sha256 digest of a file, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Record of what was downloaded for each image, keyed by image filename"""
+
+    def __init__(self, path, save_every=1):
+        # Bulk runs record thousands of images, so they save every few records instead
+        self.path = Path(path)
+        self.entries = {}
+        self.save_every = save_every
+        self.unsaved = 0
+        self.lock = threading.Lock()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('images', {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, image_name):
+        return self.entries.get(image_name)
+
+    def is_current(self, image_name, bird, images_dir):
+        """True if the image on disk is the one recorded for this bird"""
+        entry = self.entries.get(image_name)
+        if not entry:
+            return False
+        if entry.get('common_name') != bird['common_name'] or entry.get('latin_name') != bird['latin_name']:
+            return False
+
+        image_path = Path(images_dir) / image_name
+        try:
+            stat = image_path.stat()
+        except OSError:
+            return False
+        if stat.st_size != entry.get('size'):
+            return False
+        if stat.st_mtime != entry.get('mtime'):
+            # Touched but possibly unchanged, so fall back to the content hash
+            if file_sha256(image_path) != entry.get('sha256'):
+                return False
+            with self.lock:
+                entry['mtime'] = stat.st_mtime
+        return True
+
+    def record(self, image_name, image_path, **fields):
+        """Store an entry for a freshly written image and save the manifest"""
+        stat = os.stat(image_path)
+        entry = dict(fields)
+        entry.update({
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha256': file_sha256(image_path),
+            'updated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        })
+        with self.lock:
+            self.entries[image_name] = entry
+            self.unsaved += 1
+            due = self.unsaved >= self.save_every
+        if due:
+            self.save()
+        return entry
+
+    def save(self):
+        """Write the manifest atomically"""
+        with self.lock:
+            data = {
+                'version': MANIFEST_VERSION,
+                'images': dict(sorted(self.entries.items())),
+            }
+            with open_atomic(self.path) as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+            self.unsaved = 0
@@ -0,0 +1,164 @@
+import cProfile
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from atomic_files import write_text_atomic
+
+METRIC_PREFIX = 'bird_guide'
+
+# Minimum seconds between two progress lines from the same reporter
+PROGRESS_INTERVAL = 1.0
+
+
+class Metrics:
+    """Thread-safe per-stage timers and counters for one run, with optional profiling"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.stages = {}
+        self.counters = {}
+        self.profile_dir = None
+        self.profiles = {}
+        self.memory = {}
+        self.local = threading.local()
+
+    def enable_profiling(self, profile_dir):
+        """Collect cProfile statistics and traced allocations per stage into profile_dir"""
+        self.profile_dir = Path(profile_dir)
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block of work under a stage name"""
+        profiler = None
+        # cProfile allows one active profiler per thread, owned by the outermost stage
+        if self.profile_dir and not getattr(self.local, 'profiling', False):
+            profiler = cProfile.Profile()
+            self.local.profiling = True
+            memory_before = tracemalloc.get_traced_memory()[0]
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+                self.local.profiling = False
+                retained = tracemalloc.get_traced_memory()[0] - memory_before
+            with self.lock:
+                stats = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+                stats['calls'] += 1
+                stats['seconds'] += elapsed
+                stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+                if profiler:
+                    self.profiles.setdefault(name, []).append(profiler)
+                    self.memory[name] = self.memory.get(name, 0) + retained
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self):
+        with self.lock:
+            return {
+                'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+                'wall_seconds': time.time() - self.started,
+                'stages': {name: dict(stats) for name, stats in self.stages.items()},
+                'counters': dict(self.counters),
+            }
+
+    def report(self):
+        """Human-readable stage table for the end of a run"""
+        summary = self.summary()
+        lines = [f"Finished in {summary['wall_seconds']:.1f}s"]
+        for name, stats in sorted(summary['stages'].items(), key=lambda item: -item[1]['seconds']):
+            lines.append(
+                f"  {name:16} {stats['calls']:6} calls {stats['seconds']:9.2f}s total "
+                f"{stats['seconds'] / stats['calls'] * 1000:9.1f}ms avg"
+            )
+        for name, value in sorted(summary['counters'].items()):
+            lines.append(f"  {name:16} {value}")
+        return '\n'.join(lines)
+
+    def prometheus(self):
+        """Summary in the Prometheus text exposition format, for node_exporter's textfile collector"""
+        summary = self.summary()
+        lines = [
+            f"# TYPE {METRIC_PREFIX}_stage_seconds_total counter",
+            *(f'{METRIC_PREFIX}_stage_seconds_total{{stage="{name}"}} {stats["seconds"]:.6f}'
+              for name, stats in sorted(summary['stages'].items())),
+            f"# TYPE {METRIC_PREFIX}_stage_calls_total counter",
+            *(f'{METRIC_PREFIX}_stage_calls_total{{stage="{name}"}} {stats["calls"]}'
+              for name, stats in sorted(summary['stages'].items())),
+        ]
+        for name, value in sorted(summary['counters'].items()):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+            lines.append(f"{METRIC_PREFIX}_{name}_total {value}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_run_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}_run_seconds {summary['wall_seconds']:.3f}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Save the summary as Prometheus text if path ends in .prom, otherwise as JSON"""
+        path = Path(path)
+        if path.suffix == '.prom':
+            text = self.prometheus()
+        else:
+            text = json.dumps(self.summary(), indent=2) + '\n'
+        write_text_atomic(path, text)
+
+    def write_profiles(self):
+        """Dump merged cProfile statistics per stage and the top allocation sites"""
+        if not self.profile_dir:
+            return
+        for name, profilers in self.profiles.items():
+            stats = pstats.Stats(profilers[0])
+            for profiler in profilers[1:]:
+                stats.add(profiler)
+            stats.dump_stats(self.profile_dir / f"{name}.prof")
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        with open(self.profile_dir / 'memory.txt', 'w', encoding='utf-8') as f:
+            f.write(f"traced memory: {current / 1e6:.1f} MB now, {peak / 1e6:.1f} MB peak\n\n")
+            f.write("retained by stage:\n")
+            for name, retained in sorted(self.memory.items()):
+                f.write(f"  {name:10} {retained / 1e6:9.2f} MB\n")
+            f.write("\ntop allocation sites:\n")
+            for stat in snapshot.statistics('lineno')[:25]:
+                f.write(f"  {stat}\n")
+        print(f"Wrote profiles to {self.profile_dir} (view with: python -m pstats {self.profile_dir}/<stage>.prof)")
+
+
+class Progress:
+    """Progress line for a long transfer, printed at most once per interval"""
+
+    def __init__(self, label, total=None, interval=PROGRESS_INTERVAL):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.last = time.monotonic()
+
+    def update(self, amount):
+        self.done += amount
+        now = time.monotonic()
+        if now - self.last >= self.interval:
+            self.last = now
+            if self.total:
+                print(f"{self.label}: {self.done / self.total * 100:.1f}%")
+            else:
+                print(f"{self.label}: {self.done} bytes")
+
+
+# Shared by every module in a run
+METRICS = Metrics()
+stage = METRICS.stage
+count = METRICS.count
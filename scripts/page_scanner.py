@@ -0,0 +1,63 @@
+import re
+
+# Macaulay Library asset URLs as they appear in species and catalog pages
+ASSET_PATTERN = re.compile(rb'https://cdn\.download\.ams\.birds\.cornell\.edu/api/v1/asset/(\d+)')
+
+# Bytes kept between chunks so a match split across two chunks is still found;
+# longer than any match the patterns here can produce
+OVERLAP = 256
+
+CHUNK_SIZE = 16 * 1024
+
+
+class PageScanner:
+    """Collects the first `limit` distinct matches of a pattern from a page fed in chunks.
+
+    feed() returns True once enough matches have been seen, so the caller can
+    stop reading the response.
+    """
+
+    def __init__(self, limit=1, pattern=ASSET_PATTERN):
+        self.pattern = pattern
+        self.limit = limit
+        self.reset()
+
+    def reset(self):
+        """Forget everything fed so far, to scan the page again from the start"""
+        self.matches = {}
+        self.buffer = b''
+        self.bytes_read = 0
+
+    @property
+    def done(self):
+        return len(self.matches) >= self.limit
+
+    @property
+    def ids(self):
+        return [match.decode('ascii') for match in self.matches]
+
+    def _search(self, final):
+        keep_from = max(0, len(self.buffer) - OVERLAP)
+        for match in self.pattern.finditer(self.buffer):
+            # A match running into the end of the buffer may continue in the next chunk
+            if match.end() == len(self.buffer) and not final:
+                keep_from = min(keep_from, match.start())
+                break
+            self.matches.setdefault(match.group(1), None)
+            keep_from = max(keep_from, match.end())
+            if self.done:
+                break
+        self.buffer = self.buffer[keep_from:]
+
+    def feed(self, chunk):
+        self.bytes_read += len(chunk)
+        self.buffer += chunk
+        self._search(final=False)
+        return self.done
+
+    def finish(self):
+        """Search what is left once the whole page has been read"""
+        if not self.done:
+            self._search(final=True)
+        self.buffer = b''
+        return self.done
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from string import Template
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+HTML_DIR = WORKSPACE_ROOT / 'html'
+DIST_DIR = WORKSPACE_ROOT / 'dist'
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+PAGES = ('bird_guide.html', 'bird_guide_marathi.html')
+SERVICE_WORKER = 'sw.js'
+PRECACHE_MANIFEST = 'precache-manifest.json'
+FINGERPRINT_LENGTH = 10
+
+# Files worth serving precompressed; images are compressed already
+COMPRESSED_SUFFIXES = ('.html', '.css', '.js', '.json', '.svg', '.txt')
+
+# Names that already carry a content hash, like the image derivatives
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{%d}\.\w+$' % FINGERPRINT_LENGTH)
+
+ATTRIBUTE = re.compile(r'''\b(href|src)=(["'])([^"']+)\2''')
+SRCSET = re.compile(r'''\bsrcset=(["'])([^"']+)\1''')
+PICTURE = re.compile(r'<picture>.*?</picture>', re.S)
+IMG_SRC = re.compile(r'''<img\b[^>]*?\bsrc=(["'])([^"']+)\1''')
+CSS_URL = re.compile(r'''url\((["']?)([^"')]+)\1\)''')
+# Asset names in quoted JavaScript strings, such as the lazily loaded search index
+JS_STRING = re.compile(r'''(["'])([\w./-]+\.(?:js|css|json|jpg|png|webp|avif|svg))\1''')
+CSS_STRING_OR_COMMENT = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/''', re.S)
+
+REGISTER_SCRIPT = (
+    "<script>if ('serviceWorker' in navigator && location.protocol !== 'file:') "
+    f"navigator.serviceWorker.register('{SERVICE_WORKER}');</script>"
+)
+
+
+def is_local(reference):
+    return not re.match(r'^(?:[a-z][a-z0-9+.-]*:|//|#)', reference, re.I)
+
+
+def minify_css(text):
+    """Drop comments and redundant whitespace, leaving string literals alone"""
+    parts = []
+    position = 0
+    for match in CSS_STRING_OR_COMMENT.finditer(text):
+        parts.append(_squeeze_css(text[position:match.start()]))
+        # Comments become a space so the tokens around them stay apart
+        parts.append(match.group(1) or ' ')
+        position = match.end()
+    parts.append(_squeeze_css(text[position:]))
+    return re.sub(r'\s*([{};,>])\s*', r'\1', ''.join(parts)).replace(';}', '}').strip() + '\n'
+
+
+def _squeeze_css(text):
+    text = re.sub(r'\s+', ' ', text)
+    # Only after a colon: before one it may start a pseudo-class selector
+    return re.sub(r':\s+', ':', text)
+
+
+def minify_js(text):
+    """Strip indentation, blank lines and whole-line comments.
+
+    Deliberately conservative: nothing inside a line is touched, so strings
+    and regular expressions survive without a JavaScript parser.
+    """
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//')) + '\n'
+
+
+def fingerprinted_name(name, content):
+    if FINGERPRINTED.search(name):
+        return name
+    digest = hashlib.sha256(content).hexdigest()[:FINGERPRINT_LENGTH]
+    stem, dot, suffix = name.rpartition('.')
+    return f"{stem}.{digest}.{suffix}" if dot else f"{name}.{digest}"
+
+
+def compress(path):
+    """Write .gz and, when the brotli module is installed, .br next to path if they are smaller"""
+    data = path.read_bytes()
+    variants = [('.gz', gzip.compress(data, 9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    written = 0
+    for suffix, compressed in variants:
+        if len(compressed) < len(data):
+            path.with_name(path.name + suffix).write_bytes(compressed)
+            written += len(compressed)
+    return len(data), written
+
+
+class Bundle:
+    """Fingerprinted copies of the pages' assets, collected into one output directory"""
+
+    def __init__(self, html_dir, output_dir):
+        self.html_dir = Path(html_dir).resolve()
+        self.output_dir = Path(output_dir)
+        # Source path -> published path relative to output_dir
+        self.assets = {}
+
+    def destination(self, source):
+        """Where a source file goes in the bundle, keeping files under html/ where they were"""
+        try:
+            return source.relative_to(self.html_dir).parent
+        except ValueError:
+            # e.g. ../images/*.jpg from the tex4ht pages
+            return Path(source.parent.name)
+
+    def publish(self, reference, base_dir):
+        """Copy the asset a page refers to into the bundle; returns its new reference, or None"""
+        path, _, fragment = reference.partition('#')
+        source = (base_dir / path).resolve()
+        if not source.is_file():
+            print(f"Missing asset {reference} (from {base_dir})")
+            return None
+        if source not in self.assets:
+            content = source.read_bytes()
+            if source.suffix == '.css':
+                text = CSS_URL.sub(lambda match: self.rewrite(match, 2, source.parent, 'url({}{}{})'),
+                                   content.decode('utf-8', 'surrogateescape'))
+                content = minify_css(text).encode('utf-8', 'surrogateescape')
+            elif source.suffix == '.js':
+                text = JS_STRING.sub(lambda match: self.rewrite(match, 2, source.parent, '{}{}{}'),
+                                     content.decode('utf-8', 'surrogateescape'))
+                content = minify_js(text).encode('utf-8', 'surrogateescape')
+            target = self.destination(source) / fingerprinted_name(source.name, content)
+            output = self.output_dir / target
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(content)
+            self.assets[source] = target.as_posix()
+        return self.assets[source] + (f"#{fragment}" if fragment else '')
+
+    def rewrite(self, match, group, base_dir, pattern):
+        """Replacement text for a regex match whose group holds a reference"""
+        reference = match.group(group)
+        published = self.publish(reference, base_dir) if is_local(reference) else None
+        if published is None:
+            return match.group(0)
+        quote = match.group(1)
+        return pattern.format(quote, published, quote)
+
+    def rewrite_page(self, html):
+        def attribute(match):
+            reference = match.group(3)
+            # Links between the pages keep their names
+            if not is_local(reference) or reference.split('#')[0].endswith('.html') or not reference.split('#')[0]:
+                return match.group(0)
+            published = self.publish(reference, self.html_dir)
+            if published is None:
+                return match.group(0)
+            return f'{match.group(1)}={match.group(2)}{published}{match.group(2)}'
+
+        def srcset(match):
+            candidates = []
+            for candidate in match.group(2).split(','):
+                reference, _, descriptor = candidate.strip().partition(' ')
+                published = self.publish(reference, self.html_dir) if is_local(reference) else None
+                candidates.append(' '.join(filter(None, (published or reference, descriptor))))
+            return f'srcset={match.group(1)}{", ".join(candidates)}{match.group(1)}'
+
+        html = SRCSET.sub(srcset, ATTRIBUTE.sub(attribute, html))
+        if REGISTER_SCRIPT not in html:
+            html = html.replace('</body>', f'{REGISTER_SCRIPT}\n</body>', 1)
+        return html
+
+
+def image_fallbacks(html):
+    """Map every rendition in a <picture> to its <img> src, the one rendition that is precached"""
+    fallbacks = {}
+    for picture in PICTURE.findall(html):
+        src = IMG_SRC.search(picture)
+        if not src:
+            continue
+        for srcset in SRCSET.findall(picture):
+            for candidate in srcset[1].split(','):
+                reference = candidate.strip().partition(' ')[0]
+                if reference != src.group(2):
+                    fallbacks[reference] = src.group(2)
+    return fallbacks
+
+
+def write_service_worker(output_dir, precache, fallbacks):
+    """sw.js and its precache manifest; the version changes whenever any precached file does"""
+    files = {url: hashlib.sha256((output_dir / url).read_bytes()).hexdigest() for url in precache}
+    version = hashlib.sha256(json.dumps([files, fallbacks], sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    manifest = {'version': version, 'files': files, 'fallbacks': fallbacks}
+    with open(TEMPLATE_DIR / SERVICE_WORKER, 'r', encoding='utf-8') as f:
+        worker = Template(f.read()).substitute(
+            version=version,
+            precache=json.dumps(sorted(files), indent=2),
+            fallbacks=json.dumps(fallbacks, indent=2, sort_keys=True),
+        )
+    (output_dir / SERVICE_WORKER).write_text(worker, encoding='utf-8')
+    (output_dir / PRECACHE_MANIFEST).write_text(json.dumps(manifest, indent=1) + '\n', encoding='utf-8')
+    return version
+
+
+def publish(html_dir=HTML_DIR, output_dir=DIST_DIR):
+    """Build the deployable bundle in output_dir, replacing the previous one only once it is complete"""
+    html_dir = Path(html_dir)
+    output_dir = Path(output_dir)
+    if brotli is None:
+        print("Warning: the brotli module is not installed, so no .br files will be written; "
+              "only gzip variants are precompressed (pip install brotli)")
+    staging = output_dir.with_name(output_dir.name + '.tmp')
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    bundle = Bundle(html_dir, staging)
+    precache = []
+    fallbacks = {}
+    for page in PAGES:
+        source = html_dir / page
+        if not source.exists():
+            print(f"Skipping {page}: not built")
+            continue
+        # tex4ht output is not always valid UTF-8, so stray bytes are passed through untouched
+        html = bundle.rewrite_page(source.read_text(encoding='utf-8', errors='surrogateescape'))
+        (staging / page).write_text(html, encoding='utf-8', errors='surrogateescape')
+        precache.append(page)
+        fallbacks.update(image_fallbacks(html))
+    # Renditions with a fallback are cached when first shown instead of up front
+    precache.extend(asset for asset in bundle.assets.values() if asset not in fallbacks)
+    version = write_service_worker(staging, precache, fallbacks)
+
+    original = compressed = 0
+    for path in sorted(staging.rglob('*')):
+        if path.is_file() and path.suffix in COMPRESSED_SUFFIXES:
+            size, written = compress(path)
+            original += size
+            compressed += written
+
+    previous = output_dir.with_name(output_dir.name + '.old')
+    shutil.rmtree(previous, ignore_errors=True)
+    if output_dir.exists():
+        os.replace(output_dir, previous)
+    os.replace(staging, output_dir)
+    shutil.rmtree(previous, ignore_errors=True)
+
+    formats = 'gzip and brotli' if brotli is not None else 'gzip only'
+    print(f"Published {len(bundle.assets)} assets and {len(precache)} precached files to {output_dir} "
+          f"(service worker {version}); {original // 1024} KB of text precompressed with {formats}, "
+          f"{compressed // 1024} KB in all variants")
+    return version
+
+
+def main(argv=None):
+    """Bundle the built HTML guides for deployment: fingerprinted, precompressed and usable offline"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--html-dir', type=Path, default=HTML_DIR, help="Built guides to publish (default: html)")
+    parser.add_argument('--output-dir', type=Path, default=DIST_DIR, help="Bundle directory (default: dist)")
+    args = parser.parse_args(argv)
+    publish(args.html_dir, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
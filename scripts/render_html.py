@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import re
+import time
+from html import escape
+from pathlib import Path
+from string import Template
+
+import catalog
+import latex_parser
+from image_credits import CreditsDatabase
+from latex_parser import (
+    COMMAND_NAME,
+    read_arguments,
+    read_environment,
+    read_group,
+    read_optional,
+    skip_comment,
+    skip_space,
+)
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+SEASONALITY_FILE = Path(__file__).parent.parent / 'data' / 'seasonality.json'
+
+# Field labels and fixed strings for each guide language
+LANGUAGES = {
+    'en': {
+        'labels': ('Size', 'Status', 'Field characters', 'Best seen at', 'Habits', 'Nesting'),
+        'index': 'Index',
+        'search': 'Search birds...',
+        'missing': 'Image placeholder',
+        'season': 'Seasonality',
+        'months': ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'),
+        'checklists': 'of checklists',
+    },
+    'mr': {
+        'labels': ('Size', 'Status', 'Field characters', 'Distribution', 'Habits', 'Nesting'),
+        'index': 'सूची',
+        'search': 'पक्षी शोधा...',
+        'missing': 'Image placeholder',
+        'season': 'Seasonality',
+        'months': ('जाने', 'फेब्रु', 'मार्च', 'एप्रि', 'मे', 'जून', 'जुलै', 'ऑग', 'सप्टें', 'ऑक्टो', 'नोव्हें', 'डिसें'),
+        'checklists': 'चेकलिस्टमध्ये',
+    },
+}
+
+DESCRIPTION_FIELDS = ('size', 'status', 'field_characters', 'best_seen', 'habits', 'nesting')
+
+# Paragraph breaks and block elements are separated by this marker until the end
+BREAK = '\x00'
+BLOCK_TAGS = ('<h1', '<h2', '<h3', '<ul', '<div', '<article', '<section', '<nav', '<header')
+
+SYMBOLS = {
+    '\\': '<br />',
+    '&': '&amp;',
+    '%': '%',
+    '$': '$',
+    '#': '#',
+    '_': '_',
+    '{': '{',
+    '}': '}',
+    ' ': ' ',
+    ',': '\u2009',
+}
+
+INLINE = {
+    'textit': 'em',
+    'emph': 'em',
+    'textbf': 'strong',
+    'underline': 'u',
+}
+
+# Commands whose arguments are dropped from the output entirely
+DROPPED = {
+    'vspace': 1,
+    'hspace': 1,
+    'addcontentsline': 3,
+    'label': 1,
+    'index': 1,
+    'indexprologue': 1,
+    'setcounter': 2,
+    'newpage': 0,
+    'clearpage': 0,
+    'tableofcontents': 0,
+    'noindent': 0,
+    'hfill': 0,
+}
+
+TYPOGRAPHY = (
+    ('---', '\u2014'),
+    ('--', '\u2013'),
+    ('``', '\u201c'),
+    ("''", '\u201d'),
+    ('~', '\u00a0'),
+)
+TYPOGRAPHY_PATTERN = re.compile('|'.join(re.escape(source) for source, _ in TYPOGRAPHY))
+TYPOGRAPHY_MAP = dict(TYPOGRAPHY)
+PARAGRAPH_BREAK = re.compile(r'\n[ \t]*\n\s*')
+
+
+def slugify(text):
+    return re.sub(r'[^\w]+', '-', text.lower(), flags=re.UNICODE).strip('-')
+
+
+def unwrap(text, command):
+    """Contents of text if it is exactly one \\command{...}, otherwise text"""
+    match = re.fullmatch(r'\s*\\' + command + r'\s*\{(.*)\}\s*', text, re.S)
+    return match.group(1) if match else text
+
+
+def load_template(template_dir, name):
+    with open(Path(template_dir) / name, 'r', encoding='utf-8') as f:
+        return Template(f.read())
+
+
+def load_seasonality(path):
+    """Per-image seasonality from seasonality.py, or nothing if it has not been generated"""
+    if not path:
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('birds', {})
+    except (OSError, ValueError):
+        return {}
+
+
+class GuideRenderer:
+    """Converts a bird guide's LaTeX source into lean HTML"""
+
+    def __init__(self, lang='en', template_dir=TEMPLATE_DIR, credits_dir=None, image_prefix='../images/',
+                 seasonality_file=None):
+        self.strings = LANGUAGES[lang]
+        self.lang = lang
+        self.page_template = load_template(template_dir, 'page.html')
+        self.entry_template = load_template(template_dir, 'bird_entry.html')
+        self.credits_dir = Path(credits_dir) if credits_dir else None
+        self.credits = CreditsDatabase(credits_dir).credits if credits_dir else {}
+        self.seasonality = load_seasonality(seasonality_file)
+        self.image_prefix = image_prefix
+        self.title = ''
+        self.last_chapter = None
+        self.entries = []
+        self.body = None
+        self.body_start = 0
+        self.catalog_entries = {}
+
+    # Text conversion
+
+    def text(self, text):
+        """Escape plain text and apply TeX typography"""
+        text = escape(text, quote=False)
+        text = TYPOGRAPHY_PATTERN.sub(lambda match: TYPOGRAPHY_MAP[match.group(0)], text)
+        return PARAGRAPH_BREAK.sub(BREAK, text)
+
+    def inline(self, text):
+        """Convert LaTeX to HTML with paragraph breaks folded into spaces"""
+        return re.sub(r'\s+', ' ', self.convert(text).replace(BREAK, ' ')).strip()
+
+    def blocks(self, text):
+        """Convert LaTeX to HTML, wrapping loose text in paragraphs"""
+        html = []
+        for chunk in self.convert(text).split(BREAK):
+            chunk = chunk.strip()
+            if not chunk:
+                continue
+            if chunk.startswith(BLOCK_TAGS):
+                html.append(chunk)
+            else:
+                html.append(f'<p>{chunk}</p>')
+        return '\n'.join(html)
+
+    def block(self, html):
+        return f'{BREAK}{html}{BREAK}'
+
+    def convert(self, text):
+        out = []
+        i = 0
+        plain = 0
+        while i < len(text):
+            char = text[i]
+            if char not in '\\{}%':
+                i += 1
+                continue
+            out.append(self.text(text[plain:i]))
+            if char == '%':
+                i = skip_comment(text, i)
+            elif char == '{':
+                group, i = read_group(text, i)
+                out.append(self.convert(group))
+            elif char == '}':
+                i += 1
+            else:
+                html, i = self.command(text, i)
+                out.append(html)
+            plain = i
+        out.append(self.text(text[plain:]))
+        return ''.join(out)
+
+    def command(self, text, pos):
+        """Convert the command starting at pos, returning (html, end)"""
+        match = COMMAND_NAME.match(text, pos + 1)
+        name = match.group(0)
+        end = match.end()
+
+        if name in SYMBOLS:
+            if name == '\\':
+                _, end = read_optional(text, end)
+            return SYMBOLS[name], end
+        base = name.rstrip('*')
+        if base in DROPPED:
+            _, end = read_optional(text, end)
+            _, end = read_arguments(text, end, DROPPED[base])
+            return '', end
+        if base in INLINE:
+            (arg,), end = read_arguments(text, end, 1)
+            tag = INLINE[base]
+            return f'<{tag}>{self.convert(arg)}</{tag}>', end
+
+        handler = getattr(self, f'do_{base}', None)
+        if handler:
+            return handler(text, end)
+
+        # Unknown declarations such as \large or \latintext only change fonts
+        if name[0].isalpha():
+            end = re.compile(r'[ \t]*').match(text, end).end()
+        return '', end
+
+    # Commands
+
+    def do_textcopyright(self, text, pos):
+        return '\u00a9', pos
+
+    def do_maketitle(self, text, pos):
+        return self.block(f'<header><h1>{self.inline(self.title)}</h1></header>'), pos
+
+    def do_chapter(self, text, pos):
+        _, pos = read_optional(text, skip_star(text, pos))
+        (title,), pos = read_arguments(text, pos, 1)
+        title_html = self.inline(title)
+        self.last_chapter = title_html
+        return self.block(f'<h2 id="{slugify(title_html)}">{title_html}</h2>'), pos
+
+    def do_section(self, text, pos):
+        _, pos = read_optional(text, skip_star(text, pos))
+        (title,), pos = read_arguments(text, pos, 1)
+        return self.block(f'<h3>{self.inline(title)}</h3>'), pos
+
+    def do_href(self, text, pos):
+        (url, label), pos = read_arguments(text, pos, 2)
+        return f'<a href="{escape(url)}">{self.convert(label)}</a>', pos
+
+    def do_url(self, text, pos):
+        (url,), pos = read_arguments(text, pos, 1)
+        return f'<a href="{escape(url)}">{escape(url)}</a>', pos
+
+    def do_begin(self, text, pos):
+        (name,), pos = read_arguments(text, pos, 1)
+        body, pos = read_environment(text, pos, name)
+        if name in ('itemize', 'enumerate'):
+            tag = 'ul' if name == 'itemize' else 'ol'
+            items = re.split(r'\\item\b', body)[1:]
+            html = ''.join(f'<li>{self.inline(item)}</li>' for item in items)
+            return self.block(f'<{tag}>{html}</{tag}>'), pos
+        if name == 'center':
+            return self.block(f'<div class="center">{self.blocks(body)}</div>'), pos
+        return self.convert(body), pos
+
+    def do_introsection(self, text, pos):
+        (left,), pos = read_arguments(text, pos, 1)
+        # The last introduction section in the guides has only one column
+        right, pos = read_group(text, pos)
+        columns = ''.join(
+            f'<div class="minipage mdframed">{self.blocks(column)}</div>'
+            for column in (left, right) if column is not None
+        )
+        return self.block(f'<section class="intro">{columns}</section>'), pos
+
+    def do_birdentry(self, text, pos):
+        # Top-level entries come pre-parsed from the catalog when one was given
+        start = pos - len('\\birdentry')
+        record = self.catalog_entries.get(start) if text is self.body else None
+        if record:
+            return self.block(self.render_entry(record['tex'])), record['end'] - self.body_start
+        args, pos = read_arguments(text, pos, len(latex_parser.BIRDENTRY_FIELDS))
+        entry = dict(zip(latex_parser.BIRDENTRY_FIELDS, (arg.strip() for arg in args)))
+        return self.block(self.render_entry(entry)), pos
+
+    def do_printindex(self, text, pos):
+        _, pos = read_optional(text, pos)
+        names = []
+        for entry in self.entries:
+            names.append((entry['name_text'], entry['anchor'], entry['name_html']))
+            names.append((entry['latin_text'], entry['anchor'], f"<i>{entry['latin_html']}</i>"))
+        items = ''.join(
+            f'<li><a href="#{anchor}">{label}</a></li>'
+            for _, anchor, label in sorted(names, key=lambda name: name[0].casefold())
+        )
+        heading = ''
+        if self.last_chapter != self.strings['index']:
+            heading = f'<h2 id="index">{self.strings["index"]}</h2>'
+        return self.block(f'<section class="index">{heading}<ul>{items}</ul></section>'), pos
+
+    # Bird entries
+
+    def credit(self, image):
+        lines = self.credits.get(image)
+        if not lines:
+            return ''
+        return 'Credit: ' + escape(' '.join(lines))
+
+    def season(self, image):
+        """Monthly detection frequency bars from the eBird seasonality data"""
+        data = self.seasonality.get(image)
+        if not data:
+            return ''
+        peak = max(data['frequency']) or 1
+        bars = ''.join(
+            f'<i style="height:{max(4, round(100 * value / peak))}%" '
+            f'title="{month}: {value:.0%} {self.strings["checklists"]}"></i>'
+            for month, value in zip(self.strings['months'], data['frequency'])
+        )
+        status = f' {escape(data["status"])}' if data.get('status') else ''
+        return f'<dt>{self.strings["season"]}</dt><dd><span class="seasonality">{bars}</span>{status}</dd>'
+
+    def render_entry(self, entry):
+        name_html = self.inline(entry['name'])
+        latin_html = self.inline(unwrap(entry['latin'], 'textit'))
+        image = entry['image'].strip()
+        anchor = slugify(Path(image).stem) or slugify(name_html)
+        self.entries.append({
+            'anchor': anchor,
+            'name_html': name_html,
+            'latin_html': latin_html,
+            'name_text': re.sub(r'<[^>]+>', '', name_html),
+            'latin_text': re.sub(r'<[^>]+>', '', latin_html),
+        })
+
+        image_exists = not self.credits_dir or (self.credits_dir / image).exists()
+        if image_exists:
+            # name_html is markup already; the alt text is the plain name, escaped once
+            alt = escape(latex_parser.plain_text(entry['name']))
+            image_html = f'<img src="{escape(self.image_prefix + image)}" alt="{alt}" />'
+        else:
+            image_html = f'<div class="missing-image">{self.strings["missing"]}<br />{name_html}</div>'
+
+        fields = '\n'.join(
+            f'<dt>{label}</dt><dd>{self.inline(entry[field])}</dd>'
+            for label, field in zip(self.strings['labels'], DESCRIPTION_FIELDS)
+        ) + self.season(image)
+        return self.entry_template.substitute(
+            anchor=anchor,
+            image=image_html,
+            credit=self.credit(image),
+            number=len(self.entries),
+            name=name_html,
+            latin=latin_html,
+            fields=fields,
+        ).strip()
+
+    # Documents
+
+    def render(self, source, catalog_entries=()):
+        """Render a complete guide document to an HTML page.
+
+        catalog_entries are the source's records from catalog.load_source();
+        their \\birdentry calls are then not parsed a second time.
+        """
+        preamble, body = latex_parser.document_body(source)
+        self.title = latex_parser.preamble_value(preamble, 'title') or ''
+        self.last_chapter = None
+        self.entries = []
+        self.body = body
+        self.body_start = len(preamble) + len('\\begin{document}')
+        self.catalog_entries = {
+            record['offset'] - self.body_start: record for record in catalog_entries
+        }
+        return self.page_template.substitute(
+            lang=self.lang,
+            title=escape(re.sub(r'<[^>]+>', '', self.inline(self.title))),
+            search_placeholder=escape(self.strings['search']),
+            body=self.blocks(self.body),
+        )
+
+
+def skip_star(text, pos):
+    pos = skip_space(text, pos)
+    return pos + 1 if text.startswith('*', pos) else pos
+
+
+def detect_language(tex_file):
+    return 'mr' if 'marathi' in Path(tex_file).stem else 'en'
+
+
+def main():
+    """Render bird guide LaTeX sources directly to HTML"""
+    workspace_root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('tex_files', nargs='*', type=Path, default=[
+        workspace_root / 'latex' / 'bird_guide.tex',
+        workspace_root / 'latex' / 'bird_guide_marathi.tex',
+    ])
+    parser.add_argument('--output-dir', type=Path, default=workspace_root / 'html')
+    parser.add_argument('--template-dir', type=Path, default=TEMPLATE_DIR,
+                        help="Directory containing page.html and bird_entry.html")
+    parser.add_argument('--images-dir', type=Path, default=workspace_root / 'images')
+    parser.add_argument('--seasonality', type=Path, default=SEASONALITY_FILE,
+                        help="Seasonality data written by seasonality.py, if any")
+    args = parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    for tex_file in args.tex_files:
+        start = time.perf_counter()
+        with open(tex_file, 'r', encoding='utf-8') as f:
+            source = f.read()
+        renderer = GuideRenderer(detect_language(tex_file), args.template_dir, args.images_dir,
+                                 seasonality_file=args.seasonality)
+        html = renderer.render(source, catalog.load_source(tex_file))
+        output_file = args.output_dir / f"{tex_file.stem}.html"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(html)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Rendered {len(renderer.entries)} birds to {output_file} in {elapsed:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from atomic_files import write_bytes_atomic
+
+CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'http'
+
+DAY = 24 * 60 * 60
+
+# Time to live for each cacheable endpoint; URLs matching none are never cached
+ENDPOINT_TTLS = (
+    (re.compile(r'^https://ebird\.org/species/'), 7 * DAY),
+    (re.compile(r'^https://search\.macaulaylibrary\.org/api/v1/asset/'), 30 * DAY),
+    (re.compile(r'^https://search\.macaulaylibrary\.org/catalog/search'), DAY),
+)
+
+MAX_BYTES = 200 * 1024 * 1024
+
+
+class CacheMiss(requests.RequestException):
+    """Raised in cache-only mode when a response is not cached"""
+
+
+def endpoint_ttl(url):
+    """TTL in seconds for a URL, or None if it should not be cached"""
+    for pattern, ttl in ENDPOINT_TTLS:
+        if pattern.match(url):
+            return ttl
+    return None
+
+
+class ResponseCache:
+    """Content-addressed store of GET responses with TTLs and LRU eviction"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES, cache_only=False):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.cache_only = cache_only
+        self.lock = threading.Lock()
+        self.total_bytes = None
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        base = self.directory / key[:2] / key
+        return base.with_suffix('.json'), base.with_suffix('.body')
+
+    def get(self, url, partial=False):
+        """Cached response for url, or None if missing or expired.
+
+        Pages cached after a scan stopped early only hold a prefix of the body
+        and are only returned with partial=True, marked by response.partial.
+        """
+        ttl = endpoint_ttl(url)
+        if ttl is None:
+            return None
+        meta_path, body_path = self._paths(self._key(url))
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            # In cache-only mode anything cached is better than nothing
+            if not self.cache_only and time.time() - meta['stored'] > ttl:
+                return None
+            if meta.get('partial') and not partial:
+                return None
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # The body file's mtime doubles as the LRU access time
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.url = url
+        response.encoding = meta.get('encoding')
+        response._content = body
+        response.partial = meta.get('partial', False)
+        return response
+
+    def put(self, url, response, body=None, partial=False):
+        """Store a successful response if its endpoint is cacheable.
+
+        body replaces the response's own content for streamed responses, with
+        partial=True when it is only the prefix that was read.
+        """
+        if response.status_code != 200 or endpoint_ttl(url) is None:
+            return
+        meta_path, body_path = self._paths(self._key(url))
+        meta = {
+            'url': url,
+            'status': response.status_code,
+            # requests has already decoded the body, so its length may not match
+            'headers': {name: value for name, value in response.headers.items()
+                        if body is None or name.lower() not in ('content-encoding', 'content-length')},
+            'encoding': response.encoding,
+            'stored': time.time(),
+            'partial': partial,
+        }
+        if body is None:
+            body = response.content
+        with self.lock:
+            self._scan()
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            if body_path.exists():
+                self.total_bytes -= body_path.stat().st_size
+            # Body first, so a metadata file never points at a missing body
+            write_bytes_atomic(body_path, body)
+            write_bytes_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+            self.total_bytes += len(body)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan(self):
+        if self.total_bytes is None:
+            self.total_bytes = sum(path.stat().st_size for path in self.directory.glob('*/*.body'))
+
+    def _evict(self):
+        # Drop least recently used bodies until the cache is back under 90% of the cap
+        bodies = sorted(self.directory.glob('*/*.body'), key=lambda path: path.stat().st_mtime)
+        target = self.max_bytes * 0.9
+        for body_path in bodies:
+            if self.total_bytes <= target:
+                break
+            size = body_path.stat().st_size
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix('.json').unlink(missing_ok=True)
+            self.total_bytes -= size
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+import catalog
+from atomic_files import write_text_atomic
+from bird_names import COMMON_NAME_VARIANTS, TAXONOMIC_UPDATES
+from render_html import slugify
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+OUTPUT_FILE = WORKSPACE_ROOT / 'html' / 'search-index.js'
+
+INDEX_VERSION = 1
+GRAM = 3
+
+# Must match normalize() in html/script.js
+APOSTROPHES = re.compile(r"['’]")
+SEPARATORS = re.compile(r"[\s\-–—(),./:;!?\"]+")
+COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+
+
+def normalize(text):
+    """Lowercase and strip Latin accents; Devanagari is left intact"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    return unicodedata.normalize('NFC', COMBINING_MARKS.sub('', APOSTROPHES.sub('', text)))
+
+
+def words(text):
+    return [word for word in SEPARATORS.split(normalize(text)) if word]
+
+
+def grams(word):
+    return {word[i:i + GRAM] for i in range(len(word) - GRAM + 1)}
+
+
+def entry_names(bird):
+    """Every name a bird can be searched by: both guides, old and new Latin names, variants"""
+    names = []
+    for lang in catalog.SOURCES:
+        record = bird.get(lang)
+        if record:
+            names += [record['name'], record['latin_name']]
+    english = bird.get('en', {})
+    names += COMMON_NAME_VARIANTS.get(english.get('name'), [])
+    updated = TAXONOMIC_UPDATES.get(english.get('latin_name'))
+    if updated:
+        names.append(updated)
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def build_search_index(birds):
+    """Inverted index from name words to entries, with trigrams for infix matches.
+
+    The client finds prefix matches by binary search over the sorted word
+    list and infix matches by intersecting trigram postings, then unions the
+    postings of the matching words.
+    """
+    ids = []
+    postings = {}
+    for number, bird in enumerate(birds):
+        ids.append(slugify(Path(bird['image']).stem))
+        for name in entry_names(bird):
+            for word in words(name):
+                postings.setdefault(word, set()).add(number)
+
+    vocabulary = sorted(postings)
+    trigram_postings = {}
+    for number, word in enumerate(vocabulary):
+        for gram in grams(word):
+            trigram_postings.setdefault(gram, []).append(number)
+
+    return {
+        'version': INDEX_VERSION,
+        'gram': GRAM,
+        'ids': ids,
+        'words': vocabulary,
+        'postings': [sorted(postings[word]) for word in vocabulary],
+        'grams': dict(sorted(trigram_postings.items())),
+    }
+
+
+def write_search_index(index, output_file=OUTPUT_FILE):
+    """Save the index as a script so the guide also works from file:// URLs"""
+    output_file = Path(output_file)
+    data = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    write_text_atomic(output_file, f"window.SEARCH_INDEX = {data};\n")
+
+
+def main():
+    """Build the client-side search index for the HTML guides"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--output', type=Path, default=OUTPUT_FILE)
+    args = parser.parse_args()
+
+    index = build_search_index(catalog.Catalog().birds())
+    write_search_index(index, args.output)
+    print(f"Indexed {len(index['words'])} words across {len(index['ids'])} birds in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
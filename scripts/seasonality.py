@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+import catalog
+from atomic_files import write_text_atomic
+from bird_names import TAXONOMIC_UPDATES
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+CACHE_DIR = WORKSPACE_ROOT / '.cache' / 'seasonality'
+JSON_OUTPUT = WORKSPACE_ROOT / 'data' / 'seasonality.json'
+TEX_OUTPUT = WORKSPACE_ROOT / 'latex' / 'seasonality.tex'
+
+CACHE_VERSION = 1
+OUTPUT_VERSION = 1
+
+# Bytes handed to each worker; a worker holds a few times this in arrays
+CHUNK_BYTES = 32 * 1024 * 1024
+
+# Approximate outline of the SPPU campus as (latitude, longitude) corners
+CAMPUS_POLYGON = (
+    (18.5610, 73.8150),
+    (18.5610, 73.8330),
+    (18.5440, 73.8330),
+    (18.5440, 73.8150),
+)
+
+# EBD columns read by the engine, with the widest value kept for each
+COLUMNS = {
+    'CATEGORY': 12,
+    'SCIENTIFIC NAME': 64,
+    'LOCALITY ID': 16,
+    'OBSERVATION DATE': 10,
+    'SAMPLING EVENT IDENTIFIER': 16,
+    'GROUP IDENTIFIER': 16,
+    'ALL SPECIES REPORTED': 1,
+}
+COORDINATE_COLUMNS = ('LATITUDE', 'LONGITUDE')
+
+# Records identified to species; spuhs, slashes, hybrids and domestics are left out
+COUNTED_CATEGORIES = np.array([b'species', b'issf', b'form'])
+
+WINTER_MONTHS = {10, 11, 12, 1, 2, 3, 4}
+SUMMER_MONTHS = {3, 4, 5, 6, 7, 8, 9}
+
+# A month counts as occupied above this share of the species' peak frequency
+PRESENCE_SHARE = 0.2
+ABUNDANCE = ((0.30, 'Very common'), (0.10, 'Common'), (0.03, 'Uncommon'), (0.0, 'Rare'))
+
+TAB = ord('\t')
+NEWLINE = ord('\n')
+
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        header = f.readline()
+    return header.rstrip(b'\r\n').decode('utf-8-sig').split('\t'), len(header)
+
+
+def chunk_ranges(path, start, chunk_bytes=CHUNK_BYTES):
+    """Byte ranges of roughly chunk_bytes that each end on a line boundary"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def gather(buf, start, end, width):
+    """Fixed-width byte strings for the fields between start and end, without a Python loop"""
+    index = start[:, None] + np.arange(width)
+    values = buf[np.minimum(index, len(buf) - 1)]
+    values[index >= end[:, None]] = 0
+    return np.ascontiguousarray(values).view(f'S{width}').ravel()
+
+
+def point_in_polygon(latitudes, longitudes, polygon):
+    """Ray casting test of many points against one polygon"""
+    inside = np.zeros(len(latitudes), dtype=bool)
+    corners = list(polygon)
+    for (lat1, lon1), (lat2, lon2) in zip(corners, corners[1:] + corners[:1]):
+        crosses = (lat1 > latitudes) != (lat2 > latitudes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            edge_lon = lon1 + (latitudes - lat1) * (lon2 - lon1) / (lat2 - lat1)
+        inside ^= crosses & (longitudes < edge_lon)
+    return inside
+
+
+def scan_chunk(path, start, end, columns, column_count, hotspots, polygon, since):
+    """Filter one byte range of an EBD file to complete checklists in the area.
+
+    Returns the unique checklists with their month and the unique
+    (species, checklist) detections, which are small next to the chunk.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == NEWLINE)
+    if not len(newlines) or newlines[-1] != len(buf) - 1:
+        newlines = np.append(newlines, len(buf))
+    line_starts = np.concatenate(([0], newlines[:-1] + 1))
+    line_ends = newlines - (buf[np.maximum(newlines - 1, 0)] == ord('\r'))
+
+    # Column c of a row ends at the row's (c + 1)th tab; rows with the wrong
+    # number of tabs are malformed and skipped
+    tabs = np.append(np.flatnonzero(buf == TAB), len(buf))
+    first_tab = np.searchsorted(tabs, line_starts)
+    rows = np.diff(np.append(first_tab, len(tabs) - 1)) == column_count - 1
+    first_tab = first_tab[rows]
+    line_starts = line_starts[rows]
+    line_ends = line_ends[rows]
+
+    def bounds(name):
+        column = columns[name]
+        start = line_starts if column == 0 else tabs[first_tab + column - 1] + 1
+        end = line_ends if column == column_count - 1 else tabs[first_tab + column]
+        return start, end
+
+    def field(name):
+        return gather(buf, *bounds(name), COLUMNS[name])
+
+    # Cheap single-byte tests first, so the wider fields are only read for kept rows
+    keep = buf[bounds('ALL SPECIES REPORTED')[0]] == ord('1')
+    date_start = bounds('OBSERVATION DATE')[0]
+    months = (buf[date_start + 5].astype(np.int32) - ord('0')) * 10 + buf[date_start + 6] - ord('0')
+    keep &= (months >= 1) & (months <= 12)
+    if since:
+        years = sum((buf[date_start + i].astype(np.int32) - ord('0')) * 10 ** (3 - i) for i in range(4))
+        keep &= years >= since
+    first_tab, line_starts, line_ends, months = first_tab[keep], line_starts[keep], line_ends[keep], months[keep]
+
+    if hotspots or polygon:
+        localities = field('LOCALITY ID')
+        in_area = np.zeros(len(localities), dtype=bool)
+        if hotspots:
+            in_area |= np.isin(localities, np.array(sorted(hotspots), dtype='S16'))
+        if polygon:
+            # Coordinates are parsed once per locality rather than once per row
+            _, first, inverse = np.unique(localities, return_index=True, return_inverse=True)
+            lat_start, lat_end = bounds('LATITUDE')
+            lon_start, lon_end = bounds('LONGITUDE')
+            latitudes = np.array([float(data[lat_start[i]:lat_end[i]] or 'nan') for i in first])
+            longitudes = np.array([float(data[lon_start[i]:lon_end[i]] or 'nan') for i in first])
+            in_area |= point_in_polygon(latitudes, longitudes, polygon)[inverse.ravel()]
+        first_tab, line_starts, line_ends, months = (
+            first_tab[in_area], line_starts[in_area], line_ends[in_area], months[in_area])
+
+    groups = field('GROUP IDENTIFIER')
+    # Shared group checklists count once, however many observers submitted them
+    checklists = np.where(groups != b'', groups, field('SAMPLING EVENT IDENTIFIER'))
+    counted = np.isin(field('CATEGORY'), COUNTED_CATEGORIES)
+    species = field('SCIENTIFIC NAME')
+
+    checklist_ids, first = np.unique(checklists, return_index=True)
+    detections = np.unique(np.rec.fromarrays([species[counted], checklists[counted]], names='species,checklist'))
+    return checklist_ids, months[first].astype(np.uint8), detections
+
+
+def aggregate(path, hotspots=(), polygon=None, since=None, workers=None, chunk_bytes=CHUNK_BYTES):
+    """Monthly checklist totals and per-species detections for an EBD file, using every core"""
+    names, header_bytes = read_header(path)
+    missing = [name for name in (*COLUMNS, *COORDINATE_COLUMNS) if name not in names]
+    if missing:
+        raise ValueError(f"{path} is not an EBD export; missing columns: {', '.join(missing)}")
+    columns = {name: names.index(name) for name in (*COLUMNS, *COORDINATE_COLUMNS)}
+
+    workers = workers or os.cpu_count() or 1
+    checklist_parts, month_parts, detection_parts = [], [], []
+
+    def collect(future):
+        checklists, months, detections = future.result()
+        checklist_parts.append(checklists)
+        month_parts.append(months)
+        detection_parts.append(detections)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Only a couple of chunks per worker are in flight, keeping memory bounded
+        pending = deque()
+        for start, end in chunk_ranges(path, header_bytes, chunk_bytes):
+            pending.append(executor.submit(
+                scan_chunk, path, start, end, columns, len(names), tuple(hotspots), polygon, since,
+            ))
+            if len(pending) >= workers * 2:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+
+    if not checklist_parts:
+        return {'checklists': [0] * 12, 'species': {}}
+    # A checklist split across two chunks appears in both
+    checklist_ids, first = np.unique(np.concatenate(checklist_parts), return_index=True)
+    months = np.concatenate(month_parts)[first]
+    per_month = np.bincount(months, minlength=13)[1:13]
+
+    detections = np.unique(np.concatenate(detection_parts))
+    detection_months = months[np.searchsorted(checklist_ids, detections['checklist'])]
+    species, index = np.unique(detections['species'], return_inverse=True)
+    counts = np.zeros((len(species), 12), dtype=np.int64)
+    np.add.at(counts, (index.ravel(), detection_months.astype(np.intp) - 1), 1)
+    return {
+        'checklists': per_month.tolist(),
+        'species': {name.decode('utf-8'): row.tolist() for name, row in zip(species, counts)},
+    }
+
+
+def cache_key(path, hotspots, polygon, since):
+    """Identity of an input file and filter, so a rerun over the same export is free"""
+    stat = os.stat(path)
+    identity = {
+        'version': CACHE_VERSION,
+        'path': str(Path(path).resolve()),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hotspots': sorted(hotspots),
+        'polygon': polygon,
+        'since': since,
+    }
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_aggregate(path, hotspots=(), polygon=None, since=None, workers=None, cache_dir=CACHE_DIR):
+    """Aggregate an EBD file, reusing the cached result for an unchanged file and filter"""
+    polygon = [list(corner) for corner in polygon] if polygon else None
+    cache_file = Path(cache_dir) / f"{cache_key(path, hotspots, polygon, since)}.json"
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    result = aggregate(path, hotspots, polygon, since, workers)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(cache_file, json.dumps(result, ensure_ascii=False))
+    return result
+
+
+def merge(aggregates):
+    """Sum the aggregates of several EBD files, e.g. one per year"""
+    merged = {'checklists': [0] * 12, 'species': {}}
+    for result in aggregates:
+        merged['checklists'] = [a + b for a, b in zip(merged['checklists'], result['checklists'])]
+        for name, counts in result['species'].items():
+            total = merged['species'].setdefault(name, [0] * 12)
+            merged['species'][name] = [a + b for a, b in zip(total, counts)]
+    return merged
+
+
+def derived_status(frequency):
+    """Abundance and residency in the guide's own words, e.g. "Common resident" """
+    peak = max(frequency)
+    if not peak:
+        return None
+    present = {month for month, value in enumerate(frequency, 1) if value >= peak * PRESENCE_SHARE}
+    if len(present) >= 10:
+        residency = 'resident'
+    elif present <= WINTER_MONTHS:
+        residency = 'winter visitor'
+    elif present <= SUMMER_MONTHS:
+        residency = 'summer visitor'
+    elif len(present) <= 3:
+        residency = 'passage migrant'
+    else:
+        residency = 'local migrant'
+    mean = sum(frequency[month - 1] for month in present) / len(present)
+    abundance = next(label for threshold, label in ABUNDANCE if mean >= threshold)
+    return f"{abundance} {residency}"
+
+
+def guide_seasonality(result, birds):
+    """Per-image monthly detection frequencies and derived status for the guide's birds"""
+    checklists = result['checklists']
+    entries = {}
+    for bird in birds:
+        latin_name = bird['en']['latin_name']
+        ebird_name = TAXONOMIC_UPDATES.get(latin_name, latin_name)
+        counts = result['species'].get(ebird_name)
+        if not counts:
+            continue
+        frequency = [round(count / total, 3) if total else 0.0 for count, total in zip(counts, checklists)]
+        entries[bird['image']] = {
+            'latin_name': ebird_name,
+            'frequency': frequency,
+            'status': derived_status(frequency),
+        }
+    return {'version': OUTPUT_VERSION, 'checklists': checklists, 'birds': entries}
+
+
+def seasonality_tex(data):
+    """Macro table of monthly bar charts, looked up by image name like the credits"""
+    lines = [
+        "% Generated by scripts/seasonality.py from eBird Basic Dataset checklists; do not edit",
+        r"\makeatletter",
+        r"\providecommand{\seasonbar}[1]{\rule{0.35em}{#1}\hspace{0.1em}}",
+    ]
+    for image_name, entry in sorted(data['birds'].items()):
+        peak = max(entry['frequency']) or 1
+        bars = ''.join(rf"\seasonbar{{{max(0.05, 1.2 * value / peak):.2f}em}}" for value in entry['frequency'])
+        lines.append(rf"\@namedef{{seasonality@{image_name}}}{{{bars}}}")
+        if entry['status']:
+            lines.append(rf"\@namedef{{seasonstatus@{image_name}}}{{{entry['status']}}}")
+    lines.append(r"\makeatother")
+    return '\n'.join(lines) + '\n'
+
+
+def write_outputs(data, json_path=JSON_OUTPUT, tex_path=TEX_OUTPUT):
+    Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(json_path, json.dumps(data, indent=1, ensure_ascii=False) + '\n')
+    write_text_atomic(tex_path, seasonality_tex(data))
+
+
+def parse_polygon(value):
+    """Polygon given as "lat,lon;lat,lon;..." """
+    try:
+        corners = [tuple(float(part) for part in corner.split(',')) for corner in value.split(';') if corner]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected lat,lon;lat,lon;..., got {value!r}")
+    if len(corners) < 3 or any(len(corner) != 2 for corner in corners):
+        raise argparse.ArgumentTypeError("a polygon needs at least three lat,lon corners")
+    return corners
+
+
+def main(argv=None):
+    """Aggregate eBird Basic Dataset exports into monthly seasonality for the guide's birds"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('ebd_files', nargs='+', type=Path,
+                        help="Extracted EBD .txt files (tab-separated), e.g. a Pune district export")
+    parser.add_argument('--hotspot', action='append', default=[], metavar='LOCALITY_ID',
+                        help="Keep checklists from this eBird locality; repeatable")
+    parser.add_argument('--polygon', type=parse_polygon,
+                        help="Keep checklists inside lat,lon;lat,lon;... (default: the campus outline, "
+                             "unless hotspots are given)")
+    parser.add_argument('--since', type=int, metavar='YEAR', help="Ignore checklists before YEAR")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processes scanning chunks in parallel (default: one per core)")
+    args = parser.parse_args(argv)
+
+    polygon = args.polygon or (None if args.hotspot else CAMPUS_POLYGON)
+    results = []
+    for path in args.ebd_files:
+        print(f"Scanning {path}...")
+        results.append(load_aggregate(path, args.hotspot, polygon, args.since, args.workers))
+    result = merge(results)
+    print(f"{sum(result['checklists'])} complete checklists, {len(result['species'])} species")
+
+    data = guide_seasonality(result, catalog.Catalog().birds())
+    write_outputs(data)
+    print(f"Seasonality for {len(data['birds'])} guide birds written to {JSON_OUTPUT} and {TEX_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import hashlib
+import io
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import catalog
+import http_client
+
+# Every host the scripts talk to, all answered by the one local server
+HOSTS = (
+    'api.ebird.org',
+    'ebird.org',
+    'search.macaulaylibrary.org',
+    'cdn.download.ams.birds.cornell.edu',
+)
+
+ASSET_URL = 'https://cdn.download.ams.birds.cornell.edu/api/v1/asset/{}'
+SYLLABLES = ('ka', 'ro', 'mi', 'ta', 'lu', 'ne', 'sa', 'pi', 'do', 've', 'ri', 'bu', 'ga', 'fe', 'an', 'el')
+GROUPS = ('Warbler', 'Flycatcher', 'Babbler', 'Dove', 'Owl', 'Wren', 'Finch', 'Thrush', 'Kingfisher', 'Bulbul')
+
+
+def species_code(common_name):
+    """eBird-style code: up to six letters from the name plus a digit"""
+    words = re.findall(r'[a-z]+', common_name.lower())
+    if len(words) == 1:
+        letters = words[0][:6]
+    else:
+        letters = ''.join(word[:3] for word in words[-2:])
+    return f"{letters}1"
+
+
+def synthetic_taxonomy(size, seed=0):
+    """Guide species first, then made-up species until there are size rows"""
+    rows = []
+    seen = set()
+    for bird in catalog.Catalog().birds():
+        english = bird['en']
+        rows.append((english['name'], english['latin_name']))
+    rng = random.Random(seed)
+    while len(rows) < size:
+        modifier = ''.join(rng.choices(SYLLABLES, k=3)).capitalize()
+        genus = ''.join(rng.choices(SYLLABLES, k=3)).capitalize()
+        rows.append((f"{modifier} {rng.choice(GROUPS)}", f"{genus} {''.join(rng.choices(SYLLABLES, k=4))}"))
+
+    taxonomy = []
+    for common_name, scientific_name in rows:
+        code = species_code(common_name)
+        while code in seen:
+            code = code[:-1] + str(int(code[-1]) + 1) if code[-1].isdigit() else code + '1'
+        seen.add(code)
+        taxonomy.append({
+            'SCIENTIFIC_NAME': scientific_name,
+            'COMMON_NAME': common_name,
+            'SPECIES_CODE': code,
+            'CATEGORY': 'species',
+        })
+    return taxonomy
+
+
+def taxonomy_csv(taxonomy):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=['SCIENTIFIC_NAME', 'COMMON_NAME', 'SPECIES_CODE', 'CATEGORY'])
+    writer.writeheader()
+    writer.writerows(taxonomy)
+    return out.getvalue().encode('utf-8')
+
+
+def taxonomy_json(taxonomy):
+    """The same rows as the API's fmt=json form, with its camelCase field names"""
+    rows = [{
+        'sciName': row['SCIENTIFIC_NAME'],
+        'comName': row['COMMON_NAME'],
+        'speciesCode': row['SPECIES_CODE'],
+        'category': row['CATEGORY'],
+        'taxonOrder': float(number + 1),
+    } for number, row in enumerate(taxonomy)]
+    return json.dumps(rows).encode('utf-8')
+
+
+def body_etag(body):
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+
+class StandIn:
+    """Synthetic eBird and Macaulay Library data with injectable latency and errors"""
+
+    def __init__(self, species=17000, image_bytes=300 * 1024, latency=0.0, error_rate=0.0, seed=0):
+        self.taxonomy = synthetic_taxonomy(species, seed)
+        # fmt -> (body, ETag, content type); the API answers in CSV unless asked for JSON
+        self.taxonomy_formats = {}
+        for fmt, body, content_type in (('csv', taxonomy_csv(self.taxonomy), 'text/csv'),
+                                        ('json', taxonomy_json(self.taxonomy), 'application/json')):
+            self.taxonomy_formats[fmt] = (body, body_etag(body), content_type)
+        self.assets = {}
+        for number, row in enumerate(self.taxonomy):
+            self.assets[row['SPECIES_CODE']] = str(100000000 + number)
+        self.image = random.Random(seed).randbytes(image_bytes)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+
+    def count(self, sent):
+        with self.lock:
+            self.requests += 1
+            self.bytes_sent += sent
+
+    def should_fail(self):
+        with self.lock:
+            return self.rng.random() < self.error_rate
+
+
+def make_handler(stand_in):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_body(self, status, body, content_type, headers=None):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+            stand_in.count(len(body))
+
+        def do_GET(self):
+            if stand_in.latency:
+                time.sleep(stand_in.latency)
+            if stand_in.should_fail():
+                self.send_body(503, b'Service Unavailable', 'text/plain', {'Retry-After': '0'})
+                return
+            url = urlsplit(self.path)
+            path = url.path
+
+            if path == '/v2/ref/taxonomy/ebird':
+                fmt = parse_qs(url.query).get('fmt', ['csv'])[0]
+                if fmt not in stand_in.taxonomy_formats:
+                    self.send_body(400, b'Bad Request', 'text/plain')
+                    return
+                body, tag, content_type = stand_in.taxonomy_formats[fmt]
+                if self.headers.get('If-None-Match') == tag:
+                    self.send_body(304, b'', content_type, {'ETag': tag})
+                else:
+                    self.send_body(200, body, content_type, {'ETag': tag})
+                return
+
+            match = re.fullmatch(r'/species/([a-z0-9]+)', path)
+            if match:
+                asset_id = stand_in.assets.get(match.group(1))
+                if not asset_id:
+                    self.send_body(404, b'Not Found', 'text/plain')
+                    return
+                page = f'<html><body><img src="{ASSET_URL.format(asset_id)}/1200" /></body></html>'
+                self.send_body(200, page.encode('utf-8'), 'text/html')
+                return
+
+            match = re.fullmatch(r'/api/v1/asset/(\d+)', path)
+            if match:
+                details = {
+                    'assetId': match.group(1),
+                    'userDisplayName': 'Stand-in Photographer',
+                    'userId': 'USER1',
+                    'obsDt': '2024-01-01T07:00',
+                    'locationLine1': 'Savitribai Phule Pune University',
+                    'locationLine2': 'Pune, Maharashtra, India',
+                }
+                self.send_body(200, json.dumps(details).encode('utf-8'), 'application/json')
+                return
+
+            if re.fullmatch(r'/api/v1/asset/\d+/\d+', path):
+                self.send_image()
+                return
+
+            if path == '/catalog/search':
+                self.send_body(200, b'<html><body></body></html>', 'text/html')
+                return
+
+            self.send_body(404, b'Not Found', 'text/plain')
+
+        def send_image(self):
+            image = stand_in.image
+            etag = '"' + hashlib.sha256(image).hexdigest()[:16] + '"'
+            match = re.fullmatch(r'bytes=(\d+)-', self.headers.get('Range', ''))
+            if match:
+                start = int(match.group(1))
+                if start >= len(image):
+                    self.send_body(416, b'', 'image/jpeg', {'Content-Range': f"bytes */{len(image)}"})
+                    return
+                self.send_body(206, image[start:], 'image/jpeg', {
+                    'Content-Range': f"bytes {start}-{len(image) - 1}/{len(image)}",
+                    'ETag': etag,
+                })
+                return
+            self.send_body(200, image, 'image/jpeg', {'ETag': etag})
+
+    return Handler
+
+
+class StandInServer:
+    """Local HTTP server standing in for eBird and Macaulay Library, usable as a context manager"""
+
+    def __init__(self, stand_in, port=0):
+        self.stand_in = stand_in
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(stand_in))
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        for host in HOSTS:
+            http_client.set_host_override(host, self.base_url)
+        return self
+
+    def __exit__(self, *exc_info):
+        for host in HOSTS:
+            http_client.set_host_override(host, None)
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    """Serve synthetic eBird and Macaulay Library responses locally"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--species', type=int, default=17000, help="Taxonomy size (default: 17000)")
+    parser.add_argument('--image-kb', type=int, default=300, help="Size of every image in KB")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="Fraction of requests answered with HTTP 503")
+    args = parser.parse_args()
+
+    stand_in = StandIn(args.species, args.image_kb * 1024, args.latency, args.error_rate)
+    server = StandInServer(stand_in, args.port)
+    print(f"Serving {len(stand_in.taxonomy)} species on {server.base_url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import csv
+import json
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+
+from atomic_files import open_atomic
+
+TAXONOMY_URL = "https://api.ebird.org/v2/ref/taxonomy/ebird"
+
+# Shared on-disk cache used by every script in this directory
+CACHE_DIR = Path(__file__).parent.parent / '.cache'
+TAXONOMY_FILE = 'ebird_taxonomy.json'
+
+# Skip revalidation entirely while the cache is younger than this
+MAX_AGE = 24 * 60 * 60
+
+# Only the columns the scripts actually use are kept on disk
+COLUMNS = ('SPECIES_CODE', 'SCIENTIFIC_NAME', 'COMMON_NAME', 'CATEGORY')
+
+CACHE_VERSION = 1
+
+
+class TaxonomyTable:
+    """Columnar, read-only view of the eBird taxonomy"""
+
+    def __init__(self, columns, etag=None, last_modified=None, fetched=0):
+        self.columns = columns
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched = fetched
+
+    def __len__(self):
+        return len(self.columns['SPECIES_CODE'])
+
+    def __iter__(self):
+        # Rows are built on demand so only the columns stay resident
+        names = list(self.columns)
+        for values in zip(*(self.columns[name] for name in names)):
+            yield dict(zip(names, values))
+
+    @classmethod
+    def from_csv(cls, text, etag=None, last_modified=None):
+        """Parse the taxonomy CSV into interned columns"""
+        columns = {name: [] for name in COLUMNS}
+        for row in csv.DictReader(StringIO(text)):
+            for name in COLUMNS:
+                columns[name].append(sys.intern(row.get(name) or ''))
+        return cls(columns, etag, last_modified, time.time())
+
+    @classmethod
+    def load(cls, path):
+        """Load a cached table, returning None if it is missing or unreadable"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != CACHE_VERSION:
+            return None
+        columns = {
+            name: [sys.intern(value) for value in data['columns'][name]]
+            for name in COLUMNS
+        }
+        return cls(columns, data.get('etag'), data.get('last_modified'), data.get('fetched', 0))
+
+    def save(self, path):
+        """Write the table atomically so readers never see a partial file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': CACHE_VERSION,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'fetched': self.fetched,
+            'columns': self.columns,
+        }
+        with open_atomic(path) as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_taxonomy(api_key, cache_dir=CACHE_DIR, max_age=MAX_AGE):
+    """Return the taxonomy table, revalidating the on-disk cache when stale"""
+    path = Path(cache_dir) / TAXONOMY_FILE
+    cached = TaxonomyTable.load(path)
+    if cached and time.time() - cached.fetched < max_age:
+        return cached
+
+    headers = {
+        "X-eBirdApiToken": api_key
+    }
+    if cached:
+        if cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+    # Imported only when going online: requests dominates start-up time
+    import http_client
+
+    try:
+        response = http_client.get(TAXONOMY_URL, headers=headers)
+        if response.status_code == 304 and cached:
+            print("Taxonomy cache is up to date")
+            cached.fetched = time.time()
+            cached.save(path)
+            return cached
+        response.raise_for_status()
+
+        table = TaxonomyTable.from_csv(
+            response.text,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        table.save(path)
+        print(f"Cached {len(table)} taxonomy entries")
+        return table
+    except Exception as e:
+        if cached:
+            print(f"Error revalidating taxonomy, using cached copy: {e}")
+            return cached
+        print(f"Error fetching taxonomy: {e}")
+        return None
@@ -0,0 +1,126 @@
+from fuzzy_match import TrigramMatcher
+
+# Minimum trigram similarity for a fuzzy match to be accepted
+FUZZY_THRESHOLD = 0.6
+
+
+class TaxonomyIndex:
+    """In-memory lookup tables over the eBird taxonomy rows"""
+
+    def __init__(self, rows, variants=None, updates=None):
+        # Each table maps a lowercased key to (species_code, matched_name).
+        # Only the first row for a key is kept so results agree with the
+        # old top-to-bottom scans over the taxonomy list.
+        self.by_scientific = {}
+        self.by_common = {}
+        self.by_genus = {}
+        self.by_code = {}
+        for row in rows:
+            code = row['SPECIES_CODE']
+            scientific = row['SCIENTIFIC_NAME']
+            common = row['COMMON_NAME']
+            scientific_key = scientific.lower()
+            self.by_code.setdefault(code, (common, scientific))
+            self.by_scientific.setdefault(scientific_key, (code, scientific))
+            self.by_common.setdefault(common.lower(), (code, common))
+            genus = scientific_key.split(' ', 1)[0]
+            if genus:
+                self.by_genus.setdefault(genus, (code, scientific))
+
+        self.variants = {}
+        for name, alternates in (variants or {}).items():
+            self.variants[name] = [variant.lower() for variant in alternates]
+        self.updates = dict(updates or {})
+        self._matcher = None
+
+    def __len__(self):
+        return len(self.by_scientific)
+
+    def species(self, species_code):
+        """(common_name, scientific_name) for a species code, or None"""
+        return self.by_code.get(species_code)
+
+    def scientific(self, latin_name):
+        """Exact scientific name match"""
+        return self.by_scientific.get(latin_name.lower())
+
+    def common(self, common_name):
+        """Exact common name match"""
+        return self.by_common.get(common_name.lower())
+
+    def variant(self, common_name):
+        """First known alternate common name that exists in the taxonomy"""
+        for variant in self.variants.get(common_name, ()):
+            match = self.by_common.get(variant)
+            if match:
+                return match
+        return None
+
+    def genus(self, latin_name):
+        """First species in taxonomic order belonging to the same genus"""
+        parts = latin_name.split()
+        if not parts:
+            return None
+        return self.by_genus.get(parts[0].lower())
+
+    @property
+    def matcher(self):
+        """Trigram index over every taxonomy name and known alias, built on first use"""
+        if self._matcher is None:
+            matcher = TrigramMatcher()
+            for table in (self.by_common, self.by_scientific):
+                for match in table.values():
+                    matcher.add(match[1], match)
+            # Guide names and their alternates resolve to whatever the guide name does
+            for name, alternates in self.variants.items():
+                match = self.common(name) or self.variant(name)
+                if match:
+                    for alias in (name, *alternates):
+                        matcher.add(alias, match)
+            for old_name, new_name in self.updates.items():
+                match = self.scientific(new_name)
+                if match:
+                    matcher.add(old_name, match)
+            self._matcher = matcher
+        return self._matcher
+
+    def candidates(self, name, limit=5):
+        """Ranked approximate matches for a name as (score, species_code, matched_name)"""
+        # Aliases of one species can all match, so ask for extra and keep the best per species
+        found = {}
+        for score, _, match in self.matcher.search(name, limit * 3, FUZZY_THRESHOLD):
+            found.setdefault(match[0], (score, match[0], match[1]))
+        return list(found.values())[:limit]
+
+    def fuzzy(self, common_name, latin_name):
+        """Closest species by either name, if it is similar enough"""
+        best = None
+        for name in (common_name, latin_name):
+            if not name:
+                continue
+            found = self.candidates(name, limit=1)
+            if found and (best is None or found[0][0] > best[0]):
+                best = found[0]
+        return best[1:] if best else None
+
+    def lookup(self, common_name, latin_name):
+        """Resolve a bird to (species_code, match_type, matched_name) or None"""
+        for match_type, finder, args in (
+            ('scientific name', self.scientific, (latin_name,)),
+            ('common name', self.common, (common_name,)),
+            ('variant', self.variant, (common_name,)),
+            ('fuzzy', self.fuzzy, (common_name, latin_name)),
+            ('genus', self.genus, (latin_name,)),
+        ):
+            match = finder(*args)
+            if match:
+                return match[0], match_type, match[1]
+        return None
+
+    def resolve_many(self, birds):
+        """Resolve a list of bird dicts, returning species codes in the same order"""
+        codes = []
+        for bird in birds:
+            match = self.lookup(bird['common_name'], bird['latin_name'])
+            codes.append(match[0] if match else None)
+        return codes
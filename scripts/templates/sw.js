@@ -0,0 +1,83 @@
+// Generated by scripts/publish.py: keeps the whole guide available offline
+const CACHE = 'bird-guide-$version';
+const PRECACHE = $precache;
+// Responsive image renditions not in PRECACHE -> the precached rendition of the same photo
+const FALLBACKS = $fallbacks;
+const START_PAGE = 'bird_guide.html';
+
+self.addEventListener('install', function(event) {
+  event.waitUntil(
+    caches.open(CACHE).then(function(cache) {
+      return cache.addAll(PRECACHE.map(function(url) {
+        return new Request(url, {cache: 'no-cache'});
+      }));
+    }).then(function() {
+      return self.skipWaiting();
+    })
+  );
+});
+
+self.addEventListener('activate', function(event) {
+  event.waitUntil(
+    caches.keys().then(function(keys) {
+      return Promise.all(keys.filter(function(key) {
+        return key.startsWith('bird-guide-') && key !== CACHE;
+      }).map(function(key) {
+        return caches.delete(key);
+      }));
+    }).then(function() {
+      return self.clients.claim();
+    })
+  );
+});
+
+function relativePath(url) {
+  const scope = self.registration.scope;
+  return url.startsWith(scope) ? url.slice(scope.length).split(/[?#]/)[0] : null;
+}
+
+function store(request, response) {
+  if (response.ok) {
+    const copy = response.clone();
+    caches.open(CACHE).then(function(cache) {
+      cache.put(request, copy);
+    });
+  }
+  return response;
+}
+
+self.addEventListener('fetch', function(event) {
+  const request = event.request;
+  const path = relativePath(request.url);
+  if (request.method !== 'GET' || path === null) {
+    return;
+  }
+
+  if (request.mode === 'navigate') {
+    // Pages are not fingerprinted: prefer the network so updates show up when online
+    event.respondWith(
+      fetch(request).then(function(response) {
+        return store(request, response);
+      }).catch(function() {
+        return caches.match(request, {ignoreSearch: true}).then(function(cached) {
+          return cached || caches.match(path === '' ? START_PAGE : path);
+        });
+      })
+    );
+    return;
+  }
+
+  // Everything else is fingerprinted and never changes under the same name
+  event.respondWith(
+    caches.match(request).then(function(cached) {
+      return cached || fetch(request).then(function(response) {
+        return store(request, response);
+      }).catch(function(error) {
+        if (FALLBACKS[path]) {
+          return caches.match(FALLBACKS[path]);
+        }
+        throw error;
+      });
+    })
+  );
+});
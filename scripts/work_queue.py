@@ -0,0 +1,242 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Seconds a worker holds a job without a heartbeat before others may take it over
+LEASE_SECONDS = 300
+
+# Seconds an idle worker waits before checking whether another worker's lease expired
+POLL_SECONDS = 15
+
+# Attempts per job before it is marked failed, counting leases that expired
+MAX_ATTEMPTS = 3
+
+# Seconds to wait for another process's write lock
+BUSY_TIMEOUT = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    bird TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    reason TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, lease_expires);
+CREATE TABLE IF NOT EXISTS merge (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    worker TEXT NOT NULL,
+    state TEXT NOT NULL,
+    started REAL NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+
+def worker_name():
+    """Identifies this process in the job table, e.g. host:1234"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """Job table in an SQLite file shared by workers on one or more machines.
+
+    Workers lease one job at a time and must heartbeat before the lease runs
+    out; a job whose worker died is leased again once its lease expires, up
+    to max_attempts times. Every write happens in its own transaction, so the
+    file can sit on shared storage without a server. The rollback journal is
+    used rather than WAL, which needs shared memory that network filesystems
+    do not provide.
+    """
+
+    def __init__(self, path, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # executescript() commits on its own, so it cannot run inside transaction()
+        db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        try:
+            db.executescript(SCHEMA)
+        finally:
+            db.close()
+
+    @contextmanager
+    def transaction(self):
+        """Connection holding the database's write lock until the block ends"""
+        db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        try:
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                yield db
+            except BaseException:
+                db.execute('ROLLBACK')
+                raise
+            db.execute('COMMIT')
+        finally:
+            db.close()
+
+    def add(self, jobs):
+        """Queue (key, bird) pairs, skipping keys already in the table; returns how many were new"""
+        now = time.time()
+        with self.transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                'INSERT OR IGNORE INTO jobs (key, bird, updated) VALUES (?, ?, ?)',
+                ((key, json.dumps(bird, ensure_ascii=False), now) for key, bird in jobs),
+            )
+            return db.total_changes - before
+
+    def lease(self, worker):
+        """Take the next pending or abandoned job as (key, bird), or None if there is nothing to do"""
+        now = time.time()
+        with self.transaction() as db:
+            # Abandoned jobs that have used up their attempts are not retried again
+            db.execute(
+                "UPDATE jobs SET state = 'failed', reason = 'Lease expired', worker = NULL, updated = ? "
+                "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            row = db.execute(
+                "SELECT key, bird FROM jobs WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                "ORDER BY attempts, rowid LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET state = 'leased', worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, updated = ? WHERE key = ?",
+                (worker, now + self.lease_seconds, now, row[0]),
+            )
+        return row[0], json.loads(row[1])
+
+    def heartbeat(self, key, worker):
+        """Extend a lease; False if the job is no longer held by this worker"""
+        now = time.time()
+        with self.transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET lease_expires = ?, updated = ? WHERE key = ? AND worker = ? AND state = 'leased'",
+                (now + self.lease_seconds, now, key, worker),
+            )
+            return cursor.rowcount == 1
+
+    def finish(self, key, worker, success, reason=None, result=None):
+        """Record a job's outcome; failures go back to pending until they run out of attempts.
+
+        Returns False if the lease had been lost to another worker, whose
+        outcome then counts instead.
+        """
+        now = time.time()
+        with self.transaction() as db:
+            row = db.execute(
+                "SELECT attempts FROM jobs WHERE key = ? AND worker = ? AND state = 'leased'",
+                (key, worker),
+            ).fetchone()
+            if row is None:
+                return False
+            if success:
+                state = 'done'
+            else:
+                state = 'pending' if row[0] < self.max_attempts else 'failed'
+            db.execute(
+                "UPDATE jobs SET state = ?, worker = NULL, lease_expires = NULL, result = ?, reason = ?, "
+                "updated = ? WHERE key = ?",
+                (state, json.dumps(result, ensure_ascii=False) if result is not None else None, reason, now, key),
+            )
+        return True
+
+    def retry_failed(self):
+        """Give failed jobs a fresh set of attempts; returns how many were requeued"""
+        with self.transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET state = 'pending', attempts = 0, reason = NULL, updated = ? WHERE state = 'failed'",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def claim_merge(self, worker):
+        """Claim the job of merging results once the queue has drained; True for exactly one caller.
+
+        A merge is due again after jobs change, and a claim whose worker died
+        without finishing expires like a lease.
+        """
+        now = time.time()
+        with self.transaction() as db:
+            if db.execute("SELECT 1 FROM jobs WHERE state IN ('pending', 'leased') LIMIT 1").fetchone():
+                return False
+            claim = db.execute('SELECT state, started, expires FROM merge').fetchone()
+            if claim:
+                state, started, expires = claim
+                last_change = db.execute('SELECT MAX(updated) FROM jobs').fetchone()[0] or 0
+                if state == 'merging' and expires > now:
+                    return False
+                if state == 'merged' and started >= last_change:
+                    return False
+            db.execute(
+                "INSERT OR REPLACE INTO merge (id, worker, state, started, expires) VALUES (1, ?, 'merging', ?, ?)",
+                (worker, now, now + self.lease_seconds),
+            )
+        return True
+
+    def finish_merge(self, worker):
+        """Mark a claimed merge as written"""
+        with self.transaction() as db:
+            db.execute("UPDATE merge SET state = 'merged' WHERE worker = ? AND state = 'merging'", (worker,))
+
+    def counts(self):
+        """Number of jobs in each state"""
+        with self.transaction() as db:
+            return dict(db.execute('SELECT state, COUNT(*) FROM jobs GROUP BY state'))
+
+    def failures(self):
+        """(key, reason) for every job that failed for good"""
+        with self.transaction() as db:
+            return db.execute("SELECT key, reason FROM jobs WHERE state = 'failed' ORDER BY key").fetchall()
+
+    def results(self):
+        """Decoded results of every finished job"""
+        with self.transaction() as db:
+            rows = db.execute("SELECT result FROM jobs WHERE state = 'done' AND result IS NOT NULL").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+class Heartbeat:
+    """Background thread that keeps a lease alive while its job runs"""
+
+    def __init__(self, queue, key, worker, interval=None):
+        self.queue = queue
+        self.key = key
+        self.worker = worker
+        self.interval = interval or queue.lease_seconds / 3
+        self.stopped = threading.Event()
+        self.lost = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                if not self.queue.heartbeat(self.key, self.worker):
+                    self.lost = True
+                    print(f"Lost the lease on {self.key}")
+                    return
+            except sqlite3.Error as e:
+                # A busy or briefly unreachable database is retried at the next beat
+                print(f"Heartbeat for {self.key} failed: {e}")
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
@@ -0,0 +1,58 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# The scripts import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+
+class ImageServer(ThreadingHTTPServer):
+    """Serves fixed bodies with strong ETags, honouring Range and If-Range"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), ImageHandler)
+        self.images = {}
+        self.requests = []
+        # Bytes of the next reply sent before the connection drops, if set
+        self.cut_after = None
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_port}{path}"
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body, etag = self.server.images[self.path]
+        self.server.requests.append(dict(self.headers))
+        requested = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if requested and if_range in (None, etag):
+            start = int(requested[len('bytes='):-1])
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.server.cut_after is not None:
+            body, self.server.cut_after = body[:self.server.cut_after], None
+            self.close_connection = True
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ImageServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import get_ebird_code
+from download_ebird_images import download_image, part_info_file
+
+
+@pytest.fixture
+def target(tmp_path):
+    return tmp_path / 'bird.jpg'
+
+
+def leave_part(target, data, url=None, etag=None):
+    """What an interrupted download leaves behind"""
+    part = f"{target}.part"
+    with open(part, 'wb') as f:
+        f.write(data)
+    if url is not None:
+        with open(part_info_file(part), 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag}, f)
+
+
+def assert_downloaded(target, body):
+    assert target.read_bytes() == body
+    assert not (target.parent / f"{target.name}.part").exists()
+    assert not (target.parent / f"{target.name}.part.json").exists()
+
+
+def test_resumes_the_same_image(server, target):
+    body = bytes(range(256)) * 20
+    server.images['/a'] = (body, '"a1"')
+    leave_part(target, body[:1000], server.url('/a'), '"a1"')
+    assert download_image(server.url('/a'), target) == {'etag': '"a1"'}
+    assert_downloaded(target, body)
+    assert server.requests[0]['Range'] == 'bytes=1000-'
+    assert server.requests[0]['If-Range'] == '"a1"'
+
+
+def test_part_from_another_url_is_discarded(server, target):
+    server.images['/a'] = (b'A' * 5000, '"a1"')
+    leave_part(target, b'B' * 1000, server.url('/b'), '"b1"')
+    download_image(server.url('/a'), target)
+    assert_downloaded(target, b'A' * 5000)
+    assert 'Range' not in server.requests[0]
+
+
+@pytest.mark.parametrize('etag', [None, 'W/"a1"'])
+def test_part_that_cannot_be_verified_is_discarded(server, target, etag):
+    server.images['/a'] = (b'A' * 5000, '"a1"')
+    leave_part(target, b'Z' * 1000, server.url('/a') if etag else None, etag)
+    download_image(server.url('/a'), target)
+    assert_downloaded(target, b'A' * 5000)
+    assert 'Range' not in server.requests[0]
+
+
+def test_changed_image_is_downloaded_whole(server, target):
+    # Same URL, new photo: If-Range does not match, so the server answers 200
+    server.images['/a'] = (b'N' * 5000, '"new"')
+    leave_part(target, b'O' * 1000, server.url('/a'), '"old"')
+    assert download_image(server.url('/a'), target) == {'etag': '"new"'}
+    assert_downloaded(target, b'N' * 5000)
+    assert server.requests[0]['If-Range'] == '"old"'
+
+
+def test_interrupted_download_resumes(server, target):
+    body = bytes(range(256)) * 1024
+    server.images['/a'] = (body, '"a1"')
+    server.cut_after = 150 * 1024
+    assert download_image(server.url('/a'), target) is None
+    # Whole chunks that arrived before the connection dropped are kept
+    part = target.parent / f"{target.name}.part"
+    kept = part.stat().st_size
+    assert 0 < kept <= 150 * 1024
+    with open(part_info_file(part), encoding='utf-8') as f:
+        assert json.load(f) == {'url': server.url('/a'), 'etag': '"a1"'}
+    assert download_image(server.url('/a'), target) == {'etag': '"a1"'}
+    assert_downloaded(target, body)
+    assert server.requests[1]['Range'] == f"bytes={kept}-"
+
+
+def test_get_ebird_code_never_leaves_a_truncated_image(server, target):
+    body = bytes(range(256)) * 1024
+    server.images['/a'] = (body, '"a1"')
+    server.cut_after = 150 * 1024
+    credit = {'photographer': 'A. Birder', 'location': 'Pune', 'license': 'CC BY', 'catalog_id': '1'}
+    assert not get_ebird_code.download_image(server.url('/a'), str(target), credit)
+    assert not target.exists()
+    assert get_ebird_code.download_image(server.url('/a'), str(target), credit)
+    assert_downloaded(target, body)
+    assert server.requests[1]['Range'].startswith('bytes=')
@@ -0,0 +1,97 @@
+import random
+from pathlib import Path
+
+import pytest
+
+import catalog
+from fuzzy_match import TrigramMatcher, normalize, trigrams
+
+LATEX_DIR = Path(__file__).parent.parent / 'latex'
+ENGLISH = [record['name'] for record in catalog.parse_source(LATEX_DIR / 'bird_guide.tex')]
+MARATHI = [record['name'] for record in catalog.parse_source(LATEX_DIR / 'bird_guide_marathi.tex')]
+
+
+def matcher_for(names):
+    return TrigramMatcher((name, number) for number, name in enumerate(names))
+
+
+@pytest.mark.parametrize('name', ["Tickell's Blue Flycatcher", 'Tickell\u2019s Blue Flycatcher',
+                                  'Tickells Blue-Flycatcher', 'TICKELL\u02bcS  blue flycatcher'])
+def test_apostrophes_and_punctuation_fold_away(name):
+    assert normalize(name) == 'tickells blue flycatcher'
+
+
+def test_apostrophe_variants_match_exactly():
+    matcher = matcher_for(ENGLISH)
+    expected = (1.0, "Tickell's Flowerpecker", ENGLISH.index("Tickell's Flowerpecker"))
+    assert matcher.search('Tickell\u2019s Flowerpecker') == [expected]
+
+
+def test_misspelt_possessive_finds_the_species():
+    matcher = matcher_for(ENGLISH)
+    score, name, _ = matcher.search('Tickels Blue Flycather')[0]
+    assert name == "Tickell's Blue Flycatcher"
+    assert 0.5 <= score < 1.0
+
+
+def test_latin_accents_fold_but_devanagari_signs_stay():
+    assert normalize('Cr\u00e9cerelle') == 'crecerelle'
+    # Vowel signs and the virama are combining marks, but part of the word
+    assert normalize('\u092a\u093e\u0902\u0922\u0931\u094d\u092f\u093e') == '\u092a\u093e\u0902\u0922\u0931\u094d\u092f\u093e'
+    assert normalize('\u0932\u093e\u0932-\u092e\u093e\u0928\u0947\u091a\u093e') == '\u0932\u093e\u0932 \u092e\u093e\u0928\u0947\u091a\u093e'
+
+
+def test_devanagari_names_are_indexed():
+    matcher = matcher_for(MARATHI)
+    assert len(matcher) == len(set(map(normalize, MARATHI)))
+    for name in MARATHI:
+        assert matcher.search(name)[0][1] == name
+
+
+def test_devanagari_near_miss():
+    matcher = matcher_for(MARATHI)
+    # रात्र ढोकरी with the vowel sign of the last syllable changed
+    score, name, _ = matcher.search('\u0930\u093e\u0924\u094d\u0930 \u0922\u094b\u0915\u0930\u093e')[0]
+    assert name == '\u0930\u093e\u0924\u094d\u0930 \u0922\u094b\u0915\u0930\u0940'
+    assert score < 1.0
+
+
+def test_scripts_do_not_match_each_other():
+    assert matcher_for(ENGLISH).search(MARATHI[0]) == []
+    assert matcher_for(MARATHI).search(ENGLISH[0]) == []
+    assert matcher_for(ENGLISH).search("'--'") == []
+
+
+def brute_force(names, query, threshold):
+    grams = trigrams(normalize(query))
+    scores = {}
+    for name in names:
+        other = trigrams(normalize(name))
+        score = 2 * len(grams & other) / (len(grams) + len(other))
+        if score >= threshold:
+            scores[name] = round(score, 3)
+    return scores
+
+
+def mutate(name, rng):
+    chars = list(name)
+    for _ in range(rng.randint(1, 3)):
+        position = rng.randrange(len(chars))
+        if rng.random() < 0.5:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice(name))
+    return ''.join(chars)
+
+
+@pytest.mark.parametrize('names', [ENGLISH, MARATHI], ids=['english', 'marathi'])
+def test_pruned_search_agrees_with_brute_force(names):
+    matcher = matcher_for(names)
+    rng = random.Random(14)
+    for _ in range(200):
+        query = mutate(rng.choice(names), rng)
+        if normalize(query) in matcher.exact:
+            continue
+        expected = brute_force(names, query, 0.5)
+        found = {name: score for score, name, _ in matcher.search(query, limit=len(names), threshold=0.5)}
+        assert found == expected, query
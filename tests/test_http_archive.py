@@ -0,0 +1,64 @@
+import hashlib
+import tracemalloc
+
+import pytest
+
+import http_client
+from http_archive import HttpArchive
+from response_cache import CacheMiss, ResponseCache
+
+
+@pytest.fixture
+def archive_mode():
+    yield
+    http_client.set_archive(None)
+    http_client.set_response_cache(ResponseCache())
+
+
+def record(path, urls):
+    with HttpArchive(path, 'record') as archive:
+        http_client.set_archive(archive)
+        for url in urls:
+            http_client.get(url).content
+    http_client.set_archive(None)
+
+
+def test_replay_streams_bodies_from_the_archive(server, tmp_path, archive_mode):
+    body = bytes(range(256)) * 4096
+    server.images['/big'] = (body, '"big"')
+    http_client.set_response_cache(None)
+    record(tmp_path / 'run.zip', [server.url('/big')])
+
+    with HttpArchive(tmp_path / 'run.zip') as archive:
+        http_client.set_archive(archive)
+        digest = hashlib.sha256()
+        tracemalloc.start()
+        with http_client.stream(server.url('/big')) as response:
+            for chunk in response.iter_content(64 * 1024):
+                digest.update(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert digest.digest() == hashlib.sha256(body).digest()
+        # Streamed in chunks, never held whole
+        assert peak < len(body) / 4
+        assert http_client.get(server.url('/big')).content == body
+    assert len(server.requests) == 1
+
+
+def test_recording_respects_cache_only(server, tmp_path, archive_mode):
+    server.images['/page'] = (b'page', '"p"')
+    http_client.set_response_cache(ResponseCache(tmp_path / 'cache', cache_only=True))
+    with HttpArchive(tmp_path / 'run.zip', 'record') as archive:
+        http_client.set_archive(archive)
+        with pytest.raises(CacheMiss):
+            http_client.get(server.url('/page'))
+    assert server.requests == []
+
+
+def test_recording_fills_the_response_cache(server, tmp_path, archive_mode, monkeypatch):
+    server.images['/page'] = (b'page', '"p"')
+    monkeypatch.setattr('response_cache.endpoint_ttl', lambda url: 3600)
+    cache = ResponseCache(tmp_path / 'cache')
+    http_client.set_response_cache(cache)
+    record(tmp_path / 'run.zip', [server.url('/page')])
+    assert cache.get(server.url('/page')).content == b'page'
@@ -0,0 +1,23 @@
+import re
+
+from image_derivatives import rewrite_html
+
+RECORD = {
+    'width': 960,
+    'height': 640,
+    'placeholder': 'data:image/jpeg;base64,AAAA',
+    'variants': [
+        {'format': 'webp', 'width': 480, 'file': 'black-kite-480.0123456789.webp'},
+        {'format': 'jpeg', 'width': 480, 'file': 'black-kite-480.0123456789.jpg'},
+        {'format': 'jpeg', 'width': 960, 'file': 'black-kite-960.0123456789.jpg'},
+    ],
+}
+
+
+def test_rewritten_picture_keeps_the_alt_text(tmp_path):
+    page = tmp_path / 'guide.html'
+    page.write_text('<p><img src="../images/black-kite.jpg" alt="Tickell&#x27;s &amp; kin" /></p>\n', encoding='utf-8')
+    rewrite_html(page, {'black-kite.jpg': RECORD})
+    html = page.read_text(encoding='utf-8')
+    assert '<picture>' in html
+    assert re.search(r'<img [^>]*alt="([^"]*)"', html).group(1) == 'Tickell&#x27;s &amp; kin'
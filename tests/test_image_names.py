@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import pytest
+
+import catalog
+from download_ebird_images import extract_bird_info, image_name_for
+
+GUIDE = Path(__file__).parent.parent / 'latex' / 'bird_guide.tex'
+
+
+def test_guide_birds_keep_their_image_names():
+    for bird, record in zip(extract_bird_info(GUIDE), catalog.parse_source(GUIDE)):
+        assert image_name_for(bird) == record['image']
+
+
+@pytest.mark.parametrize('common_name, expected', [
+    ("Tickell's Blue Flycatcher", 'tickells-blue-flycatcher.jpg'),
+    ('Tickell’s Flowerpecker', 'tickells-flowerpecker.jpg'),
+    ('Common/Jungle Myna', 'common-jungle-myna.jpg'),
+    ('Mallard x Northern Pintail (hybrid)', 'mallard-x-northern-pintail-hybrid.jpg'),
+    ('Rüppell\'s Vulture', 'ruppells-vulture.jpg'),
+    ('Accipiter sp.', 'accipiter-sp.jpg'),
+    ('../passwd', 'passwd.jpg'),
+])
+def test_species_list_names_are_safe_filenames(common_name, expected):
+    assert image_name_for({'common_name': common_name}) == expected
@@ -0,0 +1,70 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from latex_parser import BIRDENTRY_FIELDS, iter_birdentries, plain_text, read_group
+
+LATEX_DIR = Path(__file__).parent.parent / 'latex'
+IMAGES_DIR = Path(__file__).parent.parent / 'images'
+GUIDES = (LATEX_DIR / 'bird_guide.tex', LATEX_DIR / 'bird_guide_marathi.tex')
+
+# \birdentry calls that start a line outside a comment
+CALL = re.compile(r'^[ \t]*\\birdentry\s*\{', re.M)
+
+
+def render(entry):
+    return '\\birdentry' + ''.join(f"{{{entry[field]}}}" for field in BIRDENTRY_FIELDS)
+
+
+def fields(entry):
+    return {field: entry[field] for field in BIRDENTRY_FIELDS}
+
+
+@pytest.fixture(params=GUIDES, ids=lambda path: path.stem)
+def guide(request):
+    return request.param.read_text(encoding='utf-8')
+
+
+def test_finds_every_entry(guide):
+    entries = list(iter_birdentries(guide))
+    assert len(entries) == len(CALL.findall(guide)) > 0
+    for entry in entries:
+        assert guide.startswith('\\birdentry', entry['offset'])
+        assert guide[entry['end'] - 1] == '}'
+
+
+def test_entries_round_trip(guide):
+    entries = list(iter_birdentries(guide))
+    # Rewrite every call from its parsed arguments, back to front so offsets stay valid
+    rewritten = guide
+    for entry in reversed(entries):
+        rewritten = rewritten[:entry['offset']] + render(entry) + rewritten[entry['end']:]
+    assert [fields(entry) for entry in iter_birdentries(rewritten)] == [fields(entry) for entry in entries]
+    # Outside the calls, the document is untouched
+    outside = re.sub(r'\\birdentry(\{[^\n]*\})+', '', rewritten)
+    original = guide
+    for entry in reversed(entries):
+        original = original[:entry['offset']] + original[entry['end']:]
+    assert outside == original
+
+
+def test_entries_have_text_and_an_image(guide):
+    for entry in iter_birdentries(guide):
+        assert plain_text(entry['name']) and plain_text(entry['latin'])
+        assert (IMAGES_DIR / entry['image']).is_file(), entry['image']
+
+
+def test_guides_list_the_same_birds():
+    english, marathi = ([entry['image'] for entry in iter_birdentries(path.read_text(encoding='utf-8'))]
+                        for path in GUIDES)
+    assert english == marathi
+
+
+def test_read_group_honours_escapes_and_comments():
+    text = r'{a \{ b \} % not a brace }' + '\n' + r'c {d}} tail'
+    content, end = read_group(text, 0)
+    assert content == text[1:text.index('} tail')]
+    assert text[end:] == ' tail'
+    with pytest.raises(ValueError):
+        read_group('{unbalanced \\}', 0)
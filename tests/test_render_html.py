@@ -0,0 +1,17 @@
+import re
+
+import render_html
+
+ENTRY = {
+    'name': r"Tickell's \textit{Blue} Flycatcher \& kin",
+    'latin': r'\textit{Cyornis tickelliae}',
+    'size': '', 'status': '', 'field_characters': '', 'best_seen': '', 'habits': '', 'nesting': '',
+    'image': 'tickells-blue-flycatcher.jpg',
+}
+
+
+def test_alt_text_is_the_plain_name_escaped_once():
+    html = render_html.GuideRenderer('en').render_entry(dict(ENTRY))
+    alt = re.search(r'<img [^>]*alt="([^"]*)"', html).group(1)
+    assert '&lt;' not in alt and '&amp;amp;' not in alt
+    assert alt == 'Tickell&#x27;s Blue Flycatcher &amp; kin'
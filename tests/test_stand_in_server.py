@@ -0,0 +1,40 @@
+import csv
+import io
+
+import pytest
+import requests
+
+from stand_in_server import StandIn, StandInServer
+
+TAXONOMY_PATH = '/v2/ref/taxonomy/ebird'
+
+
+@pytest.fixture(scope='module')
+def stand_in():
+    with StandInServer(StandIn(species=200, image_bytes=1024)) as server:
+        yield server
+
+
+def fetch(server, query='', **kwargs):
+    return requests.get(server.base_url + TAXONOMY_PATH + query, timeout=10, **kwargs)
+
+
+def test_taxonomy_formats_agree(stand_in):
+    rows = list(csv.DictReader(io.StringIO(fetch(stand_in).text)))
+    species = fetch(stand_in, '?fmt=json').json()
+    assert len(rows) == len(species) == 200
+    for row, entry in zip(rows, species):
+        assert (row['SCIENTIFIC_NAME'], row['COMMON_NAME'], row['SPECIES_CODE'], row['CATEGORY']) == \
+            (entry['sciName'], entry['comName'], entry['speciesCode'], entry['category'])
+
+
+@pytest.mark.parametrize('query', ['', '?fmt=csv', '?fmt=json'])
+def test_taxonomy_revalidates(stand_in, query):
+    response = fetch(stand_in, query)
+    assert response.status_code == 200
+    again = fetch(stand_in, query, headers={'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_unknown_format_is_refused(stand_in):
+    assert fetch(stand_in, '?fmt=xml').status_code == 400
@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+import work_queue
+from work_queue import WorkQueue
+
+LEASE = 60
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(work_queue.time, 'time', clock.time)
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(tmp_path / 'jobs.db', lease_seconds=LEASE, max_attempts=2)
+    queue.add([('a', {'common_name': 'A'}), ('b', {'common_name': 'B'})])
+    return queue
+
+
+def test_lease_is_exclusive_until_it_expires(queue, clock):
+    assert queue.lease('w1') == ('a', {'common_name': 'A'})
+    assert queue.lease('w2')[0] == 'b'
+    assert queue.lease('w3') is None
+    clock.advance(LEASE + 1)
+    assert queue.lease('w3')[0] == 'a'
+
+
+def test_heartbeat_keeps_the_lease(queue, clock):
+    queue.lease('w1')
+    clock.advance(LEASE - 1)
+    assert queue.heartbeat('a', 'w1')
+    clock.advance(LEASE - 1)
+    queue.lease('w2')
+    assert queue.lease('w3') is None
+
+
+def test_reclaimed_job_belongs_to_the_new_worker(queue, clock):
+    queue.lease('w1')
+    clock.advance(LEASE + 1)
+    # Untried jobs come before abandoned ones
+    assert queue.lease('w2')[0] == 'b'
+    assert queue.lease('w2')[0] == 'a'
+    # The first worker wakes up too late: its heartbeat and outcome are refused
+    assert not queue.heartbeat('a', 'w1')
+    assert not queue.finish('a', 'w1', True, result={'image': 'stale'})
+    assert queue.finish('a', 'w2', True, result={'image': 'a.jpg'})
+    assert queue.counts()['done'] == 1
+    assert queue.results() == [{'image': 'a.jpg'}]
+
+
+def test_expired_leases_count_as_attempts(tmp_path, clock):
+    queue = WorkQueue(tmp_path / 'jobs.db', lease_seconds=LEASE, max_attempts=2)
+    queue.add([('a', {})])
+    for worker in ('w1', 'w2'):
+        assert queue.lease(worker)[0] == 'a'
+        clock.advance(LEASE + 1)
+    # Both attempts ran out; the sweep marks the job failed instead of handing it out again
+    assert queue.lease('w3') is None
+    assert queue.failures() == [('a', 'Lease expired')]
+    assert queue.retry_failed() == 1
+    assert queue.lease('w4')[0] == 'a'
+
+
+def drain(queue):
+    while True:
+        job = queue.lease('drainer')
+        if job is None:
+            return
+        queue.finish(job[0], 'drainer', True, result={'image': job[0]})
+
+
+def test_merge_waits_for_the_queue_to_drain(queue, clock):
+    queue.lease('w1')
+    assert not queue.claim_merge('w1')
+    drain(queue)
+    assert not queue.claim_merge('w2')  # 'a' is still leased by w1
+    queue.finish('a', 'w1', True, result={'image': 'a'})
+    assert queue.claim_merge('w2')
+
+
+def test_one_merger_per_drained_queue(queue, clock):
+    drain(queue)
+    assert queue.claim_merge('w1')
+    assert not queue.claim_merge('w2')
+    queue.finish_merge('w1')
+    assert not queue.claim_merge('w2')
+    # New work makes another merge due once it is done
+    clock.advance(1)
+    queue.add([('c', {'common_name': 'C'})])
+    assert not queue.claim_merge('w2')
+    drain(queue)
+    assert queue.claim_merge('w2')
+
+
+def test_abandoned_merge_is_taken_over(queue, clock):
+    drain(queue)
+    assert queue.claim_merge('w1')
+    clock.advance(LEASE - 1)
+    assert not queue.claim_merge('w2')
+    clock.advance(2)
+    assert queue.claim_merge('w2')
+
+
+def test_concurrent_claims_have_one_winner(tmp_path):
+    queue = WorkQueue(tmp_path / 'jobs.db')
+    queue.add([('a', {})])
+    drain(queue)
+    start = threading.Barrier(8)
+    wins = []
+
+    def claim(worker):
+        start.wait()
+        wins.append(queue.claim_merge(worker))
+
+    threads = [threading.Thread(target=claim, args=(f"w{n}",)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(wins) == [False] * 7 + [True]